@@ -0,0 +1,47 @@
+# Kayla Seidel
+# Big Homework- Min-Max Heap
+
+# "I hereby certify that this program is solely the result of my own work and
+# is in compliance with the Academic Integrity policy of the course syllabus
+# and the academic integrity policy of the CS department.”
+
+# A min-max heap is a "complete binary tree data structure which combines the
+# usefulness of both a min-heap and a max-heap, that is, it provides constant
+# time retrieval and logarithmic time removal of both the minimum and maximum
+# elements in it" (Wikipedia). This min-max heap includes methods to insert
+# into the heap, find the minimum node in the heap, find the maximum node,
+# remove the minimum node, remove the maximum node, and check whether the heap
+# is a fulfills the required properties to be considered a min-max heap.
+# The pytests that test whether the program works are in tests/, and
+# "python -m MinMaxHeap" runs a heap over a stream of lines (see __main__.py).
+#
+# Importing the package only imports the heap and the standard library
+# modules it needs. The queues (which need threading and asyncio), the
+# sharded and shared-memory heaps (which need multiprocessing), the
+# quantile tracker, the d-ary heap and the expiring heap are imported the
+# first time they are asked for, and NumPy only when a method that uses it
+# is called.
+
+from .heap import Node, Handle, OperationStats, HeapStats, MinMaxHeap
+
+# the module each of the names imported on first use is in
+lazyNames = {'MinMaxHeapQueue': 'queues', 'AsyncMinMaxHeapQueue': 'queues',
+             'serveShard': 'sharded', 'ShardedMinMaxHeap': 'sharded',
+             'QuantileTracker': 'quantile', 'DaryMinMaxHeap': 'dary',
+             'ExpiringMinMaxHeap': 'expiring',
+             'SharedMinMaxHeap': 'shared'}
+
+__all__ = ['Node', 'Handle', 'OperationStats', 'HeapStats', 'MinMaxHeap',
+           *lazyNames]
+
+# Imports the module that a name imported on first use is in, the first
+# time the name is asked for
+def __getattr__(name):
+    if name not in lazyNames:
+        raise AttributeError("module %r has no attribute %r" %
+                             (__name__, name))
+    import importlib
+    value = getattr(importlib.import_module('.' + lazyNames[name], __name__),
+                    name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,168 @@
+# Streams key<TAB>data lines through a MinMaxHeap:
+#     python -m MinMaxHeap [FILE] [--mode minmax|top|bottom] [-k 10]
+#                          [--window 1000] [--every N] [--keys float|int|str]
+# Lines are read from FILE, or from stdin if there is none, up to --chunk
+# bytes at a time, as soon as they arrive, and the output is flushed after
+# each read, so a slow stream is answered as it goes. A line with no tab has
+# an empty data field, and blank lines are skipped.
+#
+#   minmax  the minimum and maximum of the last --window lines, printed as
+#           minKey<TAB>minData<TAB>maxKey<TAB>maxData every --every lines
+#           (default every line). The window is a heap of handles and a
+#           queue of them in the order the lines came in, so the oldest line
+#           is removed by its handle as each new one arrives.
+#   top     the -k lines with the largest keys, largest first, printed as
+#           key<TAB>data lines at the end, or every --every lines followed
+#           by a blank line. Kept in a heap of size k with keep='largest', so
+#           a line that doesn't make the top k is rejected after a single
+#           comparison.
+#   bottom  the same for the -k smallest keys, smallest first.
+#
+# Memory is bounded by the window or k, plus one chunk of input.
+
+import argparse
+import collections
+import sys
+
+from .heap import MinMaxHeap
+
+# the function each --keys type parses a key with, and the typecode its keys
+# are stored in
+keyTypes = {'float': (float, 'd'), 'int': (int, 'q'), 'str': (str, None)}
+
+
+# Reads the buffered binary file f up to chunk bytes at a time, taking
+# whatever has arrived rather than waiting for a full chunk, and yields a
+# list of the complete lines in each read, decoded and without their line
+# endings. A line split between two reads is held back until the end of it
+# is read.
+def readLines(f, chunk):
+    rest = b''
+    while True:
+        block = f.read1(chunk)
+        if not block: break
+        end = block.rfind(b'\n')
+        if end == -1:
+            rest += block
+            continue
+        lines = (rest + block[:end]).decode().split('\n')
+        rest = block[end + 1:]
+        yield [line.rstrip('\r') for line in lines]
+    if rest: yield [rest.decode().rstrip('\r')]
+
+# Splits each line that isn't blank into its parsed key and its (key text,
+# data text), raising ValueError, with the line's number, if its key can't
+# be parsed. read is the number of lines before these ones.
+def parseLines(lines, parse, read):
+    keys, data = [], []
+    for i, line in enumerate(lines):
+        if not line: continue
+        text, tab, rest = line.partition('\t')
+        try:
+            keys.append(parse(text))
+        except ValueError:
+            raise ValueError("line %d: can't read key %r" %
+                             (read + i + 1, text)) from None
+        data.append((text, rest))
+    return keys, data
+
+
+# Prints the minimum and maximum of a window of the last window lines every
+# every lines, and after the last line if it hasn't been printed yet
+def rollingMinMax(batches, parse, typecode, window, every, out):
+    h = MinMaxHeap(window + 1, typecode=typecode)
+    handles = collections.deque()
+    count = read = 0
+    for lines in batches:
+        keys, data = parseLines(lines, parse, read)
+        read += len(lines)
+        printed = []
+        for i in range(len(keys)):
+            handles.append(h.insert(keys[i], data[i], True))
+            if len(handles) > window: h.remove(handles.popleft())
+            count += 1
+            if count % every == 0: printed.append(minMaxLine(h))
+        out.write(''.join(printed))
+        out.flush()
+    if count % every: out.write(minMaxLine(h))
+
+# Returns the line rollingMinMax() prints for the inputed heap
+def minMaxLine(h):
+    (minText, minData), (maxText, maxData) = h.findMinimum()[1], \
+                                             h.findMaximum()[1]
+    return '%s\t%s\t%s\t%s\n' % (minText, minData, maxText, maxData)
+
+# Prints the k lines with the largest (or, if largest is False, smallest)
+# keys every every lines, followed by a blank line, or at the end if every
+# is 0
+def topK(batches, parse, typecode, k, largest, every, out):
+    h = MinMaxHeap(k, typecode=typecode,
+                   keep='largest' if largest else 'smallest')
+    count = read = 0
+    for lines in batches:
+        keys, data = parseLines(lines, parse, read)
+        read += len(lines)
+        if not every:
+            h.insertMany(keys, data)
+            count += len(keys)
+            continue
+        for i in range(len(keys)):
+            h.insert(keys[i], data[i])
+            count += 1
+            if count % every == 0: out.write(topKLines(h, largest) + '\n')
+        out.flush()
+    if not every: out.write(topKLines(h, largest))
+    elif count % every: out.write(topKLines(h, largest) + '\n')
+
+# Returns the lines topK() prints for the inputed heap, without changing it
+def topKLines(h, largest):
+    nodes = h.nlargest(len(h)) if largest else h.nsmallest(len(h))
+    return ''.join('%s\t%s\n' % d for k, d in nodes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m MinMaxHeap",
+        description="Streams key<TAB>data lines through a min-max heap.")
+    parser.add_argument("file", nargs="?",
+                        help="file to read (default stdin)")
+    parser.add_argument("--mode", choices=("minmax", "top", "bottom"),
+                        default="minmax")
+    parser.add_argument("-k", type=int, default=10,
+                        help="lines kept by top and bottom (default 10)")
+    parser.add_argument("--window", type=int, default=1000,
+                        help="lines minmax looks back over (default 1000)")
+    parser.add_argument("--every", type=int,
+                        help="lines between outputs (default 1 for minmax, "
+                             "and only at the end for top and bottom)")
+    parser.add_argument("--keys", choices=tuple(keyTypes), default="float",
+                        help="type of the keys (default float)")
+    parser.add_argument("--chunk", type=int, default=1 << 20,
+                        help="bytes read at a time (default 1 MiB)")
+    args = parser.parse_args(argv)
+    if args.k < 1: parser.error("-k must be at least 1")
+    if args.window < 1: parser.error("--window must be at least 1")
+    if args.chunk < 1: parser.error("--chunk must be at least 1")
+    if args.every is None: args.every = 1 if args.mode == "minmax" else 0
+    if args.every < 0 or (args.every == 0 and args.mode == "minmax"):
+        parser.error("--every must be at least 1, or 0 (only at the end) "
+                     "for top and bottom")
+
+    parse, typecode = keyTypes[args.keys]
+    f = open(args.file, 'rb') if args.file else sys.stdin.buffer
+    try:
+        batches = readLines(f, args.chunk)
+        if args.mode == "minmax":
+            rollingMinMax(batches, parse, typecode, args.window, args.every,
+                          sys.stdout)
+        else:
+            topK(batches, parse, typecode, args.k, args.mode == "top",
+                 args.every, sys.stdout)
+    except ValueError as e:
+        parser.exit(1, "%s: %s\n" % (parser.prog, e))
+    finally:
+        if args.file: f.close()
+
+
+if __name__ == "__main__":
+    main()
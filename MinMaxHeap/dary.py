@@ -0,0 +1,253 @@
+# A min-max heap with a configurable number of children per node.
+
+import array
+import bisect
+
+# DaryMinMaxHeap class
+# A min-max heap in which each node has up to arity children rather than
+# two, so the tree is only log(n, arity) levels deep: a 4-ary heap has half
+# as many levels as a binary one. Levels still alternate between min and
+# max levels, with the root on a min level, and a node's children are at
+# arity*i + 1 to arity*i + arity, so that its children, and all of its
+# grandchildren, each sit together in one run of the keys array.
+# insert() and the trickle up it does only compare a node with its parent
+# and its grandparents, so they gain the most from the shallower tree.
+# Removals trade it for scanning more nodes at each level, arity children
+# and arity**2 grandchildren; each run is scanned with min() over a slice of
+# the keys array, rather than a node at a time.
+# Has the same core methods as MinMaxHeap (insert(), findMinimum(),
+# findMaximum(), removeMin(), removeMax(), fromIterable() and heapify()),
+# with keys and data in parallel arrays, and the keys packed into a typed
+# array if there is a typecode.
+class DaryMinMaxHeap(object):
+    # DaryMinMaxHeap constructor
+    # size is the heap's capacity, which it doubles whenever it is full if
+    # grow is True. typecode is 'q', 'd' or None, as for MinMaxHeap, and a
+    # key that doesn't fit it moves the keys back into a plain list.
+    def __init__(self, size, arity=4, grow=False, typecode=None):
+        if arity < 2: raise ValueError("arity must be at least 2")
+        if typecode not in (None, 'q', 'd'):
+            raise ValueError("typecode must be 'q', 'd' or None")
+        self.__arity = arity
+        # the index each level starts at, far enough down for any heap
+        self.__levelStarts = [0]
+        while self.__levelStarts[-1] < 1 << 64:
+            self.__levelStarts.append(arity*self.__levelStarts[-1] + 1)
+        self.__typecode = typecode
+        self.__keyType = {None: None, 'q': int, 'd': float}[typecode]
+        self.__keys = self.__newKeys(size)
+        self.__data = [None] * size
+        self.__nElems = 0
+        self.__grow = grow
+
+    # Returns an array of n empty key slots, typed if the heap has a typecode
+    def __newKeys(self, n):
+        if self.__typecode is None: return [None] * n
+        return array.array(self.__typecode, [0]) * n
+
+    # Moves the keys from a typed array into a plain list
+    def __untype(self):
+        self.__keys = list(self.__keys)
+        self.__typecode = self.__keyType = None
+
+    # Stores key k and data d in slot i, moving the keys into a plain list if
+    # k doesn't fit in their typed array
+    def __store(self, i, k, d):
+        if self.__keyType is not None and type(k) is not self.__keyType:
+            self.__untype()
+        try:
+            self.__keys[i] = k
+        except OverflowError:       # an int too big for 64 bits
+            self.__untype()
+            self.__keys[i] = k
+        self.__data[i] = d
+
+    # Returns the number of nodes in the heap
+    def __len__(self): return self.__nElems
+
+    # Returns the number of children each node can have
+    def arity(self): return self.__arity
+
+    # Returns the typecode of the array the keys are packed into, or None
+    def typecode(self): return self.__typecode
+
+    # Returns the number of nodes the heap can hold without growing
+    def capacity(self): return len(self.__data)
+
+    # Builds a new heap from either an iterable of (key, data) pairs or
+    # parallel sequences of keys and data, in linear time using heapify().
+    # The heap's size defaults to the number of items given, and raises
+    # ValueError if it is too small to hold them. Any other options are
+    # passed on to the constructor.
+    @classmethod
+    def fromIterable(cls, items, data=None, size=None, **options):
+        if data is None:
+            pairs = list(items)
+            keys, data = [p[0] for p in pairs], [p[1] for p in pairs]
+        else:
+            keys, data = list(items), list(data)
+            if len(keys) != len(data):
+                raise ValueError("got %d keys but %d data items" %
+                                 (len(keys), len(data)))
+        if size is None: size = len(keys)
+        if len(keys) > size:
+            raise ValueError("%d items do not fit in a heap of size %d" %
+                             (len(keys), size))
+        h = cls(size, **options)
+        for i in range(len(keys)): h.__store(i, keys[i], data[i])
+        h.__nElems = len(keys)
+        h.heapify()
+        return h
+
+    # Rearranges the nodes so that they fulfill the min-max heap properties,
+    # trickling down every node that has children from the bottom up
+    def heapify(self):
+        for cur in range((self.__nElems - 2) // self.__arity, -1, -1):
+            self.__trickleDown(cur, self.__minLevel(cur))
+
+    # Returns True if the inputed index is on a min level, finding its level
+    # among the indexes the levels start at
+    def __minLevel(self, cur):
+        return bisect.bisect_right(self.__levelStarts, cur) % 2 == 1
+
+    # Inserts a node with key k and data d at the end of the heap and
+    # trickles it up. Returns False if the heap is full and can't grow, and
+    # True otherwise.
+    def insert(self, k, d):
+        n = self.__nElems
+        if n == len(self.__data):
+            if not self.__grow: return False
+            extra = max(n, 1)
+            self.__keys.extend(self.__newKeys(extra))
+            self.__data.extend([None] * extra)
+        self.__store(n, k, d)
+        self.__nElems = n + 1
+        self.__trickleUp(n)
+        return True
+
+    # Moves the node at cur up to where it belongs: past its parent if they
+    # are out of order, and then through its grandparents on min levels (if
+    # it is smaller than them) or on max levels (if it is larger), moving a
+    # hole up rather than swapping, as MinMaxHeap's trickleUp() does.
+    def __trickleUp(self, cur):
+        if cur == 0: return
+        keys, data, arity = self.__keys, self.__data, self.__arity
+        k, d = keys[cur], data[cur]
+
+        parent = (cur - 1) // arity
+        if self.__minLevel(cur):
+            onMax = k > keys[parent]
+            moveParent = onMax
+        else:
+            onMax = not k < keys[parent]
+            moveParent = not onMax
+        if moveParent:
+            keys[cur], data[cur] = keys[parent], data[parent]
+            cur = parent
+
+        # cur has a grandparent if it is below level 1, past index arity
+        while cur > arity:
+            grandparent = ((cur - 1) // arity - 1) // arity
+            g = keys[grandparent]
+            if not (k > g if onMax else k < g): break
+            keys[cur], data[cur] = g, data[grandparent]
+            cur = grandparent
+        keys[cur], data[cur] = k, d
+
+    # Returns a tuple of the minimum node's key and data, or None if the heap
+    # is empty
+    def findMinimum(self):
+        if self.__nElems == 0: return None
+        return self.__keys[0], self.__data[0]
+
+    # Returns a tuple of the maximum node's key and data, or None if the heap
+    # is empty
+    def findMaximum(self):
+        if self.__nElems == 0: return None
+        i = self.__maxIndex()
+        return self.__keys[i], self.__data[i]
+
+    # Returns the index of the maximum node of a heap that isn't empty: the
+    # root if it has no children, and otherwise its largest child
+    def __maxIndex(self):
+        n = self.__nElems
+        if n == 1: return 0
+        end = min(self.__arity + 1, n)
+        return self.__keys.index(max(self.__keys[1:end]), 1, end)
+
+    # Removes the minimum node and returns a tuple of its key and data, or
+    # None if the heap is empty
+    def removeMin(self):
+        if self.__nElems == 0: return None
+        return self.__removeAt(0)
+
+    # Removes the maximum node and returns a tuple of its key and data, or
+    # None if the heap is empty
+    def removeMax(self):
+        if self.__nElems == 0: return None
+        return self.__removeAt(self.__maxIndex())
+
+    # Removes the node at index i, which is the root or one of its children,
+    # by moving the last node into its place and trickling that down
+    def __removeAt(self, i):
+        keys, data = self.__keys, self.__data
+        removed = keys[i], data[i]
+        n = self.__nElems = self.__nElems - 1
+        keys[i], data[i] = keys[n], data[n]
+        keys[n], data[n] = (None if self.__typecode is None else 0), None
+        if i < n: self.__trickleDown(i, i == 0)
+        return removed
+
+    # Moves the node at cur down to where it belongs, on a min level if
+    # onMin is True and a max level otherwise. At each step, finds the
+    # smallest (or largest) of its children and of its grandchildren, each
+    # with one min() (or max()) over their run of the keys array. If that
+    # beats the node, it moves up into cur and the node carries on down from
+    # its index; if it was a grandchild, the node is first swapped with the
+    # grandchild's parent if the two are out of order, as in MinMaxHeap's
+    # trickleDownMin() and trickleDownMax().
+    def __trickleDown(self, cur, onMin):
+        keys, data, n, arity = self.__keys, self.__data, self.__nElems, \
+                               self.__arity
+        best = min if onMin else max
+        k, d = keys[cur], data[cur]
+        while True:
+            child = arity*cur + 1
+            if child >= n: break
+
+            end = min(child + arity, n)
+            mk = best(keys[child:end])
+            m = keys.index(mk, child, end)
+            grandchild = arity*child + 1
+            if grandchild < n:
+                end = min(grandchild + arity*arity, n)
+                gk = best(keys[grandchild:end])
+                if (gk < mk) if onMin else (gk > mk):
+                    mk, m = gk, keys.index(gk, grandchild, end)
+
+            if not ((mk < k) if onMin else (mk > k)): break
+            keys[cur], data[cur] = mk, data[m]
+            cur = m
+            if m < grandchild: break
+
+            parent = (m - 1) // arity
+            if (k > keys[parent]) if onMin else (k < keys[parent]):
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+        keys[cur], data[cur] = k, d
+
+    # Returns True if every node on a min level is no larger than its
+    # descendants and every node on a max level no smaller, checking each
+    # node against its parent and grandparent
+    def isMinMaxHeap(self):
+        keys, arity = self.__keys, self.__arity
+        for i in range(1, self.__nElems):
+            parent = (i - 1) // arity
+            onMin = self.__minLevel(i)
+            if (keys[i] > keys[parent]) if onMin else (keys[i] < keys[parent]):
+                return False
+            if parent > 0:
+                grandparent = (parent - 1) // arity
+                g = keys[grandparent]
+                if (keys[i] < g) if onMin else (keys[i] > g): return False
+        return True
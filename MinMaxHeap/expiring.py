@@ -0,0 +1,151 @@
+# A min-max heap whose nodes expire after a time to live.
+
+import collections
+import time
+
+from .heap import MinMaxHeap
+
+# ExpiringMinMaxHeap class
+# A min-max heap in which every node carries an expiry time, for the
+# smallest and largest keys seen in the last ttl seconds of a stream. Nodes
+# are kept in a MinMaxHeap, and their expiry times, each with the node's
+# handle, in the order the nodes will expire: in a deque while the times
+# come in order, as they do when every node lives for the same ttl, and in
+# a second MinMaxHeap, with the time as the key, for any that come earlier
+# than the last one in the deque.
+# Expired nodes are evicted lazily: findMinimum(), findMaximum() and the
+# removals first evict every node whose expiry time has passed, by taking
+# them off the front of the deque or the minimum of the expiry heap and
+# marking them deleted in the heap of nodes (see MinMaxHeap.markDeleted()).
+# Marking is O(1), and the tombstones are compacted away in batches, so a
+# node in the deque costs O(1) to expire, amortized, and one in the expiry
+# heap O(log n). Each insert() also evicts up to sweep expired nodes, so that
+# a stream that is seldom read still holds only about the nodes in its
+# window: a sweep of 2 evicts nodes faster than they are inserted, whatever
+# the rate.
+# A node removed before it expires is marked deleted in the expiry heap, or
+# left in the deque to be skipped when its time comes, so the deque holds at
+# most the nodes inserted in the last ttl.
+# clock is called for the current time, time.monotonic() by default; any
+# function returning numbers on the same scale as ttl will do, so a test can
+# step time by hand.
+class ExpiringMinMaxHeap(object):
+    # ExpiringMinMaxHeap constructor
+    # ttl is how long a node lives by default, in the clock's units (seconds
+    # for the default clock), or None if every insert() gives its own.
+    # typecode is passed on to the heap of nodes, and compactRatio to both
+    # heaps.
+    def __init__(self, ttl=None, clock=time.monotonic, sweep=2,
+                 typecode=None, compactRatio=0.5):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be more than 0")
+        if sweep < 0: raise ValueError("sweep can't be negative")
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__sweep = sweep
+        self.__heap = MinMaxHeap(16, grow=True, shrink=True,
+                                 typecode=typecode, compactRatio=compactRatio)
+        self.__inOrder = collections.deque()  # (expiry, handle) in order
+        self.__expiries = MinMaxHeap(16, grow=True, shrink=True,
+                                     typecode='d', compactRatio=compactRatio)
+
+    # Returns the number of nodes that haven't expired, evicting the rest
+    def __len__(self):
+        self.expire()
+        return len(self.__heap)
+
+    # Inserts a node with key k and data d that expires ttl from now, or the
+    # heap's ttl if none is given, or at the time expiry if that is given
+    # instead. A node whose expiry time has already come is not inserted.
+    # Returns True if the node was inserted and False if not.
+    # Raises ValueError if there is neither a ttl nor an expiry time.
+    def insert(self, k, d, ttl=None, expiry=None):
+        now = self.__clock()
+        if expiry is None:
+            if ttl is None: ttl = self.__ttl
+            if ttl is None:
+                raise ValueError("the heap has no ttl, so insert() needs one")
+            expiry = now + ttl
+        if self.__sweep: self.__expire(now, self.__sweep)
+        if expiry <= now: return False
+
+        node = [d, None]  # the data and, if it has one, its expiry's handle
+        handle = self.__heap.insert(k, node, True)
+        inOrder = self.__inOrder
+        if not inOrder or expiry >= inOrder[-1][0]:
+            inOrder.append((expiry, handle))
+        else:
+            node[1] = self.__expiries.insert(expiry, handle, True)
+        return True
+
+    # Evicts every node whose expiry time has passed, and returns how many
+    # there were
+    def expire(self): return self.__expire(self.__clock(), None)
+
+    # Evicts up to limit nodes (or all of them, if limit is None) whose
+    # expiry time is no later than now, and returns how many it evicted.
+    # Nodes in the deque that have been removed already are skipped.
+    def __expire(self, now, limit):
+        inOrder, expiries, evicted = self.__inOrder, self.__expiries, 0
+        while evicted != limit:
+            if inOrder and inOrder[0][0] <= now:
+                handle = inOrder.popleft()[1]
+                if handle.index < 0: continue
+            else:
+                soonest = expiries.findMinimum()
+                if soonest is None or soonest[0] > now: break
+                expiries.removeMin()
+                handle = soonest[1]
+            self.__heap.markDeleted(handle)
+            evicted += 1
+        return evicted
+
+    # Returns a tuple of the key and data of the node that hasn't expired
+    # with the smallest key, or None if there is none
+    def findMinimum(self):
+        self.expire()
+        return self.__unwrap(self.__heap.findMinimum())
+
+    # Returns a tuple of the key and data of the node that hasn't expired
+    # with the largest key, or None if there is none
+    def findMaximum(self):
+        self.expire()
+        return self.__unwrap(self.__heap.findMaximum())
+
+    # Removes the node that hasn't expired with the smallest key and returns
+    # a tuple of its key and data, or None if there is none
+    def removeMin(self):
+        self.expire()
+        return self.__unwrap(self.__heap.removeMin(), True)
+
+    # Removes the node that hasn't expired with the largest key and returns
+    # a tuple of its key and data, or None if there is none
+    def removeMax(self):
+        self.expire()
+        return self.__unwrap(self.__heap.removeMax(), True)
+
+    # Turns the key and node returned by the heap of nodes into the key and
+    # its data. If the node has been removed and its expiry is in the expiry
+    # heap, the expiry is marked deleted.
+    def __unwrap(self, found, removed=False):
+        if found is None: return None
+        k, node = found
+        if removed and node[1] is not None:
+            self.__expiries.markDeleted(node[1])
+        return k, node[0]
+
+    # Returns the expiry time of the next node to expire, which may have
+    # passed already if it hasn't been evicted yet, or None if there is none
+    def nextExpiry(self):
+        inOrder = self.__inOrder
+        while inOrder and inOrder[0][1].index < 0: inOrder.popleft()
+        times = [self.__expiries.findMinimum(), inOrder and inOrder[0]]
+        return min((t[0] for t in times if t), default=None)
+
+    # Returns the number of slots the heap of nodes and the deque and heap of
+    # their expiry times hold between them, counting those of nodes that
+    # have expired (or been removed) but not been evicted, tombstones and
+    # spare capacity
+    def footprint(self):
+        return self.__heap.capacity() + len(self.__inOrder) + \
+               self.__expiries.capacity()
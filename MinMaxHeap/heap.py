@@ -0,0 +1,1871 @@
+# Kayla Seidel
+# Big Homework- Min-Max Heap
+
+# "I hereby certify that this program is solely the result of my own work and
+# is in compliance with the Academic Integrity policy of the course syllabus
+# and the academic integrity policy of the CS department.”
+
+# The min-max heap itself: MinMaxHeap, the Node and Handle classes it hands
+# out, and the stats it keeps while they are enabled.
+
+import array
+import heapq
+import itertools
+import pickle
+import struct
+import sys
+import time
+
+numpy = None        # NumPy is optional: only fromArray(), the vectorized
+                    # paths and popMinMany/popMaxMany(..., arrays=True) need
+                    # it, so it is imported by importNumpy() the first time
+                    # one of them is used, rather than with the heap
+
+# Imports NumPy the first time it is called, and returns it, or None if it
+# isn't installed
+def importNumpy():
+    global numpy
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False   # don't try again
+    return numpy or None
+
+# Node class
+# The heap stores keys and data in separate arrays, so Nodes are only made
+# when getItem() is called.
+class Node(object):
+    __slots__ = ('key', 'data')
+
+    def __init__(self, k, d): # Node constructor
+        self.key  = k         # key of node
+        self.data = d         # data of node
+
+# Handle class
+# A handle to one node in a MinMaxHeap, returned by insert(k, d, True) and
+# passed to updateKey() or remove(). The heap keeps index set to the node's
+# current index in its arrays, or -1 once the node has been removed.
+class Handle(object):
+    __slots__ = ('index',)
+
+    def __init__(self, index): # Handle constructor
+        self.index = index
+
+# OperationStats class
+# Counts for one kind of operation on a MinMaxHeap with stats enabled: how
+# many there have been, the key comparisons and node moves their trickles
+# made and the levels they trickled through in all, the most levels any one
+# of them went through, and a histogram of how long they took, in which
+# latency[i] counts the operations that took from 2**(i-1) up to 2**i
+# nanoseconds.
+class OperationStats(object):
+    __slots__ = ('count', 'comparisons', 'swaps', 'depth', 'maxDepth',
+                 'latency')
+
+    def __init__(self): # OperationStats constructor
+        self.count = self.comparisons = self.swaps = 0
+        self.depth = self.maxDepth = 0
+        self.latency = [0] * 64
+
+    # Adds one operation, which took ns nanoseconds, to the counts
+    def add(self, ns, comparisons, swaps, depth):
+        self.count += 1
+        self.comparisons += comparisons
+        self.swaps += swaps
+        self.depth += depth
+        if depth > self.maxDepth: self.maxDepth = depth
+        self.latency[min(ns.bit_length(), 63)] += 1
+
+    # Returns the counts as a dictionary, with the latency histogram as a
+    # dictionary from each bucket's upper bound in nanoseconds to its count,
+    # leaving out empty buckets
+    def asDict(self):
+        return {'count': self.count, 'comparisons': self.comparisons,
+                'swaps': self.swaps, 'depth': self.depth,
+                'maxDepth': self.maxDepth,
+                'latency': {1 << i: c for i, c in enumerate(self.latency) if c}}
+
+# HeapStats class
+# What a MinMaxHeap with stats enabled has counted: the key comparisons and
+# node moves made by all of its trickles, and the levels they trickled
+# through, whatever operation they were part of, along with the
+# OperationStats of each operation that is timed. callback, if not None,
+# is called after every timed operation with its name, its latency in
+# nanoseconds, and its comparisons, moves and levels.
+class HeapStats(object):
+    __slots__ = ('comparisons', 'swaps', 'depth', 'operations', 'callback')
+
+    def __init__(self, names, callback): # HeapStats constructor
+        self.comparisons = self.swaps = self.depth = 0
+        self.operations = {name: OperationStats() for name in names}
+        self.callback = callback
+
+# MinMaxHeap class
+class MinMaxHeap(object):
+    # Min-Max Heap class constructor
+    # By default the heap has a fixed capacity of size nodes, and insert()
+    # fails once it is full. If grow is True, the heap doubles its capacity
+    # whenever it fills up instead. If shrink is True, the heap halves its
+    # capacity whenever removals leave it less than a quarter full, but never
+    # below the size it was created with.
+    # Keys and data are stored in two parallel arrays, so that no object is
+    # made for each node. If typecode is 'q' (64-bit ints) or 'd' (floats),
+    # keys are packed into an array.array, which takes 8 bytes per key rather
+    # than a pointer to a separate Python object. Inserting a key that doesn't
+    # fit the typecode moves the keys back into a plain list.
+    # If keep is 'largest' or 'smallest', a full heap keeps only the size
+    # largest or smallest keys inserted: a new node that beats the minimum
+    # (or maximum) evicts it, and one that doesn't is rejected in O(1) time.
+    # key, reverse and fifo are for the item methods, push(), popMin() and
+    # the rest, which take and return whole items rather than key/data
+    # pairs: see push().
+    # compactRatio is the share of the heap's nodes that may be tombstones,
+    # left by markDeleted(), before they are all compacted away at once.
+    def __init__(self, size, grow=False, shrink=False, typecode=None,
+                 keep=None, key=None, reverse=False, fifo=False,
+                 compactRatio=0.5):
+        if typecode not in self.__keyTypes:
+            raise ValueError("typecode must be 'q', 'd' or None")
+        if keep not in (None, 'largest', 'smallest'):
+            raise ValueError("keep must be 'largest', 'smallest' or None")
+        if keep is not None and grow:
+            raise ValueError("a heap that grows is never full enough to evict")
+        if fifo and typecode is not None:
+            raise ValueError("a fifo heap's keys are (key, sequence) pairs, "
+                             "which can't be typed")
+        if not 0 < compactRatio <= 1:
+            raise ValueError("compactRatio must be more than 0 and at most 1")
+        self.__typecode = typecode
+        self.__keyType = self.__keyTypes[typecode] # type the keys must have
+        self.__emptyKey = 0 if typecode else None  # key in unused slots
+
+        self.__keys = self.__newKeys(size) # heap's keys are stored in an array
+        self.__data = [None] * size        # with their data in a parallel one
+        self.__nElems = 0           # no items are initially in the array
+        self.__grow = grow          # whether a full heap doubles in capacity
+        self.__shrink = shrink      # whether a drained heap halves in capacity
+        self.__minSize = size       # capacity is never shrunk below this
+        self.__handles = None       # each node's Handle, once any are made
+        self.__keep = keep          # which keys a full heap keeps, if any
+        self.__touched = None       # nodes changed since the last incremental
+                                    # check, once there has been one
+        self.__stats = None         # HeapStats, while stats are enabled
+        self.__key = key            # turns an item into its key, if not None
+        self.__reverse = reverse    # whether popMin() takes the largest key
+        self.__fifo = fifo          # whether keys are (key, sequence) pairs
+        self.__pushed = 0           # sequence number of the last item pushed
+        self.__deleted = 0          # nodes marked deleted but still stored
+        self.__compactRatio = compactRatio # share of tombstones to compact at
+    
+    # the type of key that each typecode can store without changing it
+    __keyTypes = {None: None, 'q': int, 'd': float}
+
+    # Returns an array of n empty key slots, typed if the heap has a typecode
+    def __newKeys(self, n):
+        if self.__typecode is None: return [None] * n
+        return array.array(self.__typecode, [0]) * n
+
+    # Returns the typecode that can store all of the inputed keys, or None if
+    # they are not all ints or all floats.
+    @staticmethod
+    def __typecodeOf(keys):
+        if keys and all(type(k) is int for k in keys): return 'q'
+        if keys and all(type(k) is float for k in keys): return 'd'
+        return None
+
+    # Moves the keys from a typed array into a plain list, which can store
+    # keys of any type.
+    def __untype(self):
+        self.__keys = list(self.__keys)
+        self.__typecode = self.__keyType = self.__emptyKey = None
+
+    # Stores key k and data d in slot i of the heap's arrays, moving the keys
+    # into a plain list if k doesn't fit in their typed array.
+    def __store(self, i, k, d):
+        if self.__keyType is not None and type(k) is not self.__keyType:
+            self.__untype()
+        try:
+            self.__keys[i] = k
+        except OverflowError:       # an int too big for 64 bits
+            self.__untype()
+            self.__keys[i] = k
+        self.__data[i] = d
+
+    # Stores the inputed lists of keys and data in the slots after the last
+    # node, moving the keys into a plain list if they don't all fit in their
+    # typed array.
+    # If the heap tracks handles, the nodes are given the inputed handles, or
+    # new ones if there are none.
+    def __storeMany(self, keys, data, handles=None):
+        start, end = self.__nElems, self.__nElems + len(keys)
+        if self.__typecode is not None:
+            if keys and self.__typecodeOf(keys) != self.__typecode:
+                self.__untype()
+            else:
+                try:
+                    keys = array.array(self.__typecode, keys)
+                except OverflowError:       # an int too big for 64 bits
+                    self.__untype()
+        self.__keys[start:end] = keys
+        self.__data[start:end] = data
+        self.__nElems = end
+
+        if self.__handles is not None:
+            if handles is None: handles = [Handle(0) for k in keys]
+            self.__handles[start:end] = handles
+            for i in range(start, end): handles[i - start].index = i
+
+    # Moves the key/data in the slot just past the last node into slot i,
+    # and garbage collects the slot it came from
+    def __moveLast(self, i):
+        keys, data, last = self.__keys, self.__data, self.__nElems
+        keys[i], data[i] = keys[last], data[last]
+        keys[last], data[last] = self.__emptyKey, None
+
+    # get index of the parent of the current node
+    def __parentIndex(self, cur): return (cur-1) // 2
+    
+    # If the heap is not full, inserts a node with inputed key and data at the
+    # end of the heap and then calls trickleUp() on the newly inserted node to
+    # rebalance and maintain the min-max heap properties.
+    # Returns True if the insert was successful and False if the heap is
+    # full and therefore the insert was unsuccessful.
+    # If handle is True, instead returns a Handle to the new node that can be
+    # passed to updateKey() or remove() later, or None if the heap is full.
+    # If the heap is full and keeps the largest or smallest keys, see evict().
+    # Supports duplicate key/data pairs being added to the heap.
+    def insert(self, k, d, handle=False):
+        # Fail if the heap is full and can't grow, otherwise double its size.
+        # A heap that can't grow first clears out any tombstones to make room.
+        if self.__nElems == len(self.__data):
+            if self.__deleted and not self.__grow: self.compact()
+            elif self.__keep is not None: return self.__evict(k, d, handle)
+            elif not self.__grow: return None if handle else False
+            else: self.__resize(max(2 * len(self.__data), 1))
+        
+        # Place new key/data at end of heap & trickle it up
+        n = self.__nElems
+        self.__store(n, k, d)
+        if self.__handles is not None or handle:
+            if self.__handles is None: self.__trackHandles()
+            h = self.__handles[n] = Handle(n)
+        self.__trickleUp(n)
+        self.__nElems += 1  # add one to # of elements in heap
+        if handle: return h # return the new node's handle if asked for it
+        return True         # return True if successfully added node to heap
+
+    # Called by insert() when the heap is full and keeps only the largest
+    # keys: if k is larger than the minimum key, the new node takes the
+    # minimum node's place and trickles down from there. If the heap keeps
+    # the smallest keys instead, a k smaller than the maximum key takes the
+    # maximum node's place the same way. Otherwise, the new node is rejected
+    # after a single comparison.
+    # Returns the evicted node's key/data tuple, or False if the new node was
+    # rejected. If handle is True, returns the new node's Handle (or None)
+    # instead, and the evicted node's handle is marked as removed.
+    def __evict(self, k, d, handle):
+        if self.__nElems == 0: return None if handle else False
+        if self.__keep == 'largest':
+            i = 0
+            if not k > self.__keys[0]: return None if handle else False
+        else:
+            i = self.__maxIndex()
+            if not k < self.__keys[i]: return None if handle else False
+
+        if not handle: return self.__replaceAt(i, k, d)
+        if self.__handles is None: self.__trackHandles()
+        h = Handle(i)
+        self.__replaceAt(i, k, d, h)
+        return h
+
+    # Replaces the node at index i with a new node with key k and data d,
+    # and trickles the new node up or down to wherever it belongs. If the
+    # heap tracks handles, the new node gets handle h (or a new one), and the
+    # old node's handle is marked as removed.
+    # Returns a tuple of the replaced node's key and data.
+    def __replaceAt(self, i, k, d, h=None):
+        replaced = self.__keys[i], self.__data[i]
+        self.__store(i, k, d)
+        if self.__handles is not None:
+            self.__handles[i].index = -1
+            self.__handles[i] = h or Handle(i)
+        self.__restore(i)
+        return replaced
+
+    # Inserts a node with key k and data d, then removes the minimum node and
+    # returns its key/data tuple, like heapq.heappushpop(). If k is no larger
+    # than the minimum key, the new node would be removed straight away, so
+    # (k, d) is returned without touching the heap. Otherwise the new node
+    # takes the minimum node's place and trickles down once, instead of
+    # trickling up on insert and the last node trickling down on removal.
+    def pushPopMin(self, k, d):
+        if self.__deleted: self.__purgeMin()
+        if self.__nElems == 0 or not self.__keys[0] < k: return k, d
+        return self.__replaceAt(0, k, d)
+
+    # Inserts a node with key k and data d, then removes the maximum node and
+    # returns its key/data tuple, the same way as pushPopMin().
+    def pushPopMax(self, k, d):
+        if self.__deleted: self.__purgeMax()
+        if self.__nElems == 0: return k, d
+        maxInd = self.__maxIndex()
+        if not self.__keys[maxInd] > k: return k, d
+        return self.__replaceAt(maxInd, k, d)
+
+    # Removes the minimum node, then inserts a node with key k and data d,
+    # like heapq.heapreplace(), with a single trickle down from the root.
+    # Unlike pushPopMin(), the removed key may be larger than k.
+    # Returns the removed node's key/data tuple, or None if the heap was
+    # empty (in which case the new node is simply inserted).
+    def replaceMin(self, k, d):
+        if self.__deleted: self.__purgeMin()
+        if self.__nElems == 0:
+            self.insert(k, d)
+            return None
+        return self.__replaceAt(0, k, d)
+
+    # Removes the maximum node, then inserts a node with key k and data d,
+    # the same way as replaceMin().
+    def replaceMax(self, k, d):
+        if self.__deleted: self.__purgeMax()
+        if self.__nElems == 0:
+            self.insert(k, d)
+            return None
+        return self.__replaceAt(self.__maxIndex(), k, d)
+
+    # Inserts a whole item, with key(item) as its key if the heap was made
+    # with a key function and the item itself otherwise, and returns what
+    # insert() does. The key is worked out once, here, and stored in the
+    # keys array with the item as its data, so the heap's comparisons only
+    # ever look at the stored keys: the key function is never called again
+    # for the item, and items are never compared with each other.
+    # If the heap was made with fifo=True, each key is stored as a pair of
+    # the key and the item's sequence number, so that items with equal keys
+    # come out of popMin() in the order they were pushed (and out of
+    # popMax() newest first, as from the end of a stable sort). Each push
+    # then costs one call of the key function and one 2-tuple, and
+    # comparing two stored keys compares the keys first and only looks at
+    # the sequence numbers when they are equal.
+    # If the heap was made with reverse=True, the item methods work from the
+    # other end of the heap, so popMin() and peekMin() give the item with
+    # the largest key, as sorted(..., reverse=True) would put first; with
+    # fifo=True, equal keys still come out of popMin() oldest first. The
+    # key/data methods (insert(), removeMin() and the rest, and keep) are
+    # not reversed.
+    def push(self, item, handle=False):
+        k = item if self.__key is None else self.__key(item)
+        if self.__fifo:
+            self.__pushed += 1
+            k = k, -self.__pushed if self.__reverse else self.__pushed
+        return self.insert(k, item, handle)
+
+    # Pushes every item of an iterable the same way as push(), through
+    # insertMany(), and returns the number inserted
+    def pushMany(self, items):
+        items = list(items)
+        return self.insertMany([self.__keyOf(item) for item in items], items)
+
+    # Removes the item with the smallest key (the largest, if the heap was
+    # made with reverse=True) and returns it, or None if the heap is empty
+    def popMin(self):
+        node = self.removeMax() if self.__reverse else self.removeMin()
+        return None if node is None else node[1]
+
+    # Removes the item with the largest key (the smallest, if the heap was
+    # made with reverse=True) and returns it, or None if the heap is empty
+    def popMax(self):
+        node = self.removeMin() if self.__reverse else self.removeMax()
+        return None if node is None else node[1]
+
+    # Returns the item popMin() would remove, without removing it
+    def peekMin(self):
+        node = self.findMaximum() if self.__reverse else self.findMinimum()
+        return None if node is None else node[1]
+
+    # Returns the item popMax() would remove, without removing it
+    def peekMax(self):
+        node = self.findMinimum() if self.__reverse else self.findMaximum()
+        return None if node is None else node[1]
+
+    # Returns the key push() stores for the inputed item (which works it out
+    # in line, to save a call), giving it the next sequence number if the
+    # heap is fifo. A reversed heap numbers its items downwards, so that
+    # popMin(), which takes from the maximum end, finds the oldest of equal
+    # keys there.
+    def __keyOf(self, item):
+        k = item if self.__key is None else self.__key(item)
+        if not self.__fifo: return k
+        self.__pushed += 1
+        return k, -self.__pushed if self.__reverse else self.__pushed
+
+    # Builds a new heap from either an iterable of (key, data) pairs, or from
+    # parallel sequences of keys and data, in linear time using heapify().
+    # The heap's size defaults to the number of items given; if a size is
+    # given that is too small to hold every item, raises ValueError unless
+    # the heap can grow, or keeps only its largest or smallest keys (in which
+    # case only those are kept). Any other options are passed on to the
+    # constructor.
+    # Unless a typecode is given, keys are stored in a typed array if they
+    # are all ints or all floats.
+    @classmethod
+    def fromIterable(cls, items, data=None, size=None, **options):
+        keys, data = cls.__columnsOf(items, data)
+        if size is None: size = len(keys)
+        if 'typecode' not in options:
+            options['typecode'] = cls.__typecodeOf(keys)
+
+        h = cls(size, **options)
+        if len(keys) > size:
+            if not h.__grow and h.__keep is None:
+                raise ValueError("%d items do not fit in a heap of size %d" %
+                                 (len(keys), size))
+            h.reserve(len(keys))
+
+        h.__storeMany(keys, data) # place the keys/data in any order...
+        h.heapify()               # ...and then restore the heap property
+        h.__dropExtra(size)
+        return h
+
+    # Called when building a heap of inputed size that may have been given
+    # more nodes than that. A heap that keeps the largest or smallest keys
+    # drops the rest and goes back to its size.
+    def __dropExtra(self, size):
+        if self.__keep is not None and self.__nElems > size:
+            if self.__keep == 'largest': self.popMinMany(self.__nElems - size)
+            else:                        self.popMaxMany(self.__nElems - size)
+            self.__resize(size)
+
+    # Builds a new heap from a NumPy array of keys, and optionally an array
+    # (or sequence) of data with one item per key, the same way as
+    # fromIterable() but with the heapify done by NumPy a whole level at a
+    # time. Float keys are stored as 'd' and integer keys as 'q'; keys of any
+    # other dtype, or a typecode option that doesn't match them, go through
+    # fromIterable() instead. Nodes have None as their data if none is given.
+    # Raises ImportError if NumPy isn't installed.
+    @classmethod
+    def fromArray(cls, keys, data=None, size=None, **options):
+        if importNumpy() is None:
+            raise ImportError("fromArray() needs NumPy")
+        keys = numpy.asarray(keys).ravel()
+        n = len(keys)
+        if data is not None and len(data) != n:
+            raise ValueError("got %d keys but %d data items" % (n, len(data)))
+
+        typecode = cls.__typecodeOfDtype(keys.dtype)
+        if typecode is None or options.get('typecode', typecode) != typecode:
+            if data is None: data = [None] * n
+            return cls.fromIterable(keys.tolist(), list(data), size, **options)
+        options['typecode'] = typecode
+        if size is None: size = n
+
+        h = cls(size, **options)
+        if n > size:
+            if not h.__grow and h.__keep is None:
+                raise ValueError("%d items do not fit in a heap of size %d" %
+                                 (n, size))
+            h.reserve(n)
+
+        keys = keys.astype(typecode)  # a copy, in the array's own key type
+        order = numpy.arange(n)       # where each node came from
+        cls.__heapifyVector(keys, order)
+        h.__keys[:n] = array.array(typecode, keys.tobytes())
+        if data is not None: h.__data[:n] = cls.__gather(data, order)
+        h.__nElems = n
+        h.__dropExtra(size)
+        return h
+
+    # Returns the typecode that can store keys of the inputed NumPy dtype
+    # without changing them, or None if there isn't one
+    @staticmethod
+    def __typecodeOfDtype(dtype):
+        if dtype.kind == 'f' and dtype.itemsize <= 8: return 'd'
+        if dtype.kind in 'ib' or (dtype.kind == 'u' and dtype.itemsize < 8):
+            return 'q'
+        return None
+
+    # Returns a list of the items of data (a sequence or NumPy array) at each
+    # index in the inputed array of indexes, as Python objects
+    @staticmethod
+    def __gather(data, indexes):
+        if isinstance(data, numpy.ndarray): return data[indexes].tolist()
+        return list(map(data.__getitem__, indexes.tolist()))
+
+    # Turns an iterable of (key, data) pairs, or parallel sequences of keys
+    # and data, into a list of keys and a parallel list of data.
+    @staticmethod
+    def __columnsOf(items, data=None):
+        if data is None:
+            pairs = list(items)
+            return [p[0] for p in pairs], [p[1] for p in pairs]
+        if len(items) != len(data):
+            raise ValueError("got %d keys but %d data items" %
+                             (len(items), len(data)))
+        return list(items), list(data)
+
+    # Rearranges the nodes currently in the heap so that they fulfill the
+    # min-max heap properties. Works from the bottom of the heap up, trickling
+    # down every node that has children, so that each subtree is a min-max
+    # heap by the time its root is trickled down. This takes O(n) time, unlike
+    # the O(n log n) of inserting the nodes one at a time.
+    def heapify(self):
+        # the last node with a child is the parent of the last node
+        for cur in range(self.__parentIndex(self.__nElems - 1), -1, -1):
+            if self.__minLevel(cur): self.__trickleDownMin(cur)
+            else:                    self.__trickleDownMax(cur)
+
+    # Heapifies a NumPy array of keys in place, moving the matching entries
+    # of order along with them. Nodes on the same level have subtrees that
+    # don't overlap, so, working from the bottom up as heapify() does, each
+    # level's nodes are trickled down together, one step of all of them at a
+    # time.
+    @classmethod
+    def __heapifyVector(cls, keys, order):
+        last = (len(keys) - 2) >> 1      # the last node with a child
+        for level in range((last + 1).bit_length() - 1, -1, -1):
+            first = (1 << level) - 1
+            cur = numpy.arange(first, min(2*first, last) + 1)
+            cls.__trickleDownVector(keys, order, cur, level % 2 == 0)
+
+    # Trickles down every node in the inputed array of indexes at once, all
+    # on min levels if onMin is True and all on max levels otherwise, the
+    # same way as trickleDownMin() and trickleDownMax(). Each step compares
+    # every node with the best of its (up to six) children and grandchildren.
+    @staticmethod
+    def __trickleDownVector(keys, order, cur, onMin):
+        n = len(keys)
+        pick = numpy.argmin if onMin else numpy.argmax
+        beats = numpy.less if onMin else numpy.greater
+        while cur.size:
+            child = 2*cur + 1
+            cur, child = cur[child < n], child[child < n]
+            # children and grandchildren, with any past the end of the heap
+            # replaced by the first child so that they can never be picked
+            near = numpy.stack([child, child + 1, 2*child + 1, 2*child + 2,
+                                2*child + 3, 2*child + 4], axis=1)
+            near = numpy.where(near < n, near, child[:, None])
+            best = near[numpy.arange(len(near)), pick(keys[near], axis=1)]
+
+            moves = beats(keys[best], keys[cur])
+            cur, best = cur[moves], best[moves]
+            keys[cur], keys[best] = keys[best], keys[cur]
+            order[cur], order[best] = order[best], order[cur]
+
+            # a node moved down to a grandchild may be out of order with the
+            # grandchild's parent, and carries on down from there
+            grand = best > 2*cur + 2
+            best = best[grand]
+            parent = (best - 1) >> 1
+            flip = beats(keys[parent], keys[best])
+            swapA, swapB = best[flip], parent[flip]
+            keys[swapA], keys[swapB] = keys[swapB], keys[swapA]
+            order[swapA], order[swapB] = order[swapB], order[swapA]
+            cur = best
+
+    # Returns the index of the first node in a NumPy array of keys that is
+    # out of order with its parent or grandparent, or -1 if they are all in
+    # order. Compares a whole level with the level or two above it at once.
+    @staticmethod
+    def __firstViolationVector(keys):
+        n, level, first = len(keys), 1, 1
+        while first < n:
+            cur = numpy.arange(first, min(2*first + 1, n))
+            parent, grand = (cur - 1) >> 1, (cur - 3) >> 2
+            if level % 2 == 0:  # a min level, below a max level
+                bad = keys[cur] > keys[parent]
+                if level > 1: bad |= keys[cur] < keys[grand]
+            else:
+                bad = keys[cur] < keys[parent]
+                if level > 1: bad |= keys[cur] > keys[grand]
+            if bad.any(): return int(cur[bad.argmax()])
+            level, first = level + 1, 2*first + 1
+        return -1
+
+    # Inserts an iterable of (key, data) pairs, or parallel sequences of keys
+    # and data, into the heap. A batch at least as large as the heap is
+    # appended to the end of the heap and heapified all at once; a smaller
+    # batch is inserted one node at a time.
+    # A heap that can grow makes room for the whole batch up front; otherwise
+    # inserts as many of the items as fit. A full heap that keeps only its
+    # largest or smallest keys offers the rest to insert() one at a time.
+    # Returns the number inserted.
+    def insertMany(self, items, data=None):
+        keys, data = self.__columnsOf(items, data)
+        if self.__deleted and \
+           len(keys) > len(self.__data) - self.__nElems: self.compact()
+        if self.__grow: self.reserve(self.__nElems + len(keys))
+        room = len(self.__data) - self.__nElems
+        if self.__keep is not None and len(keys) > room:
+            accepted = self.insertMany(keys[:room], data[:room])
+            for i in range(room, len(keys)):
+                if self.insert(keys[i], data[i]): accepted += 1
+            return accepted
+        keys, data = keys[:room], data[:room]  # drop what won't fit
+
+        # small batch: trickle each new node up on its own
+        if len(keys) < self.__nElems:
+            for i in range(len(keys)): self.insert(keys[i], data[i])
+            return len(keys)
+
+        # large batch: place all new nodes at the end, then rebuild
+        self.__storeMany(keys, data)
+        self.heapify()
+        return len(keys)
+
+    # Merges the nodes of another MinMaxHeap into this one. The other heap's
+    # arrays are appended to the end of this heap's in one slice each; if the
+    # other heap is no larger than this one, each new node is then trickled
+    # up on its own, and otherwise the whole heap is heapified in O(n + m).
+    # If consume is True, the other heap is left empty and its handles now
+    # belong to this heap. When it is the larger of the two, this heap takes
+    # over its arrays as they are and merges its own nodes into them instead,
+    # so the larger heap's nodes are never copied.
+    # A heap that keeps its largest or smallest keys merges the other heap's
+    # nodes through insertMany(), and the other heap's handles are dropped.
+    # Raises ValueError if the nodes don't all fit in a heap that can't grow.
+    # Returns the number of nodes merged.
+    def merge(self, other, consume=False):
+        if other is self: raise ValueError("can't merge a heap with itself")
+        self.compact()
+        other.compact()
+        n, m = self.__nElems, other.__nElems
+        if self.__keep is not None:
+            merged = self.insertMany(other.__keys[:m], other.__data[:m])
+            if consume: other.__clear()
+            return merged
+        if not self.__grow and n + m > len(self.__data):
+            raise ValueError("%d nodes do not fit in a heap of size %d" %
+                             (n + m, len(self.__data)))
+
+        capacity, merged = len(self.__data), m
+        if consume and m > n and self.__typecode == other.__typecode:
+            # both heaps must track handles, or neither, to trade arrays
+            if (self.__handles is None) != (other.__handles is None):
+                if self.__handles is None: self.__trackHandles()
+                else:                      other.__trackHandles()
+            self.__keys, other.__keys = other.__keys, self.__keys
+            self.__data, other.__data = other.__data, self.__data
+            self.__handles, other.__handles = other.__handles, self.__handles
+            self.__nElems, other.__nElems = m, n
+            n, m = m, n
+            # a fixed heap keeps the capacity it was made with
+            if not other.__grow: other.__resize(len(self.__data))
+            if not self.__grow: self.__resize(capacity)
+            self.__touchAll()
+
+        keys, data = other.__keys[:m], other.__data[:m]
+        handles = None
+        if consume and other.__handles is not None:
+            if self.__handles is None: self.__trackHandles()
+            handles = other.__handles[:m]
+        self.reserve(max(n + m, capacity))
+        if consume: other.__clear(handles is None)
+
+        self.__storeMany(keys, data, handles)
+        # as in insertMany(), heapifying only pays off for the larger heap
+        if m <= n:
+            for i in range(n, n + m): self.__trickleUp(i)
+        else:
+            self.heapify()
+        return merged
+
+    # Builds a new heap from the nodes of all of the inputed heaps at once,
+    # appending their arrays together and heapifying the result in linear
+    # time. The new heap's size defaults to the total number of nodes, and
+    # any other options are passed on to the constructor as in fromIterable().
+    # If consume is True, the inputed heaps are left empty and their handles
+    # are marked as removed.
+    @classmethod
+    def meldAll(cls, heaps, consume=False, **options):
+        heaps = list(heaps)
+        keys, data = [], []
+        for h in heaps:
+            h.compact()
+            keys += h.__keys[:h.__nElems]
+            data += h.__data[:h.__nElems]
+        melded = cls.fromIterable(keys, data, **options)
+        if consume:
+            for h in heaps: h.__clear()
+        return melded
+
+    # Removes every node from the heap, leaving its capacity as it is. Unless
+    # dropHandles is False (because they have been handed on to another heap),
+    # the nodes' handles are marked as removed.
+    def __clear(self, dropHandles=True):
+        n = self.__nElems
+        self.__keys[:n] = self.__newKeys(n)
+        self.__data[:n] = [None] * n
+        if self.__handles is not None:
+            if dropHandles:
+                for h in self.__handles[:n]: h.index = -1
+            self.__handles[:n] = [None] * n
+        self.__nElems = self.__deleted = 0
+
+    # Returns the number of nodes in the heap, not counting tombstones
+    def __len__(self): return self.__nElems - self.__deleted
+
+    # Returns the typecode of the array the keys are packed into, or None if
+    # they are stored in a plain list
+    def typecode(self): return self.__typecode
+
+    # Returns the number of nodes the heap can hold without growing
+    def capacity(self): return len(self.__data)
+
+    # Makes sure the heap can hold at least n nodes without growing again.
+    # Works on fixed-capacity heaps as well, to raise their limit by hand.
+    def reserve(self, n):
+        if n > len(self.__data): self.__resize(n)
+
+    # Frees any unused capacity, so the heap holds exactly its current nodes.
+    # A heap that can grow will grow again on the next insert.
+    def shrinkToFit(self):
+        self.__resize(self.__nElems)
+
+    # Changes the capacity of the heap's array to newSize, which must be at
+    # least the number of nodes in the heap.
+    def __resize(self, newSize):
+        extra = newSize - len(self.__data)
+        if extra > 0:
+            self.__keys.extend(self.__newKeys(extra))
+            self.__data.extend([None] * extra)
+            if self.__handles is not None: self.__handles.extend([None] * extra)
+        else:
+            del self.__keys[newSize:]
+            del self.__data[newSize:]
+            if self.__handles is not None: del self.__handles[newSize:]
+
+    # Called after a removal. If the heap shrinks and is now less than a
+    # quarter full, halves its capacity (but not below the size it was made
+    # with). Growing at full and shrinking at a quarter full leaves room for
+    # the heap to go back and forth without resizing every time.
+    def __shrinkIfDrained(self):
+        if self.__nElems < len(self.__data) // 4:
+            newSize = max(len(self.__data) // 2, self.__minSize)
+            if newSize < len(self.__data): self.__resize(newSize)
+
+    # Starts keeping a handle for every node in the heap, in a third array
+    # parallel to the keys and data. Heaps that never hand out handles skip
+    # all of this: the tracked versions of the trickle methods, which keep
+    # each handle's index up to date as its node moves, are only put in
+    # place of the plain ones on the heap once it starts tracking handles.
+    def __trackHandles(self):
+        self.__handles = [Handle(i) for i in range(self.__nElems)]
+        self.__handles += [None] * (len(self.__data) - self.__nElems)
+        self.__moveLast = self.__moveLastTracked
+        self.__installTrickles()
+
+    # Returns the index of the node with the inputed handle, or raises
+    # ValueError if the handle's node has been removed or is in another heap.
+    def __indexOf(self, handle):
+        i = handle.index
+        if self.__handles is None or not 0 <= i < self.__nElems or \
+           self.__handles[i] is not handle:
+            raise ValueError("handle is not for a node in this heap")
+        return i
+
+    # Changes the key of the node with the inputed handle to newKey, then
+    # trickles it up or down to wherever the new key belongs, in O(log n).
+    # Raises ValueError if the node is no longer in the heap.
+    def updateKey(self, handle, newKey):
+        i = self.__indexOf(handle)
+        self.__store(i, newKey, self.__data[i])
+        self.__restore(i)
+
+    # Removes the node with the inputed handle from anywhere in the heap, by
+    # moving the last node into its place and trickling that up or down, in
+    # O(log n). Returns a tuple of the removed node's key and data.
+    # Raises ValueError if the node is no longer in the heap.
+    def remove(self, handle):
+        i = self.__indexOf(handle)
+        removed = self.__keys[i], self.__data[i]
+        self.__nElems -= 1
+        self.__moveLast(i)
+        if i < self.__nElems: self.__restore(i)
+        if self.__shrink: self.__shrinkIfDrained()
+        return removed
+
+    # Marks the node with the inputed handle as deleted in O(1), without
+    # moving anything: the node stays in the heap as a tombstone, with its
+    # data dropped, and the handle is marked as removed. A tombstone is only
+    # taken out when it reaches the minimum or maximum end, where the methods
+    # that read or remove that end skip past it, or when tombstones come to
+    # more than compactRatio of the heap's nodes and compact() takes them all
+    # out in one linear pass. Cheaper than remove() when many nodes are
+    # cancelled and most of them would never reach either end.
+    # Raises ValueError if the node is no longer in the heap.
+    def markDeleted(self, handle):
+        i = self.__indexOf(handle)
+        self.__data[i] = self.__tombstone
+        self.__handles[i] = Handle(i)   # keeps the slot's handle moving with it
+        handle.index = -1
+        self.__deleted += 1
+        if self.__deleted > self.__compactRatio * self.__nElems: self.compact()
+
+    # the data of a node marked deleted
+    __tombstone = object()
+
+    # Removes every tombstone from the heap at once, by gathering the live
+    # nodes to the front of the arrays and heapifying them, in O(n). Handles
+    # of live nodes stay valid. Returns the number of tombstones removed.
+    def compact(self):
+        deleted = self.__deleted
+        if deleted == 0: return 0
+        n, tombstone = self.__nElems, self.__tombstone
+        live = [d is not tombstone for d in self.__data[:n]]
+        keys = list(itertools.compress(self.__keys[:n], live))
+        data = list(itertools.compress(self.__data[:n], live))
+        handles = list(itertools.compress(self.__handles[:n], live))
+
+        self.__keys[:n] = self.__newKeys(n)  # garbage collect the old slots
+        self.__data[:n] = [None] * n
+        self.__handles[:n] = [None] * n
+        self.__nElems = self.__deleted = 0
+        self.__storeMany(keys, data, handles)
+        self.heapify()
+        self.__touchAll()
+        if self.__shrink: self.__shrinkIfDrained()
+        return deleted
+
+    # Returns the share of the nodes stored in the heap that are tombstones
+    def tombstoneRatio(self):
+        return self.__deleted / self.__nElems if self.__nElems else 0.0
+
+    # Takes tombstones off the minimum end of the heap until the minimum node
+    # is a live one, or the heap is empty
+    def __purgeMin(self):
+        data, tombstone = self.__data, self.__tombstone
+        while self.__deleted and data[0] is tombstone:
+            self.__nElems -= 1
+            self.__deleted -= 1
+            self.__moveLast(0)
+            self.__trickleDownMin(0)
+        if self.__shrink: self.__shrinkIfDrained()
+
+    # Takes tombstones off the maximum end of the heap the same way
+    def __purgeMax(self):
+        data, tombstone = self.__data, self.__tombstone
+        while self.__deleted:
+            maxInd = self.__maxIndex()
+            if data[maxInd] is not tombstone: break
+            self.__nElems -= 1
+            self.__deleted -= 1
+            self.__moveLast(maxInd)
+            self.__trickleDownMax(maxInd)
+        if self.__shrink: self.__shrinkIfDrained()
+
+    # Restores the heap property around index i after the key there has
+    # changed. First trickles the node up; if it is out of order with its
+    # parent, the parent moves down into i. Either way, whatever node is now
+    # at i is then trickled down into its subtree. (If the node moved up
+    # through its grandparents instead, the grandparent that moved into i
+    # already fits there, so trickling it down does nothing.)
+    def __restore(self, i):
+        self.__trickleUp(i)
+        if self.__minLevel(i): self.__trickleDownMin(i)
+        else:                  self.__trickleDownMax(i)
+
+    # The same as moveLast(), but also moves the last node's handle, and
+    # marks the removed node's handle as no longer in the heap
+    def __moveLastTracked(self, i):
+        keys, data, last = self.__keys, self.__data, self.__nElems
+        handles = self.__handles
+        removed = handles[i]
+        keys[i], data[i], handles[i] = keys[last], data[last], handles[last]
+        keys[last], data[last], handles[last] = self.__emptyKey, None, None
+        if i != last: handles[i].index = i
+        removed.index = -1
+
+    # Puts the versions of the trickle methods that the heap needs on the
+    # heap itself, in place of its class's: the counting versions while
+    # stats are enabled (which move handles as well), or else the tracked
+    # versions if it tracks handles, wrapped to record touches if it has had
+    # an incremental check. A heap that needs none of them goes back to its
+    # class's.
+    def __installTrickles(self):
+        for name in ('_MinMaxHeap__trickleUp', '_MinMaxHeap__trickleDownMin',
+                     '_MinMaxHeap__trickleDownMax'):
+            self.__dropOverride(name)
+        touched = self.__touched
+        if self.__handles is None and touched is None and \
+           self.__stats is None: return
+
+        if self.__stats is not None:
+            up = self.__trickleUpCounted
+            downMin = lambda cur: self.__trickleDownCounted(cur, True)
+            downMax = lambda cur: self.__trickleDownCounted(cur, False)
+        elif self.__handles is not None:
+            up = self.__trickleUpTracked
+            downMin = self.__trickleDownMinTracked
+            downMax = self.__trickleDownMaxTracked
+        else:
+            up = self.__trickleUp
+            downMin, downMax = self.__trickleDownMin, self.__trickleDownMax
+        if touched is not None:
+            def trickleUp(cur, up=up):
+                touched.add(cur)
+                return up(cur)
+            def trickleDownMin(cur, down=downMin):
+                cur = down(cur)
+                touched.add(cur)
+                return cur
+            def trickleDownMax(cur, down=downMax):
+                cur = down(cur)
+                touched.add(cur)
+                return cur
+            up, downMin, downMax = trickleUp, trickleDownMin, trickleDownMax
+        self.__trickleUp = up
+        self.__trickleDownMin = downMin
+        self.__trickleDownMax = downMax
+
+    # Removes the heap's own version of the inputed method, if it has one,
+    # so that its class's is used again
+    def __dropOverride(self, name):
+        try:
+            delattr(self, name)
+        except AttributeError:
+            pass
+
+    # the operations timed while stats are enabled
+    __timedOperations = ('insert', 'removeMin', 'removeMax')
+
+    # Starts counting stats: the key comparisons and node moves made by
+    # every trickle and the levels it goes through, and, for each insert(),
+    # removeMin() and removeMax(), the same counts along with a histogram of
+    # how long it took. If callback is not None, it is called after each of
+    # those operations with its name, its latency in nanoseconds, and its
+    # comparisons, moves and levels. Restarts the counts if stats were
+    # already enabled.
+    # While stats are enabled, timed versions of those operations and
+    # trickle methods that count as they go are put on the heap itself, as
+    # the tracked trickles are for handles. Disabling stats takes them off
+    # again, so a heap that has never had stats enabled, or has had them
+    # disabled again, runs exactly the methods it would without them.
+    def enableStats(self, callback=None):
+        if self.__stats is not None: self.disableStats()
+        self.__stats = HeapStats(self.__timedOperations, callback)
+        self.__installTimed()
+        self.__installTrickles()
+
+    # Stops counting stats and puts the heap's plain methods back
+    def disableStats(self):
+        if self.__stats is None: return
+        self.__stats = None
+        self.__installTimed()
+        self.__installTrickles()
+
+    # Returns a dictionary of the stats counted since they were enabled, or
+    # None if they aren't: the comparisons, swaps (node moves) and depth
+    # (levels) of all trickles, the number of tombstones in the heap and
+    # their share of its nodes (see markDeleted()), and a dictionary of the
+    # counts of each timed operation (see OperationStats.asDict()).
+    def stats(self):
+        stats = self.__stats
+        if stats is None: return None
+        return {'comparisons': stats.comparisons, 'swaps': stats.swaps,
+                'depth': stats.depth, 'tombstones': self.__deleted,
+                'tombstoneRatio': self.tombstoneRatio(),
+                'operations': {name: op.asDict()
+                               for name, op in stats.operations.items()}}
+
+    # Puts timed versions of the timed operations on the heap itself while
+    # stats are enabled, and otherwise takes them off so that its class's
+    # are used again
+    def __installTimed(self):
+        for name in self.__timedOperations:
+            self.__dropOverride(name)
+            if self.__stats is not None:
+                setattr(self, name, self.__timed(name, getattr(self, name)))
+
+    # Returns a function that calls op, the heap's bound method of the
+    # inputed name, and adds how long it took and what its trickles counted
+    # to the heap's stats for the operation
+    def __timed(self, name, op):
+        clock = time.perf_counter_ns
+        stats = self.__stats
+        def timed(*args, **kwargs):
+            comparisons, swaps, depth = stats.comparisons, stats.swaps, \
+                                        stats.depth
+            start = clock()
+            result = op(*args, **kwargs)
+            ns = clock() - start
+            comparisons = stats.comparisons - comparisons
+            swaps, depth = stats.swaps - swaps, stats.depth - depth
+            stats.operations[name].add(ns, comparisons, swaps, depth)
+            if stats.callback is not None:
+                stats.callback(name, ns, comparisons, swaps, depth)
+            return result
+        timed.__name__ = name
+        return timed
+
+    # The same as trickleUp() (or trickleUpTracked(), if the heap tracks
+    # handles), but comparing keys through a counter and counting each node
+    # moved and the levels gone up. Only used while stats are enabled.
+    def __trickleUpCounted(self, cur):
+        keys, data, handles = self.__keys, self.__data, self.__handles
+        stats, start = self.__stats, cur
+        k, d = keys[cur], data[cur]
+        h = None if handles is None else handles[cur]
+
+        def beats(a, b, onMax):
+            stats.comparisons += 1
+            return a > b if onMax else a < b
+        def moveInto(hole, i):   # moves the node at i into the hole
+            keys[hole], data[hole] = keys[i], data[i]
+            if handles is not None:
+                handles[hole] = handles[i]
+                handles[hole].index = hole
+            stats.swaps += 1
+
+        if cur > 0:
+            parent = (cur - 1) >> 1
+            if self.__minLevel(cur):
+                onMax = beats(k, keys[parent], True)
+                moveParent = onMax
+            else:
+                onMax = not beats(k, keys[parent], False)
+                moveParent = not onMax
+            if moveParent:
+                moveInto(cur, parent)
+                cur = parent
+            while cur > 2:
+                grandparent = (cur - 3) >> 2
+                if not beats(k, keys[grandparent], onMax): break
+                moveInto(cur, grandparent)
+                cur = grandparent
+
+        keys[cur], data[cur] = k, d
+        if handles is not None:
+            handles[cur] = h
+            h.index = cur
+        stats.depth += (start + 1).bit_length() - (cur + 1).bit_length()
+        return cur
+
+    # The same as trickleDownMin() if onMin is True, or trickleDownMax() if
+    # not (or their tracked versions, if the heap tracks handles), but
+    # counting as trickleUpCounted() does. Only used while stats are enabled.
+    def __trickleDownCounted(self, cur, onMin):
+        keys, data, handles = self.__keys, self.__data, self.__handles
+        n, stats, start = self.__nElems, self.__stats, cur
+        if cur >= n: return cur
+        k, d = keys[cur], data[cur]
+        h = None if handles is None else handles[cur]
+
+        def beats(a, b):
+            stats.comparisons += 1
+            return a < b if onMin else a > b
+
+        while True:
+            child = 2*cur + 1
+            if child >= n: break
+            grandchild = 2*child + 1
+            m = child
+            for i in (child + 1, grandchild, grandchild + 1, grandchild + 2,
+                      grandchild + 3):
+                if i >= n: break
+                if beats(keys[i], keys[m]): m = i
+            if not beats(keys[m], k): break
+
+            keys[cur], data[cur] = keys[m], data[m]
+            if handles is not None:
+                handles[cur] = handles[m]
+                handles[cur].index = cur
+            stats.swaps += 1
+            cur = m
+            if m < grandchild: break
+
+            parent = (m - 1) >> 1
+            if beats(keys[parent], k):
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+                if handles is not None:
+                    handles[parent], h = h, handles[parent]
+                    handles[parent].index = parent
+                stats.swaps += 1
+
+        keys[cur], data[cur] = k, d
+        if handles is not None:
+            handles[cur] = h
+            h.index = cur
+        stats.depth += (cur + 1).bit_length() - (start + 1).bit_length()
+        return cur
+
+    # Determines if the node at the index inputed is on a min-level.
+    # The node at index cur is on level (cur+1).bit_length() - 1, so it is on
+    # an even level (min) when (cur+1).bit_length() is odd, and on an odd
+    # level (max) when it is even. Unlike math.log2(), this is exact integer
+    # math that never goes through a float.
+    # Returns True if it is on a min-level and False if it is on a max-level.
+    def __minLevel(self, cur):
+        return (cur + 1).bit_length() & 1 == 1
+
+    # Checks what level the inputed index's node is on and compares its key
+    # with the key of it's parent. If they are out of order, the parent moves
+    # down into cur and the node continues up from the parent's index.
+    # Then trickles the node up through its grandparents on min levels (if
+    # it is smaller than them) or on max levels (if it is larger).
+    # Rather than swapping the node with each ancestor, the node is held
+    # aside while the ancestors it passes move down into the hole it leaves,
+    # and it is stored once at its final index, which is returned.
+    def __trickleUp(self, cur):
+        keys, data = self.__keys, self.__data
+        k, d = keys[cur], data[cur]   # the recently inserted key/data
+        if cur == 0: return 0
+
+        parent = (cur - 1) >> 1
+        # if cur is on a min level and its key is greater than its parent's,
+        # or on a max level and its key is less, the parent moves down
+        if (cur + 1).bit_length() & 1:
+            onMax = k > keys[parent]
+            moveParent = onMax
+        else:
+            onMax = not k < keys[parent]
+            moveParent = not onMax
+        if moveParent:
+            keys[cur], data[cur] = keys[parent], data[parent]
+            cur = parent
+
+        # the grandparent of cur is (cur-3) // 4, and only exists if cur > 2
+        if onMax:
+            while cur > 2:
+                grandparent = (cur - 3) >> 2
+                if not k > keys[grandparent]: break
+                keys[cur], data[cur] = keys[grandparent], data[grandparent]
+                cur = grandparent
+        else:
+            while cur > 2:
+                grandparent = (cur - 3) >> 2
+                if not k < keys[grandparent]: break
+                keys[cur], data[cur] = keys[grandparent], data[grandparent]
+                cur = grandparent
+
+        keys[cur], data[cur] = k, d   # store the node in the final hole
+        return cur
+
+    # Finds the minimum node in the heap (node with smallest key) and returns
+    # a tuple of its key/data.
+    # The minimum key in the heap will be the root node's key.
+    def findMinimum(self):
+        if self.__deleted: self.__purgeMin()  # skip any tombstones first
+        # if heap is empty, return None
+        if self.__nElems == 0: return None
+        
+        # if heap is not empty, return the root node's key/data
+        return self.__keys[0], self.__data[0]
+    
+    # Finds the maximum node in the heap (node with largest key) and returns
+    # a tuple of its key/data.
+    # The maximum key in the heap will be the greater key of the root's left
+    # child and right child.
+    def findMaximum(self):
+        if self.__deleted: self.__purgeMax()  # skip any tombstones first
+        # if heap is empty, return None
+        if self.__nElems == 0: return None
+        
+        # return the maximum node's key and data
+        maximum = self.__maxIndex()
+        return self.__keys[maximum], self.__data[maximum]
+
+    # Returns the index of the maximum node in a heap that isn't empty.
+    # If the heap has 1 item, it is the max; if it has 2, the second is the
+    # max; otherwise whichever node's key on level 1 (max level) is greater
+    # is the max.
+    def __maxIndex(self):
+        if self.__nElems < 3: return self.__nElems - 1
+        return 1 if self.__keys[1] > self.__keys[2] else 2
+    
+    # Removes the first element of the heap,whose key has the minimum value, 
+    # and replaces it with the last element of the array.
+    # Makes sure to garbage collect the last position.
+    # Compares the node now in the root position of the heap in order to
+    # maintain heap property throughout the heap, ensuring that
+    # each node on the min levels are less than all of their descendants
+    # Returns a tuple of the removed node's key and data.
+    def removeMin(self):
+        if self.__deleted: self.__purgeMin()  # skip any tombstones first
+        # if heap is empty, return None
+        if self.__nElems == 0: return None
+
+        # save the root's key/data in order to return them later
+        root = self.__keys[0], self.__data[0]
+        self.__nElems -= 1  # decrement # of elements in array by 1
+        
+        # place the last node in the heap into the root location
+        self.__moveLast(0)
+        # call trickle down on the root index to restore heap property
+        self.__trickleDownMin(0)
+        if self.__shrink: self.__shrinkIfDrained()
+        
+        # return key/data of removed node
+        return root
+    
+    # Removes the element in the heap whose key has the maximum value
+    # and replaces it with the last element of the array, making sure to
+    # garbage collect the last position.
+    # Calls trickleDownMax() to compare the node now that has replaced
+    # the removed node to maintain heap property throughout the heap, ensuring
+    # that each node on the max levels are greater than all of their descendants.
+    # Returns a tuple of the removed node's key and data.
+    def removeMax(self):
+        if self.__deleted: self.__purgeMax()  # skip any tombstones first
+        # if the heap is empty, return None
+        if self.__nElems == 0: return None
+        
+        maxInd = self.__maxIndex()  # max index
+        
+        # save the max node's key/data in order to return them later
+        maximum = self.__keys[maxInd], self.__data[maxInd]
+        self.__nElems -= 1 # decrement # of items in array by 1
+        
+        # place the last node in the heap into the max location
+        self.__moveLast(maxInd)
+        # call trickle down on the max index to restore heap property
+        self.__trickleDownMax(maxInd)
+        if self.__shrink: self.__shrinkIfDrained()
+        
+        # return key/data of removed node
+        return maximum
+    
+    # Removes the k nodes with the smallest keys (or all of the nodes, if the
+    # heap has fewer than k) and returns a list of their key/data tuples in
+    # ascending order of key.
+    # If k is a large part of the heap, rather than removing the minimum k
+    # times, selects the k smallest nodes at once, in O(n log k), and
+    # heapifies the rest in linear time.
+    # If arrays is True, instead returns a tuple of a NumPy array of the keys
+    # and one of the data; for a heap with typed keys and no handles, a large
+    # k is then selected and the rest heapified with NumPy.
+    def popMinMany(self, k, arrays=False):
+        if arrays: return self.__popManyArrays(k, False)
+        k = min(k, len(self))
+        if k <= 0: return []
+        if k * self.__selectRatio >= len(self):
+            return self.__selectMany(k, False)
+
+        popped = []
+        keys, data = self.__keys, self.__data
+        for i in range(k):
+            if self.__deleted: self.__purgeMin()
+            popped.append((keys[0], data[0]))
+            self.__nElems -= 1
+            self.__moveLast(0)
+            self.__trickleDownMin(0)
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # Removes the k nodes with the largest keys (or all of the nodes, if the
+    # heap has fewer than k) and returns a list of their key/data tuples in
+    # descending order of key. Works the same way as popMinMany().
+    def popMaxMany(self, k, arrays=False):
+        if arrays: return self.__popManyArrays(k, True)
+        k = min(k, len(self))
+        if k <= 0: return []
+        if k * self.__selectRatio >= len(self):
+            return self.__selectMany(k, True)
+
+        popped = []
+        keys, data = self.__keys, self.__data
+        for i in range(k):
+            if self.__deleted: self.__purgeMax()
+            maxInd = self.__maxIndex()
+            popped.append((keys[maxInd], data[maxInd]))
+            self.__nElems -= 1
+            self.__moveLast(maxInd)
+            self.__trickleDownMax(maxInd)
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # popMinMany() and popMaxMany() select the k nodes in one pass over the
+    # heap, rather than removing one node at a time, once k is at least
+    # 1/__selectRatio of the heap
+    __selectRatio = 6
+
+    # Selects the indexes of the k nodes with the smallest keys (largest if
+    # reverse is True) with heapq, in order, removes them and returns them as
+    # key/data tuples, then puts the rest back at the front of the arrays and
+    # heapifies them.
+    def __selectMany(self, k, reverse):
+        self.compact()
+        keys, data, n = self.__keys, self.__data, self.__nElems
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        chosen = select(k, range(n), key=keys.__getitem__)
+        popped = [(keys[i], data[i]) for i in chosen]
+        rest = bytearray(b'\x01') * n
+        for i in chosen: rest[i] = 0
+        rest = list(itertools.compress(range(n), rest))
+        restKeys = [keys[i] for i in rest]
+        restData = [data[i] for i in rest]
+        restHandles = None
+        if self.__handles is not None:
+            for i in chosen: self.__handles[i].index = -1
+            restHandles = [self.__handles[i] for i in rest]
+            self.__handles[n-k:n] = [None] * k
+
+        self.__nElems = 0
+        self.__storeMany(restKeys, restData, restHandles)
+        keys, data = self.__keys, self.__data # storeMany may untype the keys
+        keys[n-k:n] = self.__newKeys(k)       # garbage collect the old slots
+        data[n-k:n] = [None] * k
+        self.heapify()
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # popMinMany() and popMaxMany() with arrays=True. Picks the k nodes with
+    # NumPy when the plain versions would sort the whole heap, so long as
+    # the keys are typed and no handles need to move; otherwise converts what
+    # the plain versions return.
+    def __popManyArrays(self, k, reverse):
+        if importNumpy() is None:
+            raise ImportError("arrays=True needs NumPy")
+        self.compact()
+        n = self.__nElems
+        k = max(min(k, n), 0)
+        dtype = self.__typecode
+        if dtype is None or self.__handles is not None or \
+           k * self.__selectRatio < n:
+            popped = self.popMaxMany(k) if reverse else self.popMinMany(k)
+            keys = numpy.array([p[0] for p in popped], dtype=dtype)
+            return keys, self.__dataArray([p[1] for p in popped])
+
+        keys = numpy.frombuffer(self.__keys[:n], dtype=dtype)
+        chosen = numpy.argpartition(keys, n - k if reverse else k - 1)
+        chosen = chosen[n - k:] if reverse else chosen[:k]
+        chosen = chosen[numpy.argsort(keys[chosen], kind='stable')]
+        if reverse: chosen = chosen[::-1]
+        rest = numpy.ones(n, dtype=bool)
+        rest[chosen] = False
+        rest = numpy.flatnonzero(rest)
+
+        popped = keys[chosen], self.__dataArray(self.__gather(self.__data,
+                                                              chosen))
+        restKeys = keys[rest]
+        self.__heapifyVector(restKeys, rest)  # rest now in heap order
+        m = n - k
+        self.__keys[:m] = array.array(dtype, restKeys.tobytes())
+        self.__data[:m] = self.__gather(self.__data, rest)
+        self.__keys[m:n] = self.__newKeys(k)  # garbage collect the old slots
+        self.__data[m:n] = [None] * k
+        self.__nElems = m
+        self.__touchAll()
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # Returns a NumPy array of the inputed list of data: a numeric array if
+    # they are all numbers, or else an array of objects
+    @staticmethod
+    def __dataArray(data):
+        if data and all(type(d) in (int, float, bool) for d in data):
+            return numpy.array(data)
+        out = numpy.empty(len(data), dtype=object)
+        for i in range(len(data)): out[i] = data[i]
+        return out
+
+    # Removes nodes from the minimum end of the heap for as long as their key
+    # satisfies predicate (for example lambda k: k < 10) and returns a list of
+    # their key/data tuples in ascending order of key.
+    def drainWhileMin(self, predicate):
+        popped = []
+        keys, data = self.__keys, self.__data
+        while True:
+            if self.__deleted: self.__purgeMin()
+            if self.__nElems == 0 or not predicate(keys[0]): break
+            popped.append((keys[0], data[0]))
+            self.__nElems -= 1
+            self.__moveLast(0)
+            self.__trickleDownMin(0)
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # Removes nodes from the maximum end of the heap for as long as their key
+    # satisfies predicate (for example lambda k: k > 90) and returns a list of
+    # their key/data tuples in descending order of key.
+    def drainWhileMax(self, predicate):
+        popped = []
+        keys, data = self.__keys, self.__data
+        while True:
+            if self.__deleted: self.__purgeMax()
+            if self.__nElems == 0: break
+            maxInd = self.__maxIndex()
+            if not predicate(keys[maxInd]): break
+            popped.append((keys[maxInd], data[maxInd]))
+            self.__nElems -= 1
+            self.__moveLast(maxInd)
+            self.__trickleDownMax(maxInd)
+        if self.__shrink: self.__shrinkIfDrained()
+        return popped
+
+    # Yields the key/data tuple of every node in ascending order of key,
+    # without changing the heap. Only the nodes that could come next are
+    # kept, in a small frontier heap, so taking the first k of them costs
+    # O(k log k) time rather than sorting the whole heap.
+    # The heap must not be changed until the iteration is finished.
+    def iterAscending(self): return self.__iterSorted(True)
+
+    # Yields the key/data tuple of every node in descending order of key, the
+    # same way as iterAscending().
+    def iterDescending(self): return self.__iterSorted(False)
+
+    # Returns a list of the key/data tuples of the k nodes with the smallest
+    # keys, in ascending order, without changing the heap
+    def nsmallest(self, k):
+        return list(itertools.islice(self.iterAscending(), max(k, 0)))
+
+    # Returns a list of the key/data tuples of the k nodes with the largest
+    # keys, in descending order, without changing the heap
+    def nlargest(self, k):
+        return list(itertools.islice(self.iterDescending(), max(k, 0)))
+
+    # Walks the heap in ascending (or descending) order of key, with a
+    # MinMaxHeap of (key, index) pairs as the frontier of nodes that could
+    # come next. Tombstones go through the frontier like any other node, so
+    # that the nodes below them are reached, but are not yielded.
+    # Going up, a node on a min level is no larger than anything below it,
+    # so once it has been yielded its children and grandchildren join the
+    # frontier. A node on a max level adds nothing: its children came in with
+    # it, as grandchildren of its parent, and nothing below it can be larger.
+    # Going down, the same holds with the levels swapped, and the frontier
+    # starts with the root and both of its children.
+    def __iterSorted(self, ascending):
+        n, keys, data = self.__nElems, self.__keys, self.__data
+        frontier = MinMaxHeap(16, grow=True, typecode=self.__typecode)
+        take = frontier.removeMin if ascending else frontier.removeMax
+        for i in range(1 if ascending else min(n, 3)):
+            if i < n: frontier.insert(keys[i], i)
+
+        while len(frontier) > 0:
+            k, i = take()
+            if data[i] is not self.__tombstone: yield k, data[i]
+            if self.__minLevel(i) == ascending:
+                child = 2*i + 1
+                for j in (child, child + 1,
+                          2*child + 1, 2*child + 2, 2*child + 3, 2*child + 4):
+                    if j >= n: break
+                    frontier.insert(keys[j], j)
+
+    # Makes sure the array maintains heap property throughout the heap.
+    # Finds the smallest of the inputed index's children and grandchildren
+    # (up to six nodes, scanned in place). If it is smaller than the node,
+    # it moves up into the node's index, and the node moves on down to the
+    # smallest descendant's index. If that was a grandchild, the node is
+    # first compared with the grandchild's parent on the max level between
+    # them: if the node is larger, it stays there instead, and the parent's
+    # node is the one that carries on down.
+    # Like trickleUp(), moves a hole down rather than swapping nodes, and
+    # returns the index of the last hole filled.
+    def __trickleDownMin(self, cur):
+        keys, data, n = self.__keys, self.__data, self.__nElems
+        k, d = keys[cur], data[cur]
+
+        while True:
+            child = 2*cur + 1
+            if child >= n: break      # cur has no children
+
+            # find index m and key mk of smallest child or grandchild
+            m, mk = child, keys[child]
+            if child + 1 < n and keys[child + 1] < mk:
+                m, mk = child + 1, keys[child + 1]
+            grandchild = 2*child + 1
+            last = min(grandchild + 4, n)
+            g = grandchild
+            while g < last:
+                if keys[g] < mk: m, mk = g, keys[g]
+                g += 1
+
+            if not mk < k: break      # node is smaller than all descendants
+            keys[cur], data[cur] = mk, data[m]
+            cur = m
+            if m < grandchild: break  # a child has no descendants left to check
+
+            parent = (m - 1) >> 1
+            if k > keys[parent]:      # node belongs on the max level above m
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+
+        keys[cur], data[cur] = k, d
+        return cur
+
+    # Makes sure the array maintains heap property throughout the heap.
+    # The same as trickleDownMin(), but for a node on a max level, which must
+    # be larger than all of its descendants.
+    def __trickleDownMax(self, cur):
+        keys, data, n = self.__keys, self.__data, self.__nElems
+        k, d = keys[cur], data[cur]
+
+        while True:
+            child = 2*cur + 1
+            if child >= n: break      # cur has no children
+
+            # find index m and key mk of largest child or grandchild
+            m, mk = child, keys[child]
+            if child + 1 < n and keys[child + 1] > mk:
+                m, mk = child + 1, keys[child + 1]
+            grandchild = 2*child + 1
+            last = min(grandchild + 4, n)
+            g = grandchild
+            while g < last:
+                if keys[g] > mk: m, mk = g, keys[g]
+                g += 1
+
+            if not mk > k: break      # node is larger than all descendants
+            keys[cur], data[cur] = mk, data[m]
+            cur = m
+            if m < grandchild: break  # a child has no descendants left to check
+
+            parent = (m - 1) >> 1
+            if k < keys[parent]:      # node belongs on the min level above m
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+
+        keys[cur], data[cur] = k, d
+        return cur
+
+    # The same as trickleUp(), but also moves each node's handle along with
+    # it and updates the handle's index. Used once the heap tracks handles.
+    def __trickleUpTracked(self, cur):
+        keys, data, handles = self.__keys, self.__data, self.__handles
+        k, d, h = keys[cur], data[cur], handles[cur]
+        if cur == 0: return 0
+
+        parent = (cur - 1) >> 1
+        if (cur + 1).bit_length() & 1:
+            onMax = k > keys[parent]
+            moveParent = onMax
+        else:
+            onMax = not k < keys[parent]
+            moveParent = not onMax
+        if moveParent:
+            keys[cur], data[cur] = keys[parent], data[parent]
+            handles[cur] = handles[parent]
+            handles[cur].index = cur
+            cur = parent
+
+        if onMax:
+            while cur > 2:
+                grandparent = (cur - 3) >> 2
+                if not k > keys[grandparent]: break
+                keys[cur], data[cur] = keys[grandparent], data[grandparent]
+                handles[cur] = handles[grandparent]
+                handles[cur].index = cur
+                cur = grandparent
+        else:
+            while cur > 2:
+                grandparent = (cur - 3) >> 2
+                if not k < keys[grandparent]: break
+                keys[cur], data[cur] = keys[grandparent], data[grandparent]
+                handles[cur] = handles[grandparent]
+                handles[cur].index = cur
+                cur = grandparent
+
+        keys[cur], data[cur], handles[cur] = k, d, h
+        h.index = cur
+        return cur
+
+    # The same as trickleDownMin(), but also moves each node's handle along
+    # with it and updates the handle's index
+    def __trickleDownMinTracked(self, cur):
+        keys, data, handles = self.__keys, self.__data, self.__handles
+        n = self.__nElems
+        if cur >= n: return cur     # the heap was just emptied
+        k, d, h = keys[cur], data[cur], handles[cur]
+
+        while True:
+            child = 2*cur + 1
+            if child >= n: break
+
+            m, mk = child, keys[child]
+            if child + 1 < n and keys[child + 1] < mk:
+                m, mk = child + 1, keys[child + 1]
+            grandchild = 2*child + 1
+            last = min(grandchild + 4, n)
+            g = grandchild
+            while g < last:
+                if keys[g] < mk: m, mk = g, keys[g]
+                g += 1
+
+            if not mk < k: break
+            keys[cur], data[cur], handles[cur] = mk, data[m], handles[m]
+            handles[cur].index = cur
+            cur = m
+            if m < grandchild: break
+
+            parent = (m - 1) >> 1
+            if k > keys[parent]:
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+                handles[parent], h = h, handles[parent]
+                handles[parent].index = parent
+
+        keys[cur], data[cur], handles[cur] = k, d, h
+        h.index = cur
+        return cur
+
+    # The same as trickleDownMax(), but also moves each node's handle along
+    # with it and updates the handle's index
+    def __trickleDownMaxTracked(self, cur):
+        keys, data, handles = self.__keys, self.__data, self.__handles
+        n = self.__nElems
+        if cur >= n: return cur     # the heap was just emptied
+        k, d, h = keys[cur], data[cur], handles[cur]
+
+        while True:
+            child = 2*cur + 1
+            if child >= n: break
+
+            m, mk = child, keys[child]
+            if child + 1 < n and keys[child + 1] > mk:
+                m, mk = child + 1, keys[child + 1]
+            grandchild = 2*child + 1
+            last = min(grandchild + 4, n)
+            g = grandchild
+            while g < last:
+                if keys[g] > mk: m, mk = g, keys[g]
+                g += 1
+
+            if not mk > k: break
+            keys[cur], data[cur], handles[cur] = mk, data[m], handles[m]
+            handles[cur].index = cur
+            cur = m
+            if m < grandchild: break
+
+            parent = (m - 1) >> 1
+            if k < keys[parent]:
+                keys[parent], k = k, keys[parent]
+                data[parent], d = d, data[parent]
+                handles[parent], h = h, handles[parent]
+                handles[parent].index = parent
+
+        keys[cur], data[cur], handles[cur] = k, d, h
+        h.index = cur
+        return cur
+
+    # Checks to make sure that the heap fulfills min-max heap properties
+    # and is actually a min-max heap. Returns True if it does, and False if
+    # any node is out of order (see findViolation()).
+    # If incremental is True, only the parts of the heap changed since the
+    # last incremental check are looked at (see findViolation()).
+    def isMinMaxHeap(self, incremental=False):
+        return self.findViolation(incremental) is None
+
+    # Returns the index of the first node that is out of order with its
+    # parent or its grandparent, or None if there is none. A node on a min
+    # level must be no greater than its parent (on a max level above it) and
+    # no less than its grandparent; a node on a max level the other way
+    # round. Between them, these relations put every node on a min level
+    # below all of its descendants and every node on a max level above them.
+    # Goes through the nodes in one pass, in O(n) time, or a whole level at a
+    # time with NumPy if the keys are typed and there are enough of them.
+    # If incremental is True, the first call checks the whole heap, as above,
+    # and from then on the heap keeps track of which nodes its trickles touch.
+    # Each later incremental call checks only the paths from those nodes up
+    # to the root, and the nodes just below them, in O(log n) time for each
+    # change.
+    def findViolation(self, incremental=False):
+        if incremental and self.__touched is not None:
+            found = self.__firstViolationIn(self.__touchedNodes())
+            self.__touched.clear()
+            return found
+        if incremental: self.__recordTouches(set())
+
+        n = self.__nElems
+        if self.__typecode is not None and n >= self.__vectorCheckMin and \
+           importNumpy() is not None:
+            keys = numpy.frombuffer(self.__keys[:n], dtype=self.__typecode)
+            found = self.__firstViolationVector(keys)
+            return None if found == -1 else found
+        return self.__firstViolationIn(range(1, n))
+
+    # findViolation() only checks a heap with typed keys a level at a time
+    # with NumPy once it has this many nodes, so that small heaps never
+    # import it
+    __vectorCheckMin = 1024
+
+    # Returns the first of the inputed indexes, in order, whose node is out
+    # of order with its parent or grandparent, or None if there is none
+    def __firstViolationIn(self, indexes):
+        keys = self.__keys
+        for i in indexes:
+            k, parent = keys[i], (i - 1) >> 1
+            if (i + 1).bit_length() & 1:  # a min level, below a max level
+                if k > keys[parent] or (i > 2 and k < keys[(i - 3) >> 2]):
+                    return i
+            else:                         # a max level, below a min level
+                if k < keys[parent] or (i > 2 and k > keys[(i - 3) >> 2]):
+                    return i
+        return None
+
+    # Returns a sorted list of the indexes whose relations with their
+    # parents and grandparents may have changed since the last incremental
+    # check: every node on the path from each touched node up to the root,
+    # and the children and grandchildren of those nodes. (A touched index
+    # past the end of a heap that has since shrunk is followed up to the
+    # first of its ancestors still in the heap.)
+    def __touchedNodes(self):
+        n, path = self.__nElems, set()
+        for i in self.__touched:
+            while i >= n: i = (i - 1) >> 1
+            while i > 0 and i not in path:
+                path.add(i)
+                i = (i - 1) >> 1
+        path.add(0)
+        nodes = set(path)
+        for i in path:
+            child = 2*i + 1
+            nodes.update((child, child + 1, 2*child + 1, 2*child + 2,
+                          2*child + 3, 2*child + 4))
+        return sorted(i for i in nodes if 0 < i < n)
+
+    # Starts noting, in the inputed set, the index of every node that a
+    # trickle touches: the node a trickle up starts from, and the node a
+    # trickle down ends at, as the deepest node on each one's path. As with
+    # handle tracking, the trickle methods are only wrapped on heaps that
+    # have had an incremental check, so no other heap pays for it.
+    def __recordTouches(self, touched):
+        self.__touched = touched
+        self.__installTrickles()
+
+    # Notes every node as touched, for a change to the heap's arrays that
+    # didn't go through the trickle methods. Every path ends at a leaf.
+    def __touchAll(self):
+        if self.__touched is not None:
+            self.__touched.update(range(self.__nElems // 2, self.__nElems))
+
+    # Returns a node with the key and data at inputed index. A tombstone
+    # left by markDeleted() has None as its data.
+    def getItem(self, index):
+        d = self.__data[index]
+        return Node(self.__keys[index], None if d is self.__tombstone else d)
+
+    # Pickles the heap as its options and two flat columns, one of keys (a
+    # typed array.array, which pickles as raw bytes, or a list) and one of
+    # data, rather than node by node. Handles are not kept: an unpickled
+    # heap starts out not tracking any. The key function is pickled with
+    # the rest, so it must be picklable itself (a lambda isn't). Any
+    # tombstones are compacted away first.
+    def __getstate__(self):
+        self.compact()
+        n = self.__nElems
+        return {'keys': self.__keys[:n], 'data': self.__data[:n],
+                'typecode': self.__typecode, 'capacity': len(self.__data),
+                'minSize': self.__minSize, 'grow': self.__grow,
+                'shrink': self.__shrink, 'keep': self.__keep,
+                'key': self.__key, 'reverse': self.__reverse,
+                'fifo': self.__fifo, 'pushed': self.__pushed,
+                'compactRatio': self.__compactRatio}
+
+    # Rebuilds the heap from the state returned by __getstate__(). The
+    # columns are already in heap order, so nothing is re-heapified.
+    def __setstate__(self, state):
+        self.__init__(0, state['grow'], state['shrink'], state['typecode'],
+                      state['keep'], state.get('key'),
+                      state.get('reverse', False), state.get('fifo', False),
+                      state.get('compactRatio', 0.5))
+        self.__pushed = state.get('pushed', 0)
+        n = len(state['data'])
+        self.__minSize = state['minSize']
+        self.__resize(max(state['capacity'], n))
+        self.__keys[:n] = state['keys']
+        self.__data[:n] = state['data']
+        self.__nElems = n
+
+    # A snapshot file starts with a header of: the magic bytes, the format
+    # version, the keys' typecode (or '-' for a pickled list of keys), flags
+    # for grow, shrink, big-endian columns, reverse and fifo, keep (0 for
+    # None, 1 for 'largest', 2 for 'smallest'), then the number of nodes, the
+    # capacity, the size the heap can't shrink below, the length of the key
+    # column in bytes, and the number of nodes per payload block. After it
+    # come the key column, the offsets of each payload block from the start
+    # of the payload column plus the column's length (as unsigned 64-bit
+    # ints), and then the payload column. Each block is a pickled list of the
+    # data of that many nodes, in heap order, so a node's data can be found
+    # from its index without reading the rest, and loading costs one
+    # pickle.loads() per block rather than one per node.
+    __snapshotHeader = struct.Struct('<8sBcBBQQQQI')
+    __payloadBlock = 4096
+    __snapshotMagic = b'MINMAXHP'
+    __keepCodes = (None, 'largest', 'smallest')
+
+    # Writes the heap to a snapshot file at path, with its nodes in the
+    # order they are in now, so that load() never has to re-heapify them.
+    # Keys in a typed array are written as the array's raw bytes. Handles
+    # are not saved, and neither is the key function, which is given to
+    # load() instead. Any tombstones are compacted away first.
+    def save(self, path):
+        self.compact()
+        n = self.__nElems
+        if self.__typecode is not None:
+            keyColumn = self.__keys[:n].tobytes()
+        else:
+            keyColumn = pickle.dumps(self.__keys[:n])
+        block = self.__payloadBlock
+        payloads = [pickle.dumps(self.__data[i:min(i + block, n)])
+                    for i in range(0, n, block)]
+        offsets = array.array('Q', [0])
+        offsets.extend(itertools.accumulate(map(len, payloads)))
+
+        flags = self.__grow | self.__shrink << 1 | \
+                (sys.byteorder == 'big') << 2 | self.__reverse << 3 | \
+                self.__fifo << 4
+        header = self.__snapshotHeader.pack(
+            self.__snapshotMagic, 1, (self.__typecode or '-').encode(), flags,
+            self.__keepCodes.index(self.__keep), n, len(self.__data),
+            self.__minSize, len(keyColumn), block)
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(keyColumn)
+            f.write(offsets.tobytes())
+            f.writelines(payloads)
+
+    # Builds a heap from a snapshot file written by save(), with the same
+    # nodes, in the same order, and the same options. The columns are read
+    # from the file one after another, never the whole file at once: a typed
+    # key column goes straight into the heap's array with one read, with no
+    # parsing of each key, and the payload column is read a block at a time.
+    # key is the key function for the loaded heap's push(), if it needs one.
+    # Raises ValueError if the file is not a snapshot.
+    @classmethod
+    def load(cls, path, key=None):
+        with open(path, 'rb') as f:
+            try:
+                return cls.__fromSnapshot(f, key)
+            except (EOFError, pickle.UnpicklingError):
+                raise ValueError("not a MinMaxHeap snapshot") from None
+
+    # Builds a heap from a snapshot file opened for reading, raising
+    # EOFError or pickle.UnpicklingError if it ends early. A fifo heap's
+    # next sequence number follows on from the largest one saved.
+    @classmethod
+    def __fromSnapshot(cls, f, key):
+        header = cls.__snapshotHeader
+        raw = f.read(header.size)
+        if len(raw) < header.size:
+            raise ValueError("not a MinMaxHeap snapshot")
+        magic, version, typecode, flags, keep, n, capacity, minSize, \
+            keyBytes, block = header.unpack(raw)
+        if magic != cls.__snapshotMagic or version != 1:
+            raise ValueError("not a MinMaxHeap snapshot")
+        typecode = None if typecode == b'-' else typecode.decode()
+        swap = bool(flags & 4) != (sys.byteorder == 'big')
+
+        if typecode is None:
+            keys = pickle.loads(f.read(keyBytes))
+        else:
+            keys = array.array(typecode)
+            keys.fromfile(f, keyBytes // keys.itemsize)
+            if swap: keys.byteswap()
+
+        blocks = -(-n // block)
+        offsets = array.array('Q')
+        offsets.fromfile(f, blocks + 1)
+        if swap: offsets.byteswap()
+        data = []
+        for i in range(blocks):
+            data += pickle.loads(f.read(offsets[i+1] - offsets[i]))
+
+        h = cls.__new__(cls)
+        h.__setstate__({'keys': keys, 'data': data, 'typecode': typecode,
+                        'capacity': capacity, 'minSize': minSize,
+                        'grow': bool(flags & 1), 'shrink': bool(flags & 2),
+                        'keep': cls.__keepCodes[keep], 'key': key,
+                        'reverse': bool(flags & 8), 'fifo': bool(flags & 16),
+                        'pushed': max((abs(k[1]) for k in keys), default=0)
+                                  if flags & 16 else 0})
+        return h
@@ -0,0 +1,210 @@
+# A running median and quantile tracker built on MinMaxHeaps.
+
+import collections
+import fractions
+
+from .heap import MinMaxHeap
+
+# QuantileTracker class
+# Tracks one or more quantiles (the median, by default) of a stream of
+# keys, each updated in O(log n) time per key and read in O(1). The keys are
+# split into one partition more than there are quantiles, in order: every
+# key in a partition is no larger than any key in the next one. Each
+# partition is a MinMaxHeap, so both its smallest and its largest key are at
+# hand, and after each change the partitions are rebalanced, by moving the
+# largest key of a partition up into the next one, or the smallest key of
+# the next one down, until the number of keys up to the end of each
+# partition is its quantile's rank. A quantile is then the largest key of
+# its partition.
+# The rank of quantile q among n keys is ceil(q * n), working from q's
+# decimal value, so 0.9 of 10 keys is exactly the 9th smallest.
+# If window is not None, only the last window keys are tracked: each key is
+# kept with a handle, and the oldest is removed once there are more.
+# If retain is not None, memory is bounded instead by keeping only the
+# retain largest keys of the first partition and the retain smallest of
+# the last, with keep='largest' and keep='smallest': the keys furthest from
+# the quantiles are dropped, and only counted. A later key beyond the
+# furthest one dropped is dropped as well, so the keys kept are always the
+# part of the partition nearest the quantiles. Every quantile stays exact
+# unless the stream drifts so far that a key is needed back from beyond
+# those, after which isExact() returns False. On a stream whose keys come
+# from the same distribution throughout, a quantile's rank among the keys
+# seen wanders by about the square root of their number, so retain should
+# be a few times that (2000 keeps the median and p99 of a million uniform
+# keys exact). Partitions between two quantiles are kept whole, so retain
+# bounds the memory of a single quantile (p99, say), but not of the keys
+# between two of them.
+class QuantileTracker(object):
+    # QuantileTracker constructor
+    # quantiles is a sequence of the quantiles to track, each between 0 and
+    # 1. typecode is passed on to each partition's MinMaxHeap.
+    def __init__(self, quantiles=(0.5,), window=None, retain=None,
+                 typecode=None):
+        quantiles = sorted(set(quantiles))
+        if not quantiles or not 0 < quantiles[0] <= quantiles[-1] < 1:
+            raise ValueError("quantiles must be between 0 and 1")
+        if window is not None and retain is not None:
+            raise ValueError("a tracker with a window keeps every key in it, "
+                             "so can't retain fewer")
+        if (window is not None and window < 1) or \
+           (retain is not None and retain < 1):
+            raise ValueError("window and retain must be at least 1")
+        self.__quantiles = quantiles
+        # each quantile as a numerator and denominator, for ranks in ints
+        self.__ratios = [fractions.Fraction(str(q)).as_integer_ratio()
+                         for q in quantiles]
+        self.__window = window
+        self.__oldest = None if window is None else collections.deque()
+
+        m = len(quantiles)
+        self.__parts = [MinMaxHeap(16, grow=True, typecode=typecode)
+                        for i in range(m + 1)]
+        if retain is not None:
+            self.__parts[0] = MinMaxHeap(retain, typecode=typecode,
+                                         keep='largest')
+            self.__parts[m] = MinMaxHeap(retain, typecode=typecode,
+                                         keep='smallest')
+        self.__counts = [0] * (m + 1) # keys in each partition, dropped or not
+        # the largest key dropped from the first partition and the smallest
+        # dropped from the last, if the tracker retains only some keys
+        self.__dropped = None if retain is None else [None, None]
+        self.__nElems = 0
+        self.__exact = True
+
+    # Returns the number of keys tracked
+    def __len__(self): return self.__nElems
+
+    # Returns False if a quantile has needed a key dropped to bound memory
+    # since the tracker was made, and True otherwise
+    def isExact(self): return self.__exact
+
+    # Adds a key to the partition it belongs in, then rebalances the
+    # partitions. A tracker with a window first removes its oldest key if
+    # the window is full.
+    def insert(self, k):
+        i, m = 0, len(self.__quantiles)
+        while i < m:
+            largest = self.__largest(i)
+            if largest is not None and k <= largest: break
+            i += 1
+        record = None
+        if self.__oldest is not None:
+            record = [i, None]    # the key's partition and handle
+            self.__oldest.append(record)
+        self.__add(i, k, record)
+        self.__nElems += 1
+
+        if self.__oldest is not None and self.__nElems > self.__window:
+            i, handle = self.__oldest.popleft()
+            self.__parts[i].remove(handle)
+            self.__counts[i] -= 1
+            self.__nElems -= 1
+        self.__rebalance()
+
+    # Puts key k into partition i, with record as its data if the tracker
+    # has a window. If the tracker retains only some keys, and i is the
+    # first or last partition, k is dropped if it is beyond the furthest key
+    # dropped from it, or the partition's heap may reject it or evict
+    # another key to make room, which then becomes the furthest dropped.
+    def __add(self, i, k, record):
+        part, dropped = self.__parts[i], self.__dropped
+        self.__counts[i] += 1
+        if record is not None:
+            record[0] = i
+            record[1] = part.insert(k, record, True)
+            return
+        if dropped is None or 0 < i < len(self.__quantiles):
+            part.insert(k, None)
+            return
+
+        end = 0 if i == 0 else 1
+        if dropped[end] is not None and \
+           (k <= dropped[end] if end == 0 else k >= dropped[end]):
+            return
+        result = part.insert(k, None)
+        if result is False: dropped[end] = k
+        elif result is not True: dropped[end] = result[0]
+
+    # Returns the largest key in partition i, or None if it has none. If
+    # every key left in the first partition was dropped, the largest of them
+    # is the largest dropped.
+    def __largest(self, i):
+        if len(self.__parts[i]): return self.__parts[i].findMaximum()[0]
+        if self.__counts[i] == 0: return None
+        return self.__dropped[0] if i == 0 else None
+
+    # Returns the smallest key in partition i, or None if it has none, the
+    # same way as largest()
+    def __smallest(self, i):
+        if len(self.__parts[i]): return self.__parts[i].findMinimum()[0]
+        if self.__counts[i] == 0: return None
+        return self.__dropped[1] if i == len(self.__quantiles) else None
+
+    # Moves keys between neighbouring partitions until the keys up to the
+    # end of each partition number its quantile's rank, working from the
+    # first boundary to the last. The rank, from 1, of a quantile that is
+    # num/den of the n keys is ceil(num * n / den). If there are too few,
+    # the smallest keys of the first partition after it that has any move
+    # down into it; any partitions in between are empty.
+    def __rebalance(self):
+        counts, n, total = self.__counts, self.__nElems, 0
+        for i, (num, den) in enumerate(self.__ratios):
+            total += counts[i]
+            rank = -(-num * n // den)
+            while total > rank:
+                self.__move(i, i + 1, False)
+                total -= 1
+            while total < rank:
+                j = i + 1
+                while counts[j] == 0: j += 1
+                self.__move(j, i, True)
+                total += 1
+
+    # Moves the smallest key (or the largest, if smallest is False) of
+    # partition i into partition j. If every key left in partition i was
+    # dropped to bound memory, only the counts change, and the tracker is
+    # no longer exact.
+    def __move(self, i, j, smallest):
+        part = self.__parts[i]
+        self.__counts[i] -= 1
+        if len(part) == 0:
+            self.__counts[j] += 1
+            self.__exact = False
+            return
+        k, record = part.removeMin() if smallest else part.removeMax()
+        self.__add(j, k, record)
+
+    # Returns the current value of quantile q, which must be one of the
+    # tracked quantiles (by default the first), or None if there are no keys.
+    # Two quantiles with the same rank leave the partition between them
+    # empty, so the value is the largest key of the last partition up to
+    # q's that has any. Raises ValueError if q isn't tracked.
+    def quantile(self, q=None):
+        i = 0 if q is None else self.__indexOf(q)
+        if self.__nElems == 0: return None
+        while self.__counts[i] == 0: i -= 1
+        return self.__largest(i)
+
+    # Returns a list of the current values of all the tracked quantiles, in
+    # ascending order of quantile
+    def quantiles(self):
+        return [self.quantile(q) for q in self.__quantiles]
+
+    # Returns the median of the keys, as statistics.median() would: the
+    # middle key of an odd number of them, or the mean of the two middle
+    # keys of an even number. Raises ValueError if 0.5 isn't tracked.
+    def median(self):
+        i = self.__indexOf(0.5)
+        lower = self.quantile(0.5)
+        if lower is None or self.__nElems % 2: return lower
+        j = i + 1
+        while self.__counts[j] == 0: j += 1
+        return (lower + self.__smallest(j)) / 2
+
+    # Returns the index of quantile q, or raises ValueError if it isn't
+    # tracked
+    def __indexOf(self, q):
+        try:
+            return self.__quantiles.index(q)
+        except ValueError:
+            raise ValueError("quantile %r is not tracked" % (q,)) from None
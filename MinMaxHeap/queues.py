@@ -0,0 +1,238 @@
+# Double-ended priority queues built on a MinMaxHeap: MinMaxHeapQueue for
+# threads and AsyncMinMaxHeapQueue for asyncio tasks.
+
+import asyncio
+import collections
+import queue
+import threading
+import time
+
+from .heap import MinMaxHeap
+
+# MinMaxHeapQueue class
+# A thread-safe double-ended priority queue for producer and consumer
+# threads, built on a MinMaxHeap and guarded by a single lock. Consumers
+# can wait for the minimum or the maximum node, and producers wait for room
+# when a fixed-capacity heap is full. Like queue.Queue, the single-node
+# methods raise queue.Empty or queue.Full if they can't finish in time.
+# The batch methods take the lock once for a whole batch.
+class MinMaxHeapQueue(object):
+    # MinMaxHeapQueue constructor
+    # size and any other options are passed on to the MinMaxHeap. A heap that
+    # grows, or keeps only its largest or smallest keys, is never too full
+    # to put() into.
+    def __init__(self, size, **options):
+        self.__heap = MinMaxHeap(size, **options)
+        self.__blocks = not options.get('grow') and not options.get('keep')
+        self.__lock = threading.Lock()
+        self.__notEmpty = threading.Condition(self.__lock) # to wait for nodes
+        self.__notFull = threading.Condition(self.__lock)  # to wait for room
+
+    # Returns the number of nodes in the queue
+    def __len__(self):
+        with self.__lock: return len(self.__heap)
+
+    # Returns True if a put() can go ahead without waiting for room
+    def __hasRoom(self):
+        return not self.__blocks or len(self.__heap) < self.__heap.capacity()
+
+    # Waits on condition until ready() returns True, for up to timeout
+    # seconds (or forever if timeout is None), or not at all if block is
+    # False. Must be called with the lock held.
+    # Returns True if ready() returned True in time.
+    @staticmethod
+    def __waitFor(condition, ready, block, timeout):
+        if ready(): return True
+        if not block: return False
+        return condition.wait_for(ready, timeout)
+
+    # Inserts a node with key k and data d, first waiting for room if the
+    # heap is full. Raises queue.Full if there is still no room after timeout
+    # seconds, or straight away if block is False.
+    # Returns what MinMaxHeap.insert() returns.
+    def put(self, k, d, block=True, timeout=None):
+        with self.__notFull:
+            if not self.__waitFor(self.__notFull, self.__hasRoom,
+                                  block, timeout):
+                raise queue.Full
+            result = self.__heap.insert(k, d)
+            self.__notEmpty.notify()
+            return result
+
+    # Removes the minimum node and returns a tuple of its key and data,
+    # first waiting for a node if the queue is empty. Raises queue.Empty if
+    # it is still empty after timeout seconds, or straight away if block is
+    # False.
+    def getMin(self, block=True, timeout=None):
+        return self.__get(MinMaxHeap.removeMin, block, timeout)
+
+    # Removes the maximum node and returns a tuple of its key and data, the
+    # same way as getMin().
+    def getMax(self, block=True, timeout=None):
+        return self.__get(MinMaxHeap.removeMax, block, timeout)
+
+    # Waits for a node the same way as getMin(), then calls remove() on the
+    # heap with the lock held
+    def __get(self, remove, block, timeout):
+        with self.__notEmpty:
+            if not self.__waitFor(self.__notEmpty, self.__heap.__len__,
+                                  block, timeout):
+                raise queue.Empty
+            removed = remove(self.__heap)
+            self.__notFull.notify()
+            return removed
+
+    # Inserts an iterable of (key, data) pairs, or parallel sequences of keys
+    # and data, taking the lock once for as many of them as there is room
+    # for, and waiting for more room if the heap fills up. Stops early if
+    # there is no room after timeout seconds in all, or as soon as the heap
+    # is full if block is False.
+    # Returns the number of nodes inserted.
+    def putMany(self, items, data=None, block=True, timeout=None):
+        if data is None:
+            items = list(items)
+            keys, data = [p[0] for p in items], [p[1] for p in items]
+        else:
+            keys, data = list(items), list(data)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = inserted = 0
+        with self.__notFull:
+            while done < len(keys):
+                if deadline is not None:
+                    timeout = max(deadline - time.monotonic(), 0)
+                if not self.__waitFor(self.__notFull, self.__hasRoom,
+                                      block, timeout):
+                    break
+                added = self.__heap.insertMany(keys[done:], data[done:])
+                self.__notEmpty.notify(added)
+                inserted += added
+                # a heap that never fills up takes (or rejects) them all
+                done = done + added if self.__blocks else len(keys)
+        return inserted
+
+    # Removes up to k of the nodes with the smallest keys, taking the lock
+    # once, and returns a list of their key/data tuples in ascending order of
+    # key. Waits for the queue to have at least one node, for up to timeout
+    # seconds, or not at all if block is False; returns an empty list if it
+    # is still empty.
+    def getMinMany(self, k, block=True, timeout=None):
+        return self.__getMany(MinMaxHeap.popMinMany, k, block, timeout)
+
+    # Removes up to k of the nodes with the largest keys and returns a list of
+    # their key/data tuples in descending order of key, the same way as
+    # getMinMany().
+    def getMaxMany(self, k, block=True, timeout=None):
+        return self.__getMany(MinMaxHeap.popMaxMany, k, block, timeout)
+
+    # Waits for a node the same way as getMinMany(), then calls popMany() on
+    # the heap with the lock held
+    def __getMany(self, popMany, k, block, timeout):
+        with self.__notEmpty:
+            if not self.__waitFor(self.__notEmpty, self.__heap.__len__,
+                                  block, timeout):
+                return []
+            popped = popMany(self.__heap, k)
+            self.__notFull.notify(len(popped))
+            return popped
+
+# AsyncMinMaxHeapQueue class
+# A double-ended priority queue for asyncio tasks, built on a MinMaxHeap,
+# working the same way as asyncio.Queue. Tasks can await the minimum or the
+# maximum node, and awaiting put()s wait for room when a fixed-capacity heap
+# is full. Each node put wakes exactly one waiting getter, and each node
+# removed wakes exactly one waiting putter. A waiting task that is cancelled
+# passes its wake-up on to the next waiter, so no node is left unclaimed.
+# Not thread-safe: use it from the event loop's thread only.
+class AsyncMinMaxHeapQueue(object):
+    # AsyncMinMaxHeapQueue constructor
+    # size and any other options are passed on to the MinMaxHeap. A heap that
+    # grows, or keeps only its largest or smallest keys, is never too full
+    # to put() into.
+    def __init__(self, size, **options):
+        self.__heap = MinMaxHeap(size, **options)
+        self.__blocks = not options.get('grow') and not options.get('keep')
+        self.__getters = collections.deque() # futures of tasks awaiting nodes
+        self.__putters = collections.deque() # futures of tasks awaiting room
+
+    # Returns the number of nodes in the queue
+    def __len__(self): return len(self.__heap)
+
+    # Returns True if a put() would have to wait for room
+    def __isFull(self):
+        return self.__blocks and len(self.__heap) == self.__heap.capacity()
+
+    # Wakes the first task in waiters that is still waiting
+    @staticmethod
+    def __wakeNext(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # Waits in the inputed queue of waiters until busy() returns False.
+    # If the waiting task is cancelled after it was woken up, it wakes the
+    # next waiter in its place before passing the cancellation on.
+    @classmethod
+    async def __waitWhile(cls, busy, waiters):
+        while busy():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:    # it had already been woken up
+                    pass
+                if not busy() and not waiter.cancelled():
+                    cls.__wakeNext(waiters)
+                raise
+
+    # Inserts a node with key k and data d, first waiting for room if the
+    # heap is full. Returns what MinMaxHeap.insert() returns.
+    async def put(self, k, d):
+        await self.__waitWhile(self.__isFull, self.__putters)
+        return self.putNowait(k, d)
+
+    # Inserts a node with key k and data d without waiting, or raises
+    # asyncio.QueueFull if the heap is full.
+    # Returns what MinMaxHeap.insert() returns.
+    def putNowait(self, k, d):
+        if self.__isFull(): raise asyncio.QueueFull
+        result = self.__heap.insert(k, d)
+        self.__wakeNext(self.__getters)
+        return result
+
+    # Removes the minimum node and returns a tuple of its key and data,
+    # first waiting for a node if the queue is empty.
+    async def getMin(self):
+        await self.__waitWhile(self.__isEmpty, self.__getters)
+        return self.getMinNowait()
+
+    # Removes the maximum node and returns a tuple of its key and data,
+    # first waiting for a node if the queue is empty.
+    async def getMax(self):
+        await self.__waitWhile(self.__isEmpty, self.__getters)
+        return self.getMaxNowait()
+
+    # Removes the minimum node without waiting and returns a tuple of its key
+    # and data, or raises asyncio.QueueEmpty if the queue is empty.
+    def getMinNowait(self):
+        if self.__isEmpty(): raise asyncio.QueueEmpty
+        removed = self.__heap.removeMin()
+        self.__wakeNext(self.__putters)
+        return removed
+
+    # Removes the maximum node without waiting and returns a tuple of its key
+    # and data, or raises asyncio.QueueEmpty if the queue is empty.
+    def getMaxNowait(self):
+        if self.__isEmpty(): raise asyncio.QueueEmpty
+        removed = self.__heap.removeMax()
+        self.__wakeNext(self.__putters)
+        return removed
+
+    # Returns True if a get would have to wait for a node
+    def __isEmpty(self): return len(self.__heap) == 0
@@ -0,0 +1,175 @@
+# A min-max heap spread over worker processes, one MinMaxHeap to each.
+
+import multiprocessing
+import operator
+
+from .heap import MinMaxHeap
+
+# Runs one shard of a ShardedMinMaxHeap in a worker process: a growing
+# MinMaxHeap of inputed size and options that carries out the (method name,
+# arguments) requests received on conn until it receives (None, None).
+# Batches of inserts are carried out without a reply. Every other request
+# is answered with a tuple of its result and the shard's new minimum and
+# maximum nodes, so that the coordinator never has to ask for them.
+def serveShard(conn, size, options):
+    h = MinMaxHeap(size, grow=True, **options)
+    while True:
+        op, args = conn.recv()
+        if op is None: break
+        result = getattr(h, op)(*args)
+        if op != 'insertMany':
+            conn.send((result, h.findMinimum(), h.findMaximum()))
+    conn.close()
+
+# ShardedMinMaxHeap class
+# A min-max heap split into shards, each a MinMaxHeap in its own worker
+# process, so that ingest isn't limited to one core by the GIL. Inserts are
+# dealt out to the shards in turn and sent in batches of up to batch nodes,
+# one message per batch. The coordinator (this object) keeps each shard's
+# minimum and maximum node, so findMinimum() and findMaximum() are answered
+# without asking the shards, and removeMin() and removeMax() ask only the
+# shard holding the node, at the cost of one round trip.
+# Call close() (or use it in a with statement) to stop the workers.
+class ShardedMinMaxHeap(object):
+    # ShardedMinMaxHeap constructor
+    # Starts workers worker processes, each with a MinMaxHeap that starts
+    # with room for size nodes and grows as needed. typecode is passed on to
+    # each shard's MinMaxHeap.
+    def __init__(self, workers, size=1024, typecode=None, batch=1024):
+        if workers < 1: raise ValueError("need at least one worker")
+        if batch < 1: raise ValueError("batch must be at least 1")
+        self.__conns = []
+        self.__workers = []
+        for i in range(workers):
+            conn, child = multiprocessing.Pipe()
+            p = multiprocessing.Process(target=serveShard, daemon=True,
+                                        args=(child, size,
+                                              {'typecode': typecode}))
+            p.start()
+            child.close()
+            self.__conns.append(conn)
+            self.__workers.append(p)
+
+        self.__batch = batch              # most inserts sent in one message
+        self.__keys = [[] for i in range(workers)] # keys not yet sent to
+        self.__data = [[] for i in range(workers)] # each shard, and their data
+        self.__mins = [None] * workers    # each shard's minimum node
+        self.__maxes = [None] * workers   # and maximum node, once sent
+        self.__next = 0                   # shard that gets the next insert
+        self.__nElems = 0                 # nodes in all shards, sent or not
+
+    def __enter__(self): return self
+
+    def __exit__(self, *exc): self.close()
+
+    # Returns the number of nodes in the heap
+    def __len__(self): return self.__nElems
+
+    # Stops the worker processes. The heap can't be used afterwards.
+    def close(self):
+        for conn in self.__conns:
+            conn.send((None, None))
+            conn.close()
+        for p in self.__workers: p.join()
+        self.__conns = self.__workers = []
+
+    # Inserts a node with key k and data d into the next shard's batch,
+    # sending the batch once it is full. Returns True.
+    def insert(self, k, d):
+        i = self.__next
+        self.__next = (i + 1) % len(self.__conns)
+        self.__keys[i].append(k)
+        self.__data[i].append(d)
+        self.__nElems += 1
+        if len(self.__keys[i]) >= self.__batch: self.__send(i)
+        return True
+
+    # Inserts an iterable of (key, data) pairs, or parallel sequences of keys
+    # and data, dealing them out evenly to the shards' batches and sending
+    # every batch that fills up. Returns the number inserted.
+    def insertMany(self, items, data=None):
+        if data is None:
+            items = list(items)
+            keys, data = [p[0] for p in items], [p[1] for p in items]
+        else:
+            keys, data = list(items), list(data)
+            if len(keys) != len(data):
+                raise ValueError("got %d keys but %d data items" %
+                                 (len(keys), len(data)))
+
+        shards = len(self.__conns)
+        for j in range(shards):
+            i = (self.__next + j) % shards
+            self.__keys[i] += keys[j::shards]
+            self.__data[i] += data[j::shards]
+            if len(self.__keys[i]) >= self.__batch: self.__send(i)
+        self.__next = (self.__next + len(keys)) % shards
+        self.__nElems += len(keys)
+        return len(keys)
+
+    # Sends shard i its batch of inserts, and updates the shard's minimum
+    # and maximum node with the batch's own
+    def __send(self, i):
+        keys, data = self.__keys[i], self.__data[i]
+        if not keys: return
+        self.__conns[i].send(('insertMany', (keys, data)))
+        self.__keys[i], self.__data[i] = [], []
+
+        low, high = min(keys), max(keys)
+        if self.__mins[i] is None or low < self.__mins[i][0]:
+            self.__mins[i] = low, data[keys.index(low)]
+        if self.__maxes[i] is None or high > self.__maxes[i][0]:
+            self.__maxes[i] = high, data[keys.index(high)]
+
+    # Sends every shard its batch of inserts, even if it isn't full
+    def flush(self):
+        for i in range(len(self.__conns)): self.__send(i)
+
+    # Returns the index of the shard whose extreme node, out of the inputed
+    # list of each shard's, comes first by better(), or None if they are all
+    # empty
+    @staticmethod
+    def __bestShard(extremes, better):
+        best = None
+        for i, node in enumerate(extremes):
+            if node is not None and (best is None or
+                                     better(node[0], extremes[best][0])):
+                best = i
+        return best
+
+    # Finds the minimum node in the heap (node with smallest key) and returns
+    # a tuple of its key/data, or None if the heap is empty
+    def findMinimum(self):
+        self.flush()
+        i = self.__bestShard(self.__mins, operator.lt)
+        return None if i is None else self.__mins[i]
+
+    # Finds the maximum node in the heap (node with largest key) and returns
+    # a tuple of its key/data, or None if the heap is empty
+    def findMaximum(self):
+        self.flush()
+        i = self.__bestShard(self.__maxes, operator.gt)
+        return None if i is None else self.__maxes[i]
+
+    # Removes the minimum node from the shard that holds it and returns a
+    # tuple of its key/data, or None if the heap is empty
+    def removeMin(self):
+        self.flush()
+        return self.__removeFrom(self.__bestShard(self.__mins, operator.lt),
+                                 'removeMin')
+
+    # Removes the maximum node from the shard that holds it and returns a
+    # tuple of its key/data, or None if the heap is empty
+    def removeMax(self):
+        self.flush()
+        return self.__removeFrom(self.__bestShard(self.__maxes, operator.gt),
+                                 'removeMax')
+
+    # Asks shard i to carry out the inputed removal, and keeps the shard's
+    # new minimum and maximum node from its reply
+    def __removeFrom(self, i, op):
+        if i is None: return None
+        self.__conns[i].send((op, ()))
+        removed, self.__mins[i], self.__maxes[i] = self.__conns[i].recv()
+        self.__nElems -= 1
+        return removed
@@ -0,0 +1,273 @@
+# A min-max heap of numeric keys and ids in shared memory, which any number
+# of processes can read and change at once.
+
+import multiprocessing
+import numbers
+import operator
+import os
+import struct
+from multiprocessing import shared_memory
+
+# SharedMinMaxHeap class
+# A fixed-capacity min-max heap whose nodes are a fixed-width key (a 64-bit
+# int or float, as for a MinMaxHeap's typecode 'q' or 'd') and a 64-bit int
+# id, standing for the payload, all kept in one block of shared memory, so
+# that every process that attaches to it works on the same heap with no
+# pickling or messages. The block holds a header of a sequence number, the
+# number of nodes, the capacity and the typecode, followed by the keys and
+# then the ids, in heap order.
+# Changes are made under a multiprocessing.Lock shared by all of the
+# processes. findMinimum() and findMaximum() don't take it: they read the
+# nodes as a seqlock reader does. Every change first makes the sequence
+# number odd and, once done, even again, so a reader notes the sequence
+# number, reads the node, and tries again if the number was odd or has
+# moved on since. Reads never wait for each other, only briefly for a
+# change in progress. This relies on each aligned 8-byte value being read
+# and written whole, and on stores to shared memory being seen in the order
+# they were made, as on x86; a process that dies in the middle of a change
+# leaves the heap locked for good.
+# The heap pickles as its block's name and its lock, so it can be passed to
+# a multiprocessing.Process, which attaches to the same block. Each process
+# should call close() when it is done; the one that made the heap also frees
+# the block then.
+class SharedMinMaxHeap(object):
+    # SharedMinMaxHeap constructor
+    # Makes a new block of shared memory with room for size nodes, with keys
+    # of typecode 'q' or 'd'. lock is the multiprocessing.Lock that guards
+    # changes, or None for a new one; name is the block's name, or None for
+    # a made-up one.
+    def __init__(self, size, typecode='d', lock=None, name=None):
+        if typecode not in ('q', 'd'):
+            raise ValueError("typecode must be 'q' or 'd'")
+        if size < 1: raise ValueError("size must be at least 1")
+        shm = shared_memory.SharedMemory(
+            name, create=True, size=self.__header.size + 16 * size)
+        self.__header.pack_into(shm.buf, 0, 0, 0, size, typecode.encode())
+        self.__open(shm, lock or multiprocessing.Lock(), os.getpid())
+
+    # the header: sequence number, number of nodes, capacity and typecode
+    __header = struct.Struct('=qqqc7x')
+
+    # Attaches to the block of shared memory of an existing heap, by the
+    # inputed name, and returns a heap that works on it. lock must be the
+    # heap's lock.
+    @classmethod
+    def attach(cls, name, lock):
+        h = cls.__new__(cls)
+        h.__open(shared_memory.SharedMemory(name), lock, None)
+        return h
+
+    # Sets the heap up on a block of shared memory whose header has been
+    # written, with views of its header, keys and ids. owner is the id of
+    # the process that made the block, or None if this heap attached to it.
+    def __open(self, shm, lock, owner):
+        seq, n, size, typecode = self.__header.unpack_from(shm.buf)
+        typecode = typecode.decode()
+        start = self.__header.size
+        self.__shm = shm
+        self.__lock = lock
+        self.__owner = owner            # the process that frees the block
+        self.__meta = shm.buf[:24].cast('q')  # sequence, nodes and capacity
+        self.__keys = shm.buf[start:start + 8*size].cast(typecode)
+        self.__ids = shm.buf[start + 8*size:start + 16*size].cast('q')
+        self.__size = size
+        self.__typecode = typecode
+
+    # Pickles the heap as its block's name and lock, to be attached to
+    def __reduce__(self):
+        return (type(self).attach, (self.__shm.name, self.__lock))
+
+    def __enter__(self): return self
+
+    def __exit__(self, *exc): self.close()
+
+    # Releases this process's view of the block, and frees the block itself
+    # if this is the heap that made it, in the process that made it (a
+    # forked child has a copy of the heap, but not the block to free). The
+    # heap can't be used after.
+    def close(self):
+        if self.__shm is None: return
+        for view in (self.__meta, self.__keys, self.__ids): view.release()
+        self.__shm.close()
+        if self.__owner == os.getpid(): self.__shm.unlink()
+        self.__shm = None
+
+    # Returns the name of the block of shared memory
+    def name(self): return self.__shm.name
+
+    # Returns the number of nodes in the heap
+    def __len__(self): return self.__meta[1]
+
+    # Returns the number of nodes the heap can hold
+    def capacity(self): return self.__size
+
+    # Returns the typecode of the keys
+    def typecode(self): return self.__typecode
+
+    # Inserts a node with key k and id ident at the end of the heap and
+    # trickles it up, under the lock. Returns False if the heap is full and
+    # True otherwise.
+    # Raises TypeError if k isn't an int (on a 'q' heap) or a real number
+    # (on a 'd' heap), or ident isn't an int, and OverflowError if either
+    # doesn't fit in 64 bits. Both are checked before the heap is changed,
+    # so a bad node never leaves the sequence number odd.
+    def insert(self, k, ident):
+        k, ident = self.__checkNode(k, ident)
+        with self.__lock:
+            meta = self.__meta
+            n = meta[1]
+            if n == self.__size: return False
+            meta[0] += 1                 # odd: a change is in progress
+            try:
+                self.__keys[n], self.__ids[n] = k, ident
+                meta[1] = n + 1
+                self.__trickleUp(n)
+            finally:
+                meta[0] += 1             # even: the change is done
+            return True
+
+    # Returns key k and id ident as they are stored, raising TypeError or
+    # OverflowError if they can't be
+    def __checkNode(self, k, ident):
+        if self.__typecode == 'q':
+            k = operator.index(k)        # a float key isn't truncated
+        elif isinstance(k, numbers.Real):
+            k = float(k)
+        else:
+            raise TypeError("keys must be real numbers, not %s" %
+                            type(k).__name__)
+        ident = operator.index(ident)
+        for v in (k, ident):
+            if type(v) is int and not -1 << 63 <= v < 1 << 63:
+                raise OverflowError("%d doesn't fit in 64 bits" % v)
+        return k, ident
+
+    # Returns a tuple of the minimum node's key and id, or None if the heap
+    # is empty, without taking the lock
+    def findMinimum(self): return self.__read(False)
+
+    # Returns a tuple of the maximum node's key and id, or None if the heap
+    # is empty, without taking the lock
+    def findMaximum(self): return self.__read(True)
+
+    # Reads the minimum (or maximum) node as a seqlock reader, until the
+    # sequence number shows no change was made while reading it
+    def __read(self, maximum):
+        meta, keys, ids = self.__meta, self.__keys, self.__ids
+        while True:
+            seq = meta[0]
+            if seq & 1: continue         # a change is in progress
+            n = meta[1]
+            if n == 0: found = None
+            else:
+                i = self.__maxIndex(n) if maximum else 0
+                found = keys[i], ids[i]
+            if meta[0] == seq: return found
+
+    # Returns the index of the maximum node of a heap of n nodes, n > 0
+    def __maxIndex(self, n):
+        if n < 3: return n - 1
+        return 1 if self.__keys[1] > self.__keys[2] else 2
+
+    # Removes the minimum node and returns a tuple of its key and id, or None
+    # if the heap is empty
+    def removeMin(self): return self.__remove(False)
+
+    # Removes the maximum node and returns a tuple of its key and id, or None
+    # if the heap is empty
+    def removeMax(self): return self.__remove(True)
+
+    # Removes the minimum (or maximum) node under the lock, by moving the
+    # last node into its place and trickling that down
+    def __remove(self, maximum):
+        with self.__lock:
+            meta, keys, ids = self.__meta, self.__keys, self.__ids
+            n = meta[1]
+            if n == 0: return None
+            i = self.__maxIndex(n) if maximum else 0
+            removed = keys[i], ids[i]
+            meta[0] += 1
+            try:
+                n -= 1
+                keys[i], ids[i] = keys[n], ids[n]
+                meta[1] = n
+                if i < n: self.__trickleDown(i, not maximum)
+            finally:
+                meta[0] += 1
+            return removed
+
+    # Moves the node at cur up to where it belongs, as MinMaxHeap's
+    # trickleUp() does: past its parent if they are out of order, then
+    # through its grandparents on min levels (if it is smaller) or on max
+    # levels (if it is larger), moving a hole up rather than swapping
+    def __trickleUp(self, cur):
+        if cur == 0: return
+        keys, ids = self.__keys, self.__ids
+        k, ident = keys[cur], ids[cur]
+
+        parent = (cur - 1) >> 1
+        if (cur + 1).bit_length() & 1:   # cur is on a min level
+            onMax = k > keys[parent]
+            moveParent = onMax
+        else:
+            onMax = not k < keys[parent]
+            moveParent = not onMax
+        if moveParent:
+            keys[cur], ids[cur] = keys[parent], ids[parent]
+            cur = parent
+
+        while cur > 2:
+            grandparent = (cur - 3) >> 2
+            g = keys[grandparent]
+            if not (k > g if onMax else k < g): break
+            keys[cur], ids[cur] = g, ids[grandparent]
+            cur = grandparent
+        keys[cur], ids[cur] = k, ident
+
+    # Moves the node at cur down to where it belongs, on a min level if
+    # onMin is True and a max level otherwise, as MinMaxHeap's
+    # trickleDownMin() and trickleDownMax() do: the smallest (or largest) of
+    # its children and grandchildren moves up if it beats the node, and if
+    # that was a grandchild, the node is swapped with the grandchild's
+    # parent if the two are out of order, then carries on down
+    def __trickleDown(self, cur, onMin):
+        keys, ids, n = self.__keys, self.__ids, self.__meta[1]
+        k, ident = keys[cur], ids[cur]
+        while True:
+            child = 2*cur + 1
+            if child >= n: break
+
+            m, mk = child, keys[child]
+            for j in range(child + 1, min(child + 2, n)):
+                if (keys[j] < mk) if onMin else (keys[j] > mk):
+                    m, mk = j, keys[j]
+            grandchild = 2*child + 1
+            for j in range(grandchild, min(grandchild + 4, n)):
+                if (keys[j] < mk) if onMin else (keys[j] > mk):
+                    m, mk = j, keys[j]
+
+            if not ((mk < k) if onMin else (mk > k)): break
+            keys[cur], ids[cur] = mk, ids[m]
+            cur = m
+            if m < grandchild: break
+
+            parent = (m - 1) >> 1
+            if (k > keys[parent]) if onMin else (k < keys[parent]):
+                keys[parent], k = k, keys[parent]
+                ids[parent], ident = ident, ids[parent]
+        keys[cur], ids[cur] = k, ident
+
+    # Returns True if every node on a min level is no larger than its
+    # descendants and every node on a max level no smaller, checking each
+    # node against its parent and grandparent under the lock
+    def isMinMaxHeap(self):
+        with self.__lock:
+            keys = self.__keys
+            for i in range(1, self.__meta[1]):
+                k, parent = keys[i], (i - 1) >> 1
+                if (i + 1).bit_length() & 1:
+                    if k > keys[parent] or (i > 2 and k < keys[(i - 3) >> 2]):
+                        return False
+                elif k < keys[parent] or (i > 2 and k > keys[(i - 3) >> 2]):
+                    return False
+            return True
@@ -0,0 +1,97 @@
+# Benchmark of DaryMinMaxHeap at several arities against the binary
+# MinMaxHeap, by workload mix and key type.
+#
+# Each run starts from a heap of n random keys and does --ops operations of
+# one mix, each a random choice of insert(), removeMin() and removeMax():
+#   "insert"    80% inserts, 10% of each removal
+#   "mixed"     50% inserts, 25% of each removal
+#   "remove"    20% inserts, 40% of each removal
+# with keys that are floats (typecode 'd'), ints (typecode 'q') or the same
+# ints in plain lists (no typecode). Every heap does the same operations and
+# must return the same keys.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_arity.py [-n 100000] [--ops 200000]
+#                                      [--arities 2,3,4,8] [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, DaryMinMaxHeap
+
+mixes = [("insert", 0.8), ("mixed", 0.5), ("remove", 0.2)]
+keyTypes = [("float", 'd'), ("int", 'q'), ("untyped", None)]
+
+
+# Returns the list of operations of a mix: a key to insert, or "min" or
+# "max" for a removal
+def makeOps(args, inserts, makeKey):
+    ops = []
+    for i in range(args.ops):
+        r = random.random()
+        if r < inserts: ops.append(makeKey())
+        else: ops.append("min" if r < (1 + inserts) / 2 else "max")
+    return ops
+
+# Does the operations on heap h, and returns the time they took and the keys
+# removed
+def run(h, ops):
+    insert, removeMin, removeMax = h.insert, h.removeMin, h.removeMax
+    removed = []
+    start = time.perf_counter()
+    for op in ops:
+        if op == "min": removed.append(removeMin())
+        elif op == "max": removed.append(removeMax())
+        else: insert(op, None)
+    return time.perf_counter() - start, removed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="keys in the heap at the start (default 10**5)")
+    parser.add_argument("--ops", type=int, default=2 * 10**5,
+                        help="operations per run (default 2*10**5)")
+    parser.add_argument("--arities", default="2,3,4,8",
+                        help="arities of DaryMinMaxHeap to run "
+                             "(default 2,3,4,8)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    arities = [int(a) for a in args.arities.split(",")]
+
+    names = ["binary"] + ["%d-ary" % a for a in arities]
+    print("n = %d, %d operations, nanoseconds per operation" %
+          (args.n, args.ops))
+    print("%-8s %-8s" % ("keys", "mix") +
+          "".join("%10s" % name for name in names))
+    for keyName, typecode in keyTypes:
+        random.seed(args.seed)
+        if typecode == 'd': makeKey = random.random
+        else: makeKey = lambda: random.randrange(1 << 40)
+        keys = [makeKey() for i in range(args.n)]
+        for mixName, inserts in mixes:
+            ops = makeOps(args, inserts, makeKey)
+            size = args.n + args.ops
+            # big enough for the whole run, so that no heap grows
+            heaps = [MinMaxHeap.fromIterable(keys, [None] * args.n, size,
+                                             typecode=typecode)]
+            heaps += [DaryMinMaxHeap.fromIterable(keys, [None] * args.n, size,
+                                                  arity=a, typecode=typecode)
+                      for a in arities]
+            times, expected = [], None
+            for h in heaps:
+                elapsed, removed = run(h, ops)
+                times.append(elapsed)
+                removed = [r if r is None else r[0] for r in removed]
+                if expected is None: expected = removed
+                assert removed == expected
+            print("%-8s %-8s" % (keyName, mixName) +
+                  "".join("%10.0f" % (1e9 * t / args.ops) for t in times))
+
+
+if __name__ == "__main__":
+    main()
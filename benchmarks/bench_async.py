@@ -0,0 +1,92 @@
+# Wake-up latency benchmark of AsyncMinMaxHeapQueue with thousands of
+# concurrent waiters, against tasks polling a plain MinMaxHeap with
+# asyncio.sleep(0) (the usual busy loop).
+#
+# --waiters tasks each await one node, half from the minimum end and half
+# from the maximum. A producer then puts one node at a time, giving the
+# event loop a turn after each, with the time of the put as the node's data.
+# Each waiter records how long after the put it got its node.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_async.py [--waiters 5000] [--seed 1]
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, AsyncMinMaxHeapQueue
+
+
+# Waiters await getMin()/getMax() on an AsyncMinMaxHeapQueue
+async def queueWaiters(keys):
+    q = AsyncMinMaxHeapQueue(len(keys))
+    latencies = []
+
+    async def wait(get):
+        k, putTime = await get()
+        latencies.append(time.perf_counter() - putTime)
+
+    tasks = [asyncio.ensure_future(wait(q.getMin if i % 2 else q.getMax))
+             for i in range(len(keys))]
+    await asyncio.sleep(0)              # let every waiter start waiting
+    for k in keys:
+        q.putNowait(k, time.perf_counter())
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return latencies
+
+# Waiters poll a plain MinMaxHeap, yielding to the event loop until it has
+# a node for them
+async def pollingWaiters(keys):
+    h = MinMaxHeap(len(keys))
+    latencies = []
+
+    async def wait(remove):
+        while len(h) == 0: await asyncio.sleep(0)
+        k, putTime = remove()
+        latencies.append(time.perf_counter() - putTime)
+
+    tasks = [asyncio.ensure_future(wait(h.removeMin if i % 2 else h.removeMax))
+             for i in range(len(keys))]
+    await asyncio.sleep(0)
+    for k in keys:
+        h.insert(k, time.perf_counter())
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+# Returns the inputed percentile of a sorted list of latencies, in
+# microseconds
+def percentile(latencies, p):
+    return 1e6 * latencies[min(int(p / 100 * len(latencies)),
+                               len(latencies) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--waiters", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.waiters)]
+
+    print("%d waiters, wake-up latency in microseconds" % args.waiters)
+    print("%-8s %10s %10s %10s %10s" % ("", "p50", "p99", "max", "total s"))
+    for name, waiters in (("polling", pollingWaiters),
+                          ("queue", queueWaiters)):
+        start = time.perf_counter()
+        latencies = sorted(asyncio.run(waiters(keys)))
+        total = time.perf_counter() - start
+        print("%-8s %10.1f %10.1f %10.1f %10.2f" %
+              (name, percentile(latencies, 50), percentile(latencies, 99),
+               1e6 * latencies[-1], total))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Benchmark of cancelling queued nodes with markDeleted() against remove().
+#
+# Each run fills a heap with n random keys, each with a handle, then cancels
+# a share of them (chosen at random) and pops the smallest --pop of the n
+# with removeMin(), as a queue would before more work came in:
+#   "remove"        remove(handle) for each cancelled node, O(log n) each
+#   "markDeleted"   markDeleted(handle), which only leaves a tombstone; the
+#                   tombstones are skipped when they reach the minimum, or
+#                   compacted away in one pass once they pass --ratio of the
+#                   heap
+# Times are for the cancellations and for the pops, and both runs must pop
+# the same keys. With --pop 1 the heap is drained, so every tombstone has to
+# be skipped at the minimum (or compacted away) in the end.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_cancel.py [-n 100000] [--pop 0.1] [--ratio 0.5]
+#                                       [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+shares = (0.1, 0.5, 0.9)
+
+
+# Fills a heap, cancels the nodes at the inputed indexes with the heap's
+# method of the inputed name, then pops up to pops nodes. Returns the time
+# taken by each of the two steps and the keys popped.
+def run(keys, cancelled, pops, ratio, method):
+    h = MinMaxHeap(len(keys), typecode='d', compactRatio=ratio)
+    handles = [h.insert(k, None, True) for k in keys]
+    cancel = getattr(h, method)
+    start = time.perf_counter()
+    for i in cancelled: cancel(handles[i])
+    middle = time.perf_counter()
+    popped = []
+    for i in range(min(pops, len(h))): popped.append(h.removeMin()[0])
+    return middle - start, time.perf_counter() - middle, popped
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="keys in the heap (default 10**5)")
+    parser.add_argument("--pop", type=float, default=0.1,
+                        help="share of the n keys popped after cancelling "
+                             "(default 0.1)")
+    parser.add_argument("--ratio", type=float, default=0.5,
+                        help="compactRatio of the heaps (default 0.5)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    pops = int(args.pop * args.n)
+    print("n = %d, %d pops, compactRatio = %g, milliseconds" %
+          (args.n, pops, args.ratio))
+    print("%-10s %-12s %10s %10s %10s" %
+          ("cancelled", "method", "cancel", "pop", "total"))
+    for share in shares:
+        cancelled = random.sample(range(args.n), int(share * args.n))
+        expected = None
+        for method in ("remove", "markDeleted"):
+            cancel, pop, popped = run(keys, cancelled, pops, args.ratio,
+                                      method)
+            if expected is None: expected = popped
+            assert popped == expected
+            print("%-10s %-12s %10.1f %10.1f %10.1f" %
+                  ("%d%%" % (100 * share), method, 1e3 * cancel, 1e3 * pop,
+                   1e3 * (cancel + pop)))
+
+
+if __name__ == "__main__":
+    main()
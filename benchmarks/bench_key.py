@@ -0,0 +1,91 @@
+# Benchmark of push()/popMin() on a heap made with a key function, against
+# decorating each item by hand, the usual way of putting rich objects in a
+# heap without comparing them.
+#
+# Each item is a small object with a priority of 0 to 99, so most keys are
+# repeated many times. Each run pushes n items into an empty heap and then
+# pops them all from the minimum end:
+#   "decorated"     insert((priority, serial, item), None), then take the
+#                   item back out of each removeMin() key
+#   "key"           MinMaxHeap(key=...): push(item) and popMin()
+#   "decorated/2"   insert(priority, item) and removeMin(), which is only
+#                   right when the order of equal keys doesn't matter
+#   "key, no fifo"  the same with fifo=False
+# The first two pop equal priorities in the order they were pushed. Each is
+# timed --repeat times and the fastest kept.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_key.py [-n 200000] [--repeat 5] [--seed 1]
+
+import argparse
+import operator
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+class Task(object):
+    __slots__ = ("priority", "name")
+
+    def __init__(self, priority, name):
+        self.priority, self.name = priority, name
+
+priority = operator.attrgetter("priority")
+
+
+# Each run takes the items and returns the list of items popped, in order
+def decorated(items):
+    h = MinMaxHeap(len(items))
+    for serial, item in enumerate(items):
+        h.insert((priority(item), serial, item), None)
+    return [h.removeMin()[0][2] for i in range(len(items))]
+
+def keyed(items):
+    h = MinMaxHeap(len(items), key=priority, fifo=True)
+    for item in items: h.push(item)
+    return [h.popMin() for i in range(len(items))]
+
+def decoratedUnstable(items):
+    h = MinMaxHeap(len(items))
+    for item in items: h.insert(priority(item), item)
+    return [h.removeMin()[1] for i in range(len(items))]
+
+def keyedUnstable(items):
+    h = MinMaxHeap(len(items), key=priority)
+    for item in items: h.push(item)
+    return [h.popMin() for i in range(len(items))]
+
+runs = [("decorated", decorated), ("key", keyed),
+        ("decorated/2", decoratedUnstable), ("key, no fifo", keyedUnstable)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2 * 10**5,
+                        help="number of items (default 2*10**5)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    items = [Task(random.randint(0, 99), i) for i in range(args.n)]
+    stable = sorted(items, key=priority)
+
+    print("n = %d, microseconds per item pushed and popped" % args.n)
+    for name, run in runs:
+        best = None
+        for i in range(args.repeat):
+            start = time.perf_counter()
+            popped = run(items)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        if run in (decorated, keyed): assert popped == stable
+        print("%-13s %10.3f" % (name, 1e6 * best / args.n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Benchmark of merge() and meldAll() against combining heaps one node at a
+# time, by reading each node of one heap with getItem() and inserting it
+# into the other.
+#
+# "merge" combines two heaps of n and n/--ratio random keys, both ways round
+# (the smaller into the larger, and the larger into the smaller), with and
+# without consume. "meldAll" combines --parts heaps of n/--parts keys each.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_merge.py [-n 200000] [--ratio 8] [--parts 16]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# Inserts every node of other into h, one at a time
+def oneAtATime(h, other):
+    for i in range(len(other)):
+        node = other.getItem(i)
+        h.insert(node.key, node.data)
+
+def merge(h, other): h.merge(other)
+def mergeConsume(h, other): h.merge(other, consume=True)
+
+# Returns the time, in milliseconds, of combine(h, other) on new heaps of
+# the inputed keys
+def timeMerge(combine, keys, otherKeys):
+    h = MinMaxHeap.fromIterable(keys, keys, grow=True)
+    other = MinMaxHeap.fromIterable(otherKeys, otherKeys)
+    start = time.perf_counter()
+    combine(h, other)
+    return 1e3 * (time.perf_counter() - start)
+
+# Returns the time, in milliseconds, of combining new heaps of each of the
+# inputed lists of keys, one node at a time or with meldAll()
+def timeMeld(parts, meld):
+    heaps = [MinMaxHeap.fromIterable(p, p) for p in parts]
+    start = time.perf_counter()
+    if meld:
+        MinMaxHeap.meldAll(heaps, consume=True)
+    else:
+        h = MinMaxHeap(1, grow=True)
+        for other in heaps: oneAtATime(h, other)
+    return 1e3 * (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2 * 10**5,
+                        help="number of keys in the larger heap (default 2*10**5)")
+    parser.add_argument("--ratio", type=int, default=8,
+                        help="how many times smaller the other heap is (default 8)")
+    parser.add_argument("--parts", type=int, default=16,
+                        help="number of heaps given to meldAll() (default 16)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    large = [random.random() for i in range(args.n)]
+    small = [random.random() for i in range(args.n // args.ratio)]
+
+    print("n = %d and %d, milliseconds" % (len(large), len(small)))
+    print("%-16s %12s %10s %10s %8s" %
+          ("", "one at a time", "merge", "consume", "speedup"))
+    for name, keys, otherKeys in (("small into large", large, small),
+                                  ("large into small", small, large)):
+        before = timeMerge(oneAtATime, keys, otherKeys)
+        copied = timeMerge(merge, keys, otherKeys)
+        consumed = timeMerge(mergeConsume, keys, otherKeys)
+        print("%-16s %12.1f %10.1f %10.1f %7.2fx" %
+              (name, before, copied, consumed, before / min(copied, consumed)))
+
+    parts = [large[i::args.parts] for i in range(args.parts)]
+    before, after = timeMeld(parts, False), timeMeld(parts, True)
+    print("%-16s %12.1f %10.1f %10s %7.2fx" %
+          ("meldAll of %d" % args.parts, before, after, "", before / after))
+
+
+if __name__ == "__main__":
+    main()
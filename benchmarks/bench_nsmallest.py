@@ -0,0 +1,64 @@
+# Benchmark of nsmallest() and nlargest(), which walk the heap in order
+# without changing it, against heapq.nsmallest() and heapq.nlargest().
+#
+# "copy + heapq" reads every node out of the heap with getItem() and hands
+# the copy to heapq, which is what it took to look at the ends of a heap
+# without removing from it. "heapq" is heapq alone, on a list of key/data
+# pairs that already exists, to show the cost of the selection by itself.
+# Both of those look at all n keys; nsmallest() and nlargest() only look at
+# a few nodes for each of the k they return.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_nsmallest.py [-n 1000000] [--seed 1]
+
+import argparse
+import heapq
+import operator
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# Returns the time, in milliseconds, of one call of f()
+def timeCall(f):
+    start = time.perf_counter()
+    f()
+    return 1e3 * (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys in the heap (default 10**6)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    pairs = list(zip(keys, keys))
+    h = MinMaxHeap.fromIterable(keys, keys)
+    key = operator.itemgetter(0)
+
+    def copy():
+        return [(node.key, node.data) for node in map(h.getItem, range(len(h)))]
+
+    print("n = %d, milliseconds" % args.n)
+    print("%-10s %8s %14s %10s %10s %8s" %
+          ("", "k", "copy + heapq", "heapq", "heap", "speedup"))
+    for name, select, ours in (("nsmallest", heapq.nsmallest, h.nsmallest),
+                               ("nlargest", heapq.nlargest, h.nlargest)):
+        for k in (10, 100, 1000, 10000):
+            assert ours(k) == select(k, pairs, key=key)
+            copied = timeCall(lambda: select(k, copy(), key=key))
+            alone = timeCall(lambda: select(k, pairs, key=key))
+            after = timeCall(lambda: ours(k))
+            print("%-10s %8d %14.2f %10.2f %10.2f %7.1fx" %
+                  (name, k, copied, alone, after, copied / after))
+
+
+if __name__ == "__main__":
+    main()
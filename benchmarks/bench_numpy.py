@@ -0,0 +1,81 @@
+# Benchmark of the NumPy paths against the plain ones, on n random float64
+# keys with int64 payloads:
+#   build:     fromArray() against fromIterable() of the keys as Python
+#              floats, and against insert() one at a time
+#   validate:  isMinMaxHeap() with and without NumPy
+#   popMinMany: popMinMany(k, arrays=True) against popMinMany(k), for a k
+#              large enough that the whole heap is reselected
+# Needs NumPy.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_numpy.py [-n 1000000] [-k 200000] [--seed 1]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import MinMaxHeap.heap as module
+from MinMaxHeap import MinMaxHeap
+
+
+# Returns the time, in seconds, of one call of f()
+def timeCall(f):
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+def insertAll(keys, data):
+    h = MinMaxHeap(len(keys), typecode='d')
+    for i in range(len(keys)): h.insert(keys[i], data[i])
+
+# Checks the heap with NumPy switched off
+def validatePlain(h):
+    module.numpy = False    # as if it weren't installed
+    try:
+        assert h.isMinMaxHeap()
+    finally:
+        module.numpy = numpy
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys (default 10**6)")
+    parser.add_argument("-k", type=int, default=2 * 10**5,
+                        help="number of keys to pop (default 2*10**5)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(args.seed)
+    keys = rng.random(args.n)
+    data = numpy.arange(args.n)
+    keyList, dataList = keys.tolist(), data.tolist()
+    h = MinMaxHeap.fromArray(keys, data)
+
+    print("n = %d, k = %d, seconds" % (args.n, args.k))
+    print("%-11s %10s %10s %8s" % ("", "plain", "NumPy", "speedup"))
+    rows = [
+        ("build", lambda: MinMaxHeap.fromIterable(keyList, dataList),
+                  lambda: MinMaxHeap.fromArray(keys, data)),
+        ("validate", lambda: validatePlain(h), h.isMinMaxHeap),
+        ("popMinMany", lambda: MinMaxHeap.fromArray(keys, data)
+                                         .popMinMany(args.k),
+                       lambda: MinMaxHeap.fromArray(keys, data)
+                                         .popMinMany(args.k, arrays=True)),
+    ]
+    for name, plain, vectorized in rows:
+        before, after = timeCall(plain), timeCall(vectorized)
+        print("%-11s %10.3f %10.3f %7.1fx" % (name, before, after,
+                                              before / after))
+    print("%-11s %10.3f" % ("insert()", timeCall(lambda: insertAll(keyList,
+                                                                   dataList))))
+    print("(popMinMany times include a fromArray() build of %.3f s)" %
+          timeCall(lambda: MinMaxHeap.fromArray(keys, data)))
+
+
+if __name__ == "__main__":
+    main()
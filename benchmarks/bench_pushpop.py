@@ -0,0 +1,82 @@
+# Benchmark of the fused pushPopMin(), pushPopMax(), replaceMin() and
+# replaceMax() against the two-call sequences they stand for: insert() then
+# removeMin()/removeMax(), and removeMin()/removeMax() then insert().
+#
+# Each run starts from a heap of n random keys and makes --ops calls with
+# new random keys, so the heap stays the same size throughout.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_pushpop.py [-n 100000] [--ops 200000] [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# the fused operation and the two-call sequence it replaces
+def pushPopMin(h, k):  h.pushPopMin(k, k)
+def pushThenPopMin(h, k):
+    h.insert(k, k)
+    h.removeMin()
+
+def pushPopMax(h, k):  h.pushPopMax(k, k)
+def pushThenPopMax(h, k):
+    h.insert(k, k)
+    h.removeMax()
+
+def replaceMin(h, k):  h.replaceMin(k, k)
+def popThenPushMin(h, k):
+    h.removeMin()
+    h.insert(k, k)
+
+def replaceMax(h, k):  h.replaceMax(k, k)
+def popThenPushMax(h, k):
+    h.removeMax()
+    h.insert(k, k)
+
+workloads = [
+    ("pushPopMin", pushThenPopMin, pushPopMin),
+    ("pushPopMax", pushThenPopMax, pushPopMax),
+    ("replaceMin", popThenPushMin, replaceMin),
+    ("replaceMax", popThenPushMax, replaceMax),
+]
+
+
+# Returns the time per call, in microseconds, of op(h, k) for every key
+# in keys, on a heap of the inputed starting keys
+def timeOp(op, start, keys):
+    h = MinMaxHeap.fromIterable(start, start, size=len(start) + 1)
+    begin = time.perf_counter()
+    for k in keys: op(h, k)
+    return 1e6 * (time.perf_counter() - begin) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="number of keys in the heap (default 10**5)")
+    parser.add_argument("--ops", type=int, default=2 * 10**5,
+                        help="number of calls to time (default 2*10**5)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    start = [random.random() for i in range(args.n)]
+    keys = [random.random() for i in range(args.ops)]
+
+    print("n = %d, microseconds per call" % args.n)
+    print("%-11s %10s %10s %8s" % ("op", "two calls", "fused", "speedup"))
+    for name, twoCalls, fused in workloads:
+        before = timeOp(twoCalls, start, keys)
+        after = timeOp(fused, start, keys)
+        print("%-11s %10.3f %10.3f %7.2fx" %
+              (name, before, after, before / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Benchmark of QuantileTracker against sorting the keys for every query, the
+# usual way of getting a running median and p90/p99 from a stream.
+#
+# Each run streams n random latencies (lognormal floats) and reads the
+# median, p90 and p99 after every --every keys:
+#   "sort"      sorted() of every key so far (or of the window) per query
+#   "insort"    a list kept in order with bisect.insort() (and, for a window,
+#               bisect to remove the oldest key), read by index
+#   "tracker"   QuantileTracker((0.5, 0.9, 0.99))
+#   "retain"    the same with retain=--retain (skipped for a window), so it
+#               holds only the keys nearest the quantiles
+# Runs are over all the keys so far and over a window of the last --window.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_quantile.py [-n 100000] [--every 100]
+#                                         [--window 10000] [--retain 2000]
+
+import argparse
+import bisect
+import collections
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import QuantileTracker
+
+quantiles = (0.5, 0.9, 0.99)
+
+
+# Returns the nearest-rank quantiles of a sorted list of keys
+def ranks(keys):
+    return [keys[math.ceil(round(q * len(keys), 9)) - 1] for q in quantiles]
+
+# Each run takes the keys, the options and a window (or None), and returns
+# the list of quantiles read at each query
+def sortPerQuery(keys, args, window):
+    seen = collections.deque(maxlen=window)
+    answers = []
+    for i, k in enumerate(keys, 1):
+        seen.append(k)
+        if i % args.every == 0: answers.append(ranks(sorted(seen)))
+    return answers
+
+def insort(keys, args, window):
+    ordered, answers = [], []
+    for i, k in enumerate(keys, 1):
+        bisect.insort(ordered, k)
+        if window is not None and i > window:
+            del ordered[bisect.bisect_left(ordered, keys[i - 1 - window])]
+        if i % args.every == 0: answers.append(ranks(ordered))
+    return answers
+
+def tracker(keys, args, window, retain=None):
+    t = QuantileTracker(quantiles, window=window, retain=retain,
+                        typecode='d')
+    answers = []
+    for i, k in enumerate(keys, 1):
+        t.insert(k)
+        if i % args.every == 0: answers.append(t.quantiles())
+    return answers
+
+def retained(keys, args, window):
+    return tracker(keys, args, window, args.retain)
+
+runs = [("sort", sortPerQuery), ("insort", insort), ("tracker", tracker),
+        ("retain", retained)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="number of keys (default 10**5)")
+    parser.add_argument("--every", type=int, default=100,
+                        help="keys between queries (default 100)")
+    parser.add_argument("--window", type=int, default=10**4,
+                        help="keys in the windowed runs (default 10**4)")
+    parser.add_argument("--retain", type=int, default=2000,
+                        help="keys retained at each end by the retain run "
+                             "(default 2000)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.lognormvariate(0, 1) for i in range(args.n)]
+
+    print("n = %d, a query every %d keys, microseconds per key" %
+          (args.n, args.every))
+    print("%-8s %12s %12s" % ("", "all keys", "window %d" % args.window))
+    expected = {}
+    for name, run in runs:
+        times = []
+        for window in (None, args.window):
+            if name == "retain" and window is not None:
+                times.append(None)
+                continue
+            start = time.perf_counter()
+            answers = run(keys, args, window)
+            times.append(1e6 * (time.perf_counter() - start) / args.n)
+            assert expected.setdefault(window, answers) == answers
+        print("%-8s %12s %12s" % ((name,) + tuple(
+            "-" if t is None else "%.2f" % t for t in times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Contention benchmark of MinMaxHeapQueue against a plain MinMaxHeap behind
+# a coarse lock taken for every call, with consumers polling when it is
+# empty (the usual hand-rolled setup).
+#
+# Each run has --producers threads putting n keys in all, and one thread
+# each taking the minimum and the maximum until every key is consumed.
+# "naive" locks per call and polls; "queue" uses put()/getMin()/getMax();
+# "batched" uses putMany()/getMinMany()/getMaxMany() with --batch nodes a call.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_queue.py [-n 200000] [--producers 8] [--batch 64]
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, MinMaxHeapQueue
+
+
+# Plain heap, one lock per call, consumers poll when it is empty
+def naive(keys, producers, batch, size):
+    h = MinMaxHeap(size)
+    lock = threading.Lock()
+    left = [len(keys)]  # keys not yet consumed
+
+    def produce(part):
+        for k in part:
+            while True:
+                with lock:
+                    if h.insert(k, k): break
+                time.sleep(0)         # full: poll until there is room
+
+    def consume(remove):
+        while True:
+            with lock:
+                if left[0] == 0: return
+                removed = remove(h)
+                if removed is not None: left[0] -= 1
+            if removed is None: time.sleep(0)  # empty: poll until a put
+
+    return run(keys, producers, produce,
+               lambda: consume(MinMaxHeap.removeMin),
+               lambda: consume(MinMaxHeap.removeMax))
+
+# MinMaxHeapQueue, one node per call
+def oneAtATime(keys, producers, batch, size):
+    q = MinMaxHeapQueue(size)
+    left = [len(keys)]
+    lock = threading.Lock()
+
+    def produce(part):
+        for k in part: q.put(k, k)
+
+    def consume(get):
+        while True:
+            with lock:
+                if left[0] == 0: return
+                left[0] -= 1
+            get()
+
+    return run(keys, producers, produce,
+               lambda: consume(q.getMin), lambda: consume(q.getMax))
+
+# MinMaxHeapQueue, batch nodes per call
+def batched(keys, producers, batch, size):
+    q = MinMaxHeapQueue(size)
+    left = [len(keys)]
+    lock = threading.Lock()
+
+    def produce(part):
+        for i in range(0, len(part), batch):
+            q.putMany(part[i:i+batch], part[i:i+batch])
+
+    def consume(getMany):
+        while True:
+            with lock:
+                if left[0] == 0: return
+                k = min(batch, left[0])
+                left[0] -= k
+            while k > 0: k -= len(getMany(k))
+
+    return run(keys, producers, produce,
+               lambda: consume(q.getMinMany), lambda: consume(q.getMaxMany))
+
+
+# Starts producer threads on equal parts of the keys and the two consumer
+# threads, and returns the time, in seconds, until they all finish
+def run(keys, producers, produce, consumeMin, consumeMax):
+    threads = [threading.Thread(target=produce, args=(keys[i::producers],))
+               for i in range(producers)]
+    threads += [threading.Thread(target=consumeMin),
+                threading.Thread(target=consumeMax)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2 * 10**5,
+                        help="number of keys to pass through (default 2*10**5)")
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--size", type=int, default=10**4,
+                        help="capacity of the heap (default 10**4)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+
+    print("n = %d, %d producers, thousands of keys per second" %
+          (args.n, args.producers))
+    for name, setup in (("naive", naive), ("queue", oneAtATime),
+                        ("batched", batched)):
+        seconds = setup(keys, args.producers, args.batch, args.size)
+        print("%-8s %10.1f" % (name, args.n / seconds / 1000))
+
+
+if __name__ == "__main__":
+    main()
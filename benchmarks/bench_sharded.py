@@ -0,0 +1,67 @@
+# Scaling benchmark of ShardedMinMaxHeap ingest across 1, 2, 4 and 8 worker
+# processes, against a single MinMaxHeap in this process.
+#
+# Each run inserts n random keys with insert(), one call per key, then stops
+# the workers; close() waits for every shard to finish its last batch, so the
+# time covers all of the inserting. The workers can only run in parallel on
+# as many cores as the machine has, which the benchmark prints first.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_sharded.py [-n 1000000] [--batch 1024] [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, ShardedMinMaxHeap
+
+
+# Inserts keys into a single growing MinMaxHeap
+def single(keys, batch):
+    h = MinMaxHeap(1024, grow=True)
+    for k in keys: h.insert(k, k)
+    assert len(h) == len(keys)
+
+# Inserts keys into a ShardedMinMaxHeap with the inputed number of workers
+def sharded(workers):
+    def ingest(keys, batch):
+        h = ShardedMinMaxHeap(workers, batch=batch)
+        for k in keys: h.insert(k, k)
+        h.flush()
+        assert h.findMinimum()[0] == min(keys)
+        h.close()
+    return ingest
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys to insert (default 10**6)")
+    parser.add_argument("--batch", type=int, default=1024,
+                        help="inserts sent to a shard at once (default 1024)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+
+    print("n = %d, %d cores, thousands of keys per second" %
+          (args.n, os.cpu_count()))
+    print("%-10s %10s %8s" % ("heap", "keys/s", "speedup"))
+    runs = [("single", single)]
+    runs += [("%d worker%s" % (w, "s" if w > 1 else ""), sharded(w))
+             for w in (1, 2, 4, 8)]
+    base = None
+    for name, ingest in runs:
+        start = time.perf_counter()
+        ingest(keys, args.batch)
+        rate = args.n / (time.perf_counter() - start)
+        base = base or rate
+        print("%-10s %10.1f %7.2fx" % (name, rate / 1000, rate / base))
+
+
+if __name__ == "__main__":
+    main()
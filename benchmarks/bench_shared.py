@@ -0,0 +1,101 @@
+# Benchmark of SharedMinMaxHeap against a MinMaxHeap shared through a
+# multiprocessing manager, the usual way to share one object between
+# processes, where every call is a message to the manager's process.
+#
+# Each run starts --workers processes on a heap of n random float keys.
+# Each worker does --ops operations: mostly findMinimum() and findMaximum(),
+# with a share --pop of them a removeMin() or removeMax() followed by an
+# insert(), so the heap keeps its size. Reads of the shared heap take no
+# lock; everything else, and every call to the manager, is serialized.
+# Reported are the operations per second of all the workers together, and
+# the mean time of one read.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_shared.py [-n 100000] [--workers 4]
+#                                       [--ops 20000] [--pop 0.01] [--seed 1]
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+from multiprocessing.managers import BaseManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, SharedMinMaxHeap
+
+
+class HeapManager(BaseManager):
+    pass
+
+HeapManager.register('MinMaxHeap', MinMaxHeap)
+
+
+# Does a worker's operations on heap h, then puts the time its reads took
+# and how many there were on results
+def work(h, ops, pop, seed, results):
+    rand = random.Random(seed)
+    reads, readTime = 0, 0.0
+    for i in range(ops):
+        if rand.random() < pop:
+            (h.removeMin if i & 1 else h.removeMax)()
+            h.insert(rand.random(), rand.randrange(1 << 30))
+        else:
+            start = time.perf_counter()
+            h.findMinimum() if i & 1 else h.findMaximum()
+            readTime += time.perf_counter() - start
+            reads += 1
+    results.put((readTime, reads))
+    if isinstance(h, SharedMinMaxHeap): h.close()
+
+# Runs the workers on heap h, and returns the operations per second of all
+# of them together and the mean time of a read in microseconds
+def run(h, args):
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=work,
+                                       args=(h, args.ops, args.pop,
+                                             args.seed + i, results))
+               for i in range(args.workers)]
+    start = time.perf_counter()
+    for p in workers: p.start()
+    times = [results.get() for p in workers]
+    for p in workers: p.join()
+    elapsed = time.perf_counter() - start
+    readTime = sum(t for t, n in times)
+    reads = sum(n for t, n in times)
+    return args.workers * args.ops / elapsed, 1e6 * readTime / max(reads, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="keys in the heap (default 10**5)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="worker processes (default 4)")
+    parser.add_argument("--ops", type=int, default=20000,
+                        help="operations per worker (default 20000)")
+    parser.add_argument("--pop", type=float, default=0.01,
+                        help="share of operations that pop and insert "
+                             "(default 0.01)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    print("n = %d, %d workers, %d operations each, %g popping" %
+          (args.n, args.workers, args.ops, args.pop))
+    print("%-10s %14s %14s" % ("", "ops per sec", "us per read"))
+
+    with SharedMinMaxHeap(args.n + args.workers, typecode='d') as h:
+        for i, k in enumerate(keys): h.insert(k, i)
+        print("%-10s %14.0f %14.2f" % (("shared",) + run(h, args)))
+
+    with HeapManager() as manager:
+        h = manager.MinMaxHeap(args.n + args.workers, typecode='d')
+        h.insertMany(keys, list(range(args.n)))
+        print("%-10s %14.0f %14.2f" % (("manager",) + run(h, args)))
+
+
+if __name__ == "__main__":
+    main()
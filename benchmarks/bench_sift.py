@@ -0,0 +1,193 @@
+# Before/after benchmark of the sift engine behind insert(), removeMin() and
+# removeMax().
+#
+# "before" is the recursive engine the heap used to have: math.log2() to find
+# each node's level, lists of children and grandchildren built on every step
+# down, and three-assignment swaps. It is kept here, on the same parallel key
+# and data arrays, so the two engines can be timed side by side. Note that
+# the old childrenAndGrandchildrenOf() appended to the list it was looping
+# over, so it really collected the whole subtree below a node; that is why
+# the old removals are so slow on a large heap. Only a sample of --ops
+# removals is timed, so the old engine finishes in reasonable time.
+# "after" is MinMaxHeap itself, with its iterative hole-moving engine.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_sift.py [-n 1000000] [--ops 20] [--seed 1]
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# The old recursive engine, on parallel arrays of keys and data
+class RecursiveHeap(object):
+    def __init__(self, size):
+        self.keys = [None] * size
+        self.data = [None] * size
+        self.nElems = 0
+
+    def swap(self, i, j):
+        temp = self.keys[i]
+        self.keys[i] = self.keys[j]
+        self.keys[j] = temp
+        temp = self.data[i]
+        self.data[i] = self.data[j]
+        self.data[j] = temp
+
+    def minLevel(self, cur): return math.floor(math.log2(cur+1)) % 2 == 0
+
+    def insert(self, k, d):
+        if self.nElems == len(self.keys): return False
+        self.keys[self.nElems] = k
+        self.data[self.nElems] = d
+        self.trickleUp(self.nElems)
+        self.nElems += 1
+        return True
+
+    def trickleUp(self, cur):
+        parent = (cur-1) // 2
+        if cur > 0:
+            if self.minLevel(cur):
+                if self.keys[cur] > self.keys[parent]:
+                    self.swap(cur, parent)
+                    self.trickleUpMax(parent)
+                else:
+                    self.trickleUpMin(cur)
+            else:
+                if self.keys[cur] < self.keys[parent]:
+                    self.swap(cur, parent)
+                    self.trickleUpMin(parent)
+                else:
+                    self.trickleUpMax(cur)
+
+    def trickleUpMin(self, cur):
+        grandparent = ((cur-1) // 2 - 1) // 2
+        if grandparent >= 0 and self.keys[cur] < self.keys[grandparent]:
+            self.swap(cur, grandparent)
+            self.trickleUpMin(grandparent)
+
+    def trickleUpMax(self, cur):
+        grandparent = ((cur-1) // 2 - 1) // 2
+        if grandparent >= 0 and self.keys[cur] > self.keys[grandparent]:
+            self.swap(cur, grandparent)
+            self.trickleUpMax(grandparent)
+
+    def removeMin(self):
+        if self.nElems == 0: return None
+        root = self.keys[0], self.data[0]
+        self.nElems -= 1
+        self.keys[0] = self.keys[self.nElems]
+        self.data[0] = self.data[self.nElems]
+        self.keys[self.nElems] = self.data[self.nElems] = None
+        self.trickleDownMin(0)
+        return root
+
+    def removeMax(self):
+        if self.nElems == 0: return None
+        maxInd = 0
+        if self.nElems == 2: maxInd = 1
+        if self.nElems > 2: maxInd = 1 if self.keys[1] > self.keys[2] else 2
+        maximum = self.keys[maxInd], self.data[maxInd]
+        self.nElems -= 1
+        self.keys[maxInd] = self.keys[self.nElems]
+        self.data[maxInd] = self.data[self.nElems]
+        self.keys[self.nElems] = self.data[self.nElems] = None
+        self.trickleDownMax(maxInd)
+        return maximum
+
+    def childrenOf(self, index):
+        children = []
+        if 2*index + 1 < self.nElems: children += [2*index + 1]
+        if 2*index + 2 < self.nElems: children += [2*index + 2]
+        return children
+
+    def childrenAndGrandchildrenOf(self, index):
+        children = self.childrenOf(index)
+        for child in children:
+            if 2*child + 1 < self.nElems: children += [2*child + 1]
+            if 2*child + 2 < self.nElems: children += [2*child + 2]
+        return children
+
+    def trickleDownMin(self, cur):
+        rightChild = 2*cur + 2
+        if 2*cur + 1 < self.nElems:
+            kids = self.childrenAndGrandchildrenOf(cur)
+            m = kids[0]
+            for i in range(len(kids)):
+                if self.keys[kids[i]] < self.keys[m]: m = kids[i]
+            if m > rightChild:
+                if self.keys[m] < self.keys[cur]:
+                    self.swap(m, cur)
+                    if self.keys[m] > self.keys[(m-1) // 2]:
+                        self.swap(m, (m-1) // 2)
+                    self.trickleDownMin(m)
+            elif self.keys[m] < self.keys[cur]:
+                self.swap(m, cur)
+
+    def trickleDownMax(self, cur):
+        rightChild = 2*cur + 2
+        if 2*cur + 1 < self.nElems:
+            kids = self.childrenAndGrandchildrenOf(cur)
+            m = kids[0]
+            for i in range(len(kids)):
+                if self.keys[kids[i]] > self.keys[m]: m = kids[i]
+            if m > rightChild:
+                if self.keys[m] > self.keys[cur]:
+                    self.swap(m, cur)
+                    if self.keys[m] < self.keys[(m-1) // 2]:
+                        self.swap(m, (m-1) // 2)
+                    self.trickleDownMax(m)
+            elif self.keys[m] > self.keys[cur]:
+                self.swap(m, cur)
+
+
+# Times n inserts of the inputed keys into a new heap made by makeHeap(n),
+# then ops removeMin() calls and ops removeMax() calls on the full heap.
+# Returns a dictionary of the time per call, in microseconds, of each.
+def timeHeap(makeHeap, keys, ops):
+    h = makeHeap(len(keys))
+    times = {}
+
+    start = time.perf_counter()
+    for k in keys: h.insert(k, k)
+    times["insert"] = (time.perf_counter() - start) / len(keys)
+
+    for op in ("removeMin", "removeMax"):
+        remove = getattr(h, op)
+        start = time.perf_counter()
+        for i in range(ops): remove()
+        times[op] = (time.perf_counter() - start) / ops
+
+    return {op: 1e6 * times[op] for op in times}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys to insert (default 10**6)")
+    parser.add_argument("--ops", type=int, default=20,
+                        help="number of each removal to time (default 20)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+
+    before = timeHeap(RecursiveHeap, keys, args.ops)
+    after = timeHeap(MinMaxHeap, keys, args.ops)
+
+    print("n = %d, microseconds per call" % args.n)
+    print("%-10s %10s %10s %8s" % ("op", "before", "after", "speedup"))
+    for op in ("insert", "removeMin", "removeMax"):
+        print("%-10s %10.2f %10.2f %7.2fx" %
+              (op, before[op], after[op], before[op] / after[op]))
+
+
+if __name__ == "__main__":
+    main()
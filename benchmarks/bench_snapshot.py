@@ -0,0 +1,69 @@
+# Benchmark of restoring a heap from a snapshot with load(), against
+# rebuilding it from its keys and data with insert() or fromIterable(), and
+# against pickle.
+#
+# The heap has n random float keys in a typed array, with a small int as
+# each node's data. The snapshot is written to a temporary file.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_snapshot.py [-n 1000000] [--seed 1]
+
+import argparse
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# Returns the time, in seconds, of one call of f(), and what it returned
+def timeCall(f):
+    start = time.perf_counter()
+    result = f()
+    return time.perf_counter() - start, result
+
+
+def insertAll(keys, data):
+    h = MinMaxHeap(len(keys), typecode='d')
+    for i in range(len(keys)): h.insert(keys[i], data[i])
+    return h
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys in the heap (default 10**6)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    data = [random.randrange(1000) for i in range(args.n)]
+    h = MinMaxHeap.fromIterable(keys, data)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "heap.bin")
+        saving, _ = timeCall(lambda: h.save(path))
+        pickling, pickled = timeCall(lambda: pickle.dumps(h))
+
+        print("n = %d, seconds" % args.n)
+        print("%-22s %8.3f  (%.1f MB)" %
+              ("save()", saving, os.path.getsize(path) / 1e6))
+        print("%-22s %8.3f  (%.1f MB)" %
+              ("pickle.dumps()", pickling, len(pickled) / 1e6))
+        for name, restore in (
+                ("insert() one by one", lambda: insertAll(keys, data)),
+                ("fromIterable()", lambda: MinMaxHeap.fromIterable(keys, data)),
+                ("pickle.loads()", lambda: pickle.loads(pickled)),
+                ("load()", lambda: MinMaxHeap.load(path))):
+            seconds, g = timeCall(restore)
+            assert g.findMinimum() == h.findMinimum()
+            print("%-22s %8.3f" % (name, seconds))
+
+
+if __name__ == "__main__":
+    main()
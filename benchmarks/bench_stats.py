@@ -0,0 +1,82 @@
+# Benchmark of the overhead of stats on insert(), removeMin() and
+# removeMax(), to confirm that a heap without stats enabled pays nothing
+# for them.
+#
+# "plain" is a heap that has never had stats enabled, and so runs exactly
+# the same methods as a heap did before stats existed. "disabled" is a heap
+# that has had stats enabled and then disabled again: it runs the plain
+# methods too, and any difference from "plain" would be overhead left
+# behind by stats. "enabled" is a heap counting stats. Each is timed
+# --repeat times on the same keys and the fastest kept.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_stats.py [-n 200000] [--repeat 5] [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# Makes a heap with stats as described by mode
+def makeHeap(mode, size):
+    h = MinMaxHeap(size)
+    if mode in ("disabled", "enabled"): h.enableStats()
+    if mode == "disabled": h.disableStats()
+    return h
+
+# Returns a dictionary of the time per call, in microseconds, of n inserts of
+# the inputed keys and then n/2 each of removeMin() and removeMax()
+def timeHeap(mode, keys):
+    h = makeHeap(mode, len(keys))
+    times = {}
+    start = time.perf_counter()
+    for k in keys: h.insert(k, k)
+    times["insert"] = (time.perf_counter() - start) / len(keys)
+    for op in ("removeMin", "removeMax"):
+        remove = getattr(h, op)
+        start = time.perf_counter()
+        for i in range(len(keys) // 2): remove()
+        times[op] = (time.perf_counter() - start) / (len(keys) // 2)
+    return {op: 1e6 * times[op] for op in times}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2 * 10**5,
+                        help="number of keys to insert (default 2*10**5)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    modes = ("plain", "disabled", "enabled")
+    best = {mode: None for mode in modes}
+    for i in range(args.repeat):
+        for mode in modes:
+            times = timeHeap(mode, keys)
+            if best[mode] is None:
+                best[mode] = times
+            else:
+                best[mode] = {op: min(best[mode][op], times[op])
+                              for op in times}
+
+    print("n = %d, microseconds per call, fastest of %d" %
+          (args.n, args.repeat))
+    print("%-10s %8s %8s %8s %10s %10s" %
+          ("op", "plain", "disabled", "enabled", "left over", "counting"))
+    for op in ("insert", "removeMin", "removeMax"):
+        t = {mode: best[mode][op] for mode in modes}
+        print("%-10s %8.3f %8.3f %8.3f %+9.1f%% %+9.1f%%" %
+              (op, t["plain"], t["disabled"], t["enabled"],
+               100 * (t["disabled"] / t["plain"] - 1),
+               100 * (t["enabled"] / t["plain"] - 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+# Benchmark suite comparing MinMaxHeap with two double-ended baselines, so
+# that changes to the sift engine can be checked for regressions:
+#   "two heapq":   a min heap and a max heap of the same nodes, kept with
+#                  heapq, with lazy deletion of nodes already removed from
+#                  the other heap
+#   "sorted list": a list of keys kept in order with bisect, with
+#                  the data in a parallel list
+#
+# Workloads, each run on n keys:
+#   insert      n inserts into an empty heap
+#   popBoth     n removals from a full heap, alternating the min and max ends
+#   topK        a stream of n keys, keeping the --topk largest by removing the
+#               minimum once there are too many (MinMaxHeap also runs this
+#               with keep='largest', as "MinMaxHeap keep")
+#   pushPop     n push-pops on a full heap, alternating the min and max ends
+#               (pushPopMin()/pushPopMax() on MinMaxHeap, insert then remove
+#               on the baselines)
+# Keys:
+#   random      random floats
+#   sorted      ascending floats
+#   dups        random ints from 1 to 100, as makeHeap() makes, so most keys
+#               are repeated many times
+#
+# Every run is seeded from --seed, the workload, the keys and n, so two runs
+# of the suite time exactly the same operations. Each is timed --repeat
+# times and the fastest kept. The sorted list does O(n) work per insert, so
+# it is only run up to --sorted-max keys.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_suite.py [--sizes 1e3,1e4,1e5] [--json out.json]
+#     python benchmarks/bench_suite.py --sizes 1e3,1e4,1e5,1e6,1e7
+#     python benchmarks/bench_suite.py --compare before.json [--threshold 0.1]
+# With --compare, each result is printed next to the same one in an earlier
+# --json file, and the suite exits with status 1 if any got slower by more
+# than --threshold.
+
+import argparse
+import bisect
+import heapq
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# A double-ended priority queue made of two heapq heaps. Each node goes into
+# both, under a serial number; a node removed from one heap is noted as gone
+# and skipped when it reaches the top of the other.
+class TwoHeaps(object):
+    def __init__(self):
+        self.low = []       # (key, serial, data)
+        self.high = []      # (-key, serial, data)
+        self.gone = set()   # serials removed from one heap but not the other
+        self.serial = 0
+        self.n = 0
+
+    def __len__(self): return self.n
+
+    def insert(self, k, d):
+        self.serial += 1
+        self.n += 1
+        heapq.heappush(self.low, (k, self.serial, d))
+        heapq.heappush(self.high, (-k, self.serial, d))
+        return True
+
+    def __pop(self, side):
+        while side[0][1] in self.gone:
+            self.gone.remove(heapq.heappop(side)[1])
+        k, serial, d = heapq.heappop(side)
+        self.gone.add(serial)
+        self.n -= 1
+        return k, d
+
+    def removeMin(self):
+        if len(self) == 0: return None
+        return self.__pop(self.low)
+
+    def removeMax(self):
+        if len(self) == 0: return None
+        k, d = self.__pop(self.high)
+        return -k, d
+
+    def pushPopMin(self, k, d):
+        self.insert(k, d)
+        return self.removeMin()
+
+    def pushPopMax(self, k, d):
+        self.insert(k, d)
+        return self.removeMax()
+
+# A double-ended priority queue made of a sorted list of keys, kept in order
+# with bisect, and a parallel list of data
+class SortedList(object):
+    def __init__(self):
+        self.keys, self.data = [], []
+
+    def __len__(self): return len(self.keys)
+
+    def insert(self, k, d):
+        i = bisect.bisect_right(self.keys, k)
+        self.keys.insert(i, k)
+        self.data.insert(i, d)
+        return True
+
+    def removeMin(self):
+        if not self.keys: return None
+        return self.keys.pop(0), self.data.pop(0)
+
+    def removeMax(self):
+        if not self.keys: return None
+        return self.keys.pop(), self.data.pop()
+
+    def pushPopMin(self, k, d):
+        self.insert(k, d)
+        return self.removeMin()
+
+    def pushPopMax(self, k, d):
+        self.insert(k, d)
+        return self.removeMax()
+
+
+# Each implementation, as a function that makes an empty one
+implementations = {
+    "MinMaxHeap":  lambda: MinMaxHeap(1024, grow=True),
+    "two heapq":   TwoHeaps,
+    "sorted list": SortedList,
+}
+
+
+# Each workload takes a function that makes an empty heap, the n keys and
+# the options, does any setup, and returns a function that runs the part to
+# be timed.
+def insert(make, keys, args):
+    def run():
+        h = make()
+        for k in keys: h.insert(k, k)
+    return run
+
+def popBoth(make, keys, args):
+    h = make()
+    for k in keys: h.insert(k, k)
+    def run():
+        for i in range(len(keys) // 2):
+            h.removeMin()
+            h.removeMax()
+    return run
+
+def topK(make, keys, args):
+    def run():
+        h = make()
+        for k in keys:
+            h.insert(k, k)
+            if len(h) > args.topk: h.removeMin()
+    return run
+
+def pushPop(make, keys, args):
+    h = make()
+    for k in keys: h.insert(k, k)
+    more = keys[::-1]
+    def run():
+        for i in range(0, len(more) - 1, 2):
+            h.pushPopMin(more[i], i)
+            h.pushPopMax(more[i + 1], i)
+    return run
+
+workloads = {"insert": insert, "popBoth": popBoth, "topK": topK,
+             "pushPop": pushPop}
+
+# topK on a heap that keeps only its largest keys itself
+def topKBounded(keys, args):
+    def run():
+        h = MinMaxHeap(args.topk, keep='largest')
+        for k in keys: h.insert(k, k)
+    return run
+
+
+# Returns n keys of the inputed kind, made with rng
+def makeKeys(kind, n, rng):
+    if kind == "random": return [rng.random() for i in range(n)]
+    if kind == "sorted": return [float(i) for i in range(n)]
+    return [rng.randint(1, 100) for i in range(n)]
+
+keyKinds = ("random", "sorted", "dups")
+
+
+# Returns the fastest of repeat timings, in seconds, of a run made fresh by
+# setup() each time
+def fastest(setup, repeat):
+    best = None
+    for i in range(repeat):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+# Runs every combination of workload, keys, size and implementation chosen
+# by the options, printing each result as it goes, and returns them as a
+# list of dictionaries
+def runSuite(args):
+    results = []
+    print("%-10s %-7s %9s %-16s %10s %10s" %
+          ("workload", "keys", "n", "implementation", "seconds", "us/op"))
+    for name in args.workloads:
+        for kind in args.keys:
+            for n in args.sizes:
+                rng = random.Random("%s %s %s %d" % (args.seed, name, kind, n))
+                keys = makeKeys(kind, n, rng)
+                runs = [(impl, lambda make=implementations[impl]:
+                         workloads[name](make, keys, args))
+                        for impl in args.impls
+                        if impl != "sorted list" or n <= args.sorted_max]
+                if name == "topK" and "MinMaxHeap" in args.impls:
+                    runs.append(("MinMaxHeap keep",
+                                 lambda: topKBounded(keys, args)))
+                for impl, setup in runs:
+                    seconds = fastest(setup, args.repeat)
+                    results.append({"workload": name, "keys": kind, "n": n,
+                                    "implementation": impl,
+                                    "seconds": seconds})
+                    print("%-10s %-7s %9d %-16s %10.4f %10.3f" %
+                          (name, kind, n, impl, seconds, 1e6 * seconds / n))
+    return results
+
+# Prints each result next to the matching one in baseline, and returns the
+# number that are slower than it by more than threshold (a fraction)
+def compare(results, baseline, threshold):
+    before = {(r["workload"], r["keys"], r["n"], r["implementation"]):
+              r["seconds"] for r in baseline["results"]}
+    regressions = 0
+    print("\ncompared with %s" % baseline.get("when", "the baseline"))
+    print("%-10s %-7s %9s %-16s %10s %10s %8s" %
+          ("workload", "keys", "n", "implementation", "before", "now",
+           "change"))
+    for r in results:
+        key = (r["workload"], r["keys"], r["n"], r["implementation"])
+        if key not in before: continue
+        change = r["seconds"] / before[key] - 1
+        slower = change > threshold
+        regressions += slower
+        print("%-10s %-7s %9d %-16s %10.4f %10.4f %+7.1f%%%s" %
+              (key + (before[key], r["seconds"], 100 * change,
+                      "  REGRESSION" if slower else "")))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1e3,1e4,1e5",
+                        help="comma-separated numbers of keys, from 1e3 to "
+                             "1e7 (default 1e3,1e4,1e5)")
+    parser.add_argument("--workloads", default=",".join(workloads),
+                        help="comma-separated workloads (default all)")
+    parser.add_argument("--keys", default=",".join(keyKinds),
+                        help="comma-separated kinds of keys (default all)")
+    parser.add_argument("--impls", default=",".join(implementations),
+                        help="comma-separated implementations (default all)")
+    parser.add_argument("--topk", type=int, default=100,
+                        help="number of largest keys topK keeps (default 100)")
+    parser.add_argument("--sorted-max", type=float, default=1e5,
+                        help="largest n to run the sorted list on "
+                             "(default 1e5)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timings of each run, keeping the fastest "
+                             "(default 3)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="file to write the results to")
+    parser.add_argument("--compare", help="results file of an earlier run "
+                                          "to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="slowdown that counts as a regression in "
+                             "--compare (default 0.1, for 10%%)")
+    args = parser.parse_args()
+    args.sizes = [int(float(s)) for s in args.sizes.split(",")]
+    args.workloads = args.workloads.split(",")
+    args.keys = args.keys.split(",")
+    args.impls = args.impls.split(",")
+    for name in args.workloads:
+        if name not in workloads: parser.error("no workload %r" % name)
+    for kind in args.keys:
+        if kind not in keyKinds: parser.error("no kind of keys %r" % kind)
+    for impl in args.impls:
+        if impl not in implementations:
+            parser.error("no implementation %r" % impl)
+
+    results = runSuite(args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"when": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "python": platform.python_version(),
+                       "platform": platform.platform(),
+                       "seed": args.seed, "repeat": args.repeat,
+                       "results": results}, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+        if compare(results, baseline, args.threshold): sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
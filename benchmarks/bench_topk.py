@@ -0,0 +1,71 @@
+# Benchmark of a heap made with keep='largest', which keeps the K largest
+# keys of a stream, against a plain heap that inserts every key and then
+# removes the minimum whenever it holds more than K.
+#
+# Once a bounded heap is full, a key that doesn't beat the minimum is rejected
+# after one comparison, while the plain heap still trickles it up and then
+# back down. "random" keys are mostly rejected once the heap has seen a few
+# times K keys; "ascending" keys are never rejected; "descending" keys are
+# always rejected.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_topk.py [-n 1000000] [-k 1000] [--seed 1]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap
+
+
+# Keeps the k largest of the inputed keys in a heap made with keep='largest'
+def bounded(keys, k):
+    h = MinMaxHeap(k, keep='largest')
+    for key in keys: h.insert(key, key)
+    return h
+
+# Keeps the k largest of the inputed keys in a plain heap, by inserting
+# every key and removing the minimum once there are more than k
+def insertThenRemove(keys, k):
+    h = MinMaxHeap(k + 1)
+    for key in keys:
+        h.insert(key, key)
+        if len(h) > k: h.removeMin()
+    return h
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**6,
+                        help="number of keys in the stream (default 10**6)")
+    parser.add_argument("-k", type=int, default=1000,
+                        help="number of largest keys to keep (default 1000)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    workloads = {
+        "random":     [random.random() for i in range(args.n)],
+        "ascending":  [float(i) for i in range(args.n)],
+        "descending": [float(-i) for i in range(args.n)],
+    }
+
+    print("n = %d, k = %d, microseconds per key" % (args.n, args.k))
+    print("%-11s %18s %10s %8s" %
+          ("keys", "insert-then-remove", "bounded", "speedup"))
+    for name, keys in workloads.items():
+        times = []
+        for keepLargest in (insertThenRemove, bounded):
+            start = time.perf_counter()
+            h = keepLargest(keys, args.k)
+            times.append(1e6 * (time.perf_counter() - start) / args.n)
+            assert h.findMinimum()[0] == sorted(keys)[-args.k]
+        print("%-11s %18.3f %10.3f %7.2fx" %
+              (name, times[0], times[1], times[0] / times[1]))
+
+
+if __name__ == "__main__":
+    main()
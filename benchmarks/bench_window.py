@@ -0,0 +1,110 @@
+# Benchmark of ExpiringMinMaxHeap for the minimum and maximum of the keys
+# seen in the last --ttl time units of a stream, against the ways it is done
+# without one.
+#
+# Each run streams n random keys, one per time unit, and reads the minimum
+# and maximum of the window after every --every keys:
+#   "scan"      a MinMaxHeap of (time, key) pairs, scanned with getItem()
+#               for the live keys at every query and rebuilt without the
+#               expired ones, the way expiry had to be done by hand
+#   "deques"    two monotonic deques (each key drops the keys it beats off
+#               the back of each), which only works because every key
+#               lives the same time, so they expire in the order inserted
+#   "expiring"  ExpiringMinMaxHeap(ttl), which doesn't need that
+#   "mixed"     the same, with each key's ttl drawn from 1 to 2 * --ttl, which
+#               the deques can't do
+# All but "mixed" must read the same minimums and maximums. The last
+# column is the number of slots each holds at the end.
+#
+# Run from the top of the repository:
+#     python benchmarks/bench_window.py [-n 100000] [--ttl 1000]
+#                                       [--every 100] [--seed 1]
+
+import argparse
+import collections
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from MinMaxHeap import MinMaxHeap, ExpiringMinMaxHeap
+
+
+# Each run takes the keys and the options and returns the list of (minimum,
+# maximum) pairs read at each query and the slots it holds at the end
+def scan(keys, args):
+    h = MinMaxHeap(16, grow=True, typecode='d')
+    answers = []
+    for t, k in enumerate(keys, 1):
+        h.insert(k, t)
+        if t % args.every == 0:
+            nodes = [h.getItem(i) for i in range(len(h))]
+            live = [(n.key, n.data) for n in nodes if n.data > t - args.ttl]
+            h = MinMaxHeap.fromIterable(live, size=max(len(live), 16),
+                                        grow=True, typecode='d')
+            answers.append((h.findMinimum()[0], h.findMaximum()[0]))
+    return answers, h.capacity()
+
+def deques(keys, args):
+    mins, maxes = collections.deque(), collections.deque()
+    answers = []
+    for t, k in enumerate(keys, 1):
+        while mins and mins[-1][0] >= k: mins.pop()
+        while maxes and maxes[-1][0] <= k: maxes.pop()
+        mins.append((k, t))
+        maxes.append((k, t))
+        if t % args.every == 0:
+            while mins[0][1] <= t - args.ttl: mins.popleft()
+            while maxes[0][1] <= t - args.ttl: maxes.popleft()
+            answers.append((mins[0][0], maxes[0][0]))
+    return answers, len(mins) + len(maxes)
+
+def expiring(keys, args, ttls=None):
+    clock = [0]
+    h = ExpiringMinMaxHeap(args.ttl, clock=lambda: clock[0], typecode='d')
+    answers = []
+    for t, k in enumerate(keys, 1):
+        clock[0] = t
+        h.insert(k, t, None if ttls is None else ttls[t - 1])
+        if t % args.every == 0:
+            answers.append((h.findMinimum()[0], h.findMaximum()[0]))
+    return answers, h.footprint()
+
+def mixed(keys, args):
+    ttls = [random.randint(1, 2 * args.ttl) for k in keys]
+    return expiring(keys, args, ttls)
+
+runs = [("scan", scan), ("deques", deques), ("expiring", expiring),
+        ("mixed", mixed)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10**5,
+                        help="number of keys (default 10**5)")
+    parser.add_argument("--ttl", type=int, default=1000,
+                        help="time units each key lives (default 1000)")
+    parser.add_argument("--every", type=int, default=100,
+                        help="keys between queries (default 100)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    keys = [random.random() for i in range(args.n)]
+    print("n = %d, ttl = %d, a query every %d keys" %
+          (args.n, args.ttl, args.every))
+    print("%-10s %14s %10s" % ("", "us per key", "slots"))
+    expected = None
+    for name, run in runs:
+        start = time.perf_counter()
+        answers, slots = run(keys, args)
+        elapsed = time.perf_counter() - start
+        if name != "mixed":
+            if expected is None: expected = answers
+            assert answers == expected
+        print("%-10s %14.2f %10d" % (name, 1e6 * elapsed / args.n, slots))
+
+
+if __name__ == "__main__":
+    main()
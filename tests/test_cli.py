@@ -0,0 +1,74 @@
+# Tests of the python -m MinMaxHeap command line
+
+import os
+import random
+import subprocess
+import sys
+import threading
+import pytest
+
+from MinMaxHeap.__main__ import main
+
+
+# Writes key<TAB>data lines for the inputed keys to a file in tmp_path and
+# returns its path
+def writeLines(tmp_path, keys):
+    path = tmp_path / "in.tsv"
+    path.write_text("".join("%s\t%d\n" % (k, i) for i, k in enumerate(keys)))
+    return str(path)
+
+# the rolling minimum and maximum over a window, read in chunks that split
+# lines, match those worked out by slicing
+def test_cliMinMax(tmp_path, capsys):
+    keys = [random.randint(1, 1000) for i in range(300)]
+    path = writeLines(tmp_path, keys)
+    main([path, "--keys", "int", "--window", "7", "--every", "3",
+          "--chunk", "5"])
+    rows = [line.split("\t") for line in capsys.readouterr().out.splitlines()]
+    assert len(rows) == 100
+    for row, end in zip(rows, range(3, 301, 3)):
+        window = keys[max(end - 7, 0):end]
+        assert (int(row[0]), int(row[2])) == (min(window), max(window))
+        assert keys[int(row[1])] == min(window)
+
+# top and bottom keep the k largest or smallest lines, and bad keys are
+# reported with their line number
+def test_cliTopAndBottom(tmp_path, capsys):
+    keys = [random.random() for i in range(500)]
+    path = writeLines(tmp_path, keys)
+    main([path, "--mode", "top", "-k", "5"])
+    out = capsys.readouterr().out.splitlines()
+    assert [float(line.split("\t")[0]) for line in out] == \
+           sorted(keys, reverse=True)[:5]
+
+    main([path, "--mode", "bottom", "-k", "3", "--every", "250"])
+    out = capsys.readouterr().out.split("\n\n")
+    assert [float(line.split("\t")[0]) for line in out[1].splitlines()] == \
+           sorted(keys)[:3]
+
+    bad = tmp_path / "bad.tsv"
+    bad.write_text("1\ta\n\nx\tb\n")
+    with pytest.raises(SystemExit) as exit:
+        main([str(bad)])
+    assert exit.value.code == 1
+    assert "line 3" in capsys.readouterr().err
+
+# each line piped in is answered as it arrives, not once a whole chunk has
+# been read or the input has ended
+def test_cliStreams():
+    cli = subprocess.Popen(
+        [sys.executable, "-m", "MinMaxHeap", "--keys", "int"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    stuck = threading.Timer(30, cli.kill)   # fails rather than hangs
+    stuck.start()
+    try:
+        for k, expected in ((5, b"5\ta\t5\ta\n"), (3, b"3\ta\t5\ta\n")):
+            cli.stdin.write(b"%d\ta\n" % k)
+            cli.stdin.flush()
+            assert cli.stdout.readline() == expected
+        cli.stdin.close()
+        assert cli.stdout.read() == b"" and cli.wait() == 0
+    finally:
+        stuck.cancel()
+        cli.kill()
@@ -0,0 +1,59 @@
+# Tests of DaryMinMaxHeap
+
+import random
+import pytest
+
+from MinMaxHeap import DaryMinMaxHeap
+
+
+# random inserts and removals from both ends match a sorted list of the keys,
+# and keep the min-max heap properties, for several arities and key types
+def test_daryMinMaxHeap():
+    for arity in (2, 3, 4, 8):
+        for typecode in (None, 'q', 'd'):
+            h = DaryMinMaxHeap(4, arity=arity, grow=True, typecode=typecode)
+            assert h.findMinimum() is None and h.findMaximum() is None
+            assert h.removeMin() is None and h.removeMax() is None
+            keys = []
+            for i in range(2000):
+                if keys and random.random() < 0.4:
+                    if random.random() < 0.5:
+                        k, d = h.removeMin()
+                        assert k == keys.pop(0)
+                    else:
+                        k, d = h.removeMax()
+                        assert k == keys.pop()
+                    assert d == str(k)
+                else:
+                    k = random.randint(1, 500)
+                    if typecode == 'd': k = float(k)
+                    assert h.insert(k, str(k))
+                    keys.append(k)
+                    keys.sort()
+                assert len(h) == len(keys)
+                if keys:
+                    assert h.findMinimum()[0] == keys[0]
+                    assert h.findMaximum()[0] == keys[-1]
+                if i % 100 == 0: assert h.isMinMaxHeap()
+            assert h.typecode() == typecode
+
+# fromIterable() heapifies, a full heap that can't grow refuses inserts, a
+# key that doesn't fit the typecode moves the keys into a list, and the arity
+# must be at least 2
+def test_daryFromIterable():
+    keys = random.sample(range(10000), 1000)
+    for arity in (2, 4, 5):
+        h = DaryMinMaxHeap.fromIterable(keys, [-k for k in keys], arity=arity,
+                                        typecode='q')
+        assert h.isMinMaxHeap() and h.arity() == arity
+        assert [h.removeMax() for i in range(3)] == \
+               [(k, -k) for k in sorted(keys)[:-4:-1]]
+        assert h.removeMin() == (min(keys), -min(keys))
+
+    h = DaryMinMaxHeap(2, typecode='q')
+    assert h.insert(1, 'a') and h.insert(2, 'b') and not h.insert(3, 'c')
+    h = DaryMinMaxHeap(2, typecode='q')
+    h.insert(2**70, 'big')
+    h.insert(5, 'small')
+    assert h.typecode() is None and h.findMaximum() == (2**70, 'big')
+    with pytest.raises(ValueError): DaryMinMaxHeap(10, arity=1)
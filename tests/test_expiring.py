@@ -0,0 +1,53 @@
+# Tests of ExpiringMinMaxHeap
+
+import random
+import pytest
+
+from MinMaxHeap import ExpiringMinMaxHeap
+
+
+# Returns a clock for a heap, and a function that moves it on by dt
+def manualClock():
+    now = [0]
+    def advance(dt): now[0] += dt
+    return (lambda: now[0]), advance
+
+# the minimum and maximum are those of the nodes inserted in the last ttl,
+# with each node's own ttl or expiry time if it has one
+def test_expiringMinMaxHeap():
+    clock, advance = manualClock()
+    h = ExpiringMinMaxHeap(ttl=10, clock=clock)
+    assert h.findMinimum() is None and h.removeMax() is None
+    h.insert(5, "five")
+    advance(4)
+    h.insert(1, "one", ttl=3)
+    h.insert(9, "nine", expiry=12)
+    assert len(h) == 3 and h.nextExpiry() == 7
+    assert h.findMinimum() == (1, "one") and h.findMaximum() == (9, "nine")
+    advance(3)
+    assert h.findMinimum() == (5, "five") and len(h) == 2
+    advance(3)
+    assert h.findMinimum() == h.findMaximum() == (9, "nine")
+    assert not h.insert(0, "late", expiry=10)
+    assert h.removeMax() == (9, "nine") and len(h) == 0
+    advance(100)
+    assert h.nextExpiry() is None
+
+    with pytest.raises(ValueError): ExpiringMinMaxHeap(clock=clock).insert(1, 1)
+    with pytest.raises(ValueError): ExpiringMinMaxHeap(ttl=0)
+
+# a long stream keeps only about its window in memory, and matches the
+# minimum and maximum of the keys inserted in the last ttl
+def test_expiringWindow():
+    clock, advance = manualClock()
+    h = ExpiringMinMaxHeap(ttl=100, clock=clock, typecode='q')
+    window = []
+    for t in range(10000):
+        advance(1)
+        k = random.randint(1, 10**6)
+        h.insert(k, t)
+        window = window[-99:] + [k]
+        if t % 50 == 0:
+            assert h.findMinimum()[0] == min(window)
+            assert h.findMaximum()[0] == max(window)
+    assert len(h) == 100 and h.footprint() <= 1024
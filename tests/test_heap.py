@@ -0,0 +1,921 @@
+# Tests of MinMaxHeap. Run from the top of the repository with
+#     python -m pytest tests
+
+import array
+import operator
+import pickle
+import random
+import pytest
+
+from MinMaxHeap import MinMaxHeap
+
+try:                # the NumPy paths are only tested if it is installed
+    import numpy
+except ImportError:
+    numpy = None
+
+# Builds a min-max heap of inputed size and performs inserts into the heap.
+# Checks to make sure that all inserted keys are actually in the heap.
+# Returns a tuple of the heap and a sorted array of the inserted keys.
+# >>in pytests, or client code, will need to isolate the 0th element of the
+#    tuple to perform methods on the heap-- ex:
+#         h = MinMaxHeap(size)
+#         h[0].insert()
+def makeHeap(size):
+    h = MinMaxHeap(size)  # make a new heap with maximum # of elements
+    
+    arr = []           # make an array to add the keys inserted into the heap
+    heapArray = []     # make another array to add heap's keys into afterwards
+    sameKeys = True    # make variable to check if keys in heap are same as arr
+    
+    for i in range(size-1):  # insert items into heap
+        key = random.randint(1, 100)
+        data = chr(ord('A') + 1 + i)
+        h.insert(key, data)             # add key, data to heap
+        arr.append(key)
+        
+    for i in range(size-1):             # add keys in the heap to second array
+        heapArray.append(h.getItem(i).key)
+    
+    for key in arr:                     # check that keys in arr are all
+        if key not in heapArray:        # also in heapArray
+            sameKeys = False
+            
+    assert sameKeys == True   # make sure inserted keys are still in heap  
+    
+    arr.sort()    # sort the array of keys
+    
+    return h, arr # return a tuple of the heap and the sorted array of keys
+
+# test empty heap
+def test_emptyHeap():
+    h = MinMaxHeap(30)
+    assert h.isMinMaxHeap() == True
+
+# test heap with one node
+def test_oneNodeHeap():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")
+    assert h.isMinMaxHeap() == True
+    
+# test inserts on a small heap
+def test_insertSmallHeap():
+    h = makeHeap(10)
+    assert h[0].isMinMaxHeap() == True
+    
+# test inserts on a big heap
+def test_insertBigHeap():
+    h = makeHeap(10000)
+    assert h[0].isMinMaxHeap() == True
+    
+# find the minimum node of an empty heap
+def test_findMinEmptyHeap():
+    h = MinMaxHeap(30)
+    assert h.isMinMaxHeap() == True
+    assert h.findMinimum() == None
+
+# find the minimum node of a heap with one node
+def test_findMinOneNode():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")   
+    
+    assert h.isMinMaxHeap() == True
+    assert h.findMinimum() == (43, "B")
+    
+# find the minimum node of a small heap
+def test_findMinSmallHeap():
+    h = makeHeap(10)
+    
+    h[0].insert(0, "G")
+    assert h[0].findMinimum() == (0, "G")
+
+# find the minimim node of a large heap
+def test_findMinBigHeap():
+    h = makeHeap(10000)
+    
+    h[0].insert(0, "G")
+    assert h[0].findMinimum() == (0, "G")
+
+# find the maximum node of an empty heap
+def test_findMaxEmptyHeap():
+    h = MinMaxHeap(30)
+    assert h.isMinMaxHeap() == True
+    assert h.findMaximum() == None
+    
+# find the maximum node of a heap with one node
+def test_findMaxOneNode():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")   
+    
+    assert h.isMinMaxHeap() == True
+    assert h.findMaximum() == (43, "B")
+
+# find the maximum node of a heap with 2 nodes
+def test_findMaxTwoNodes():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")
+    h.insert(52, "O")
+    
+    assert h.isMinMaxHeap() == True
+    assert h.findMaximum() == (52, "O")
+    
+    j = MinMaxHeap(30)
+    j.insert(92, "G")
+    j.insert(78, "K")
+    
+    assert j.isMinMaxHeap() == True
+    assert j.findMaximum() == (92, "G")
+
+# find the maximum node of a heap with 3 nodes
+def test_findMaxThreeNodes():
+    k = MinMaxHeap(30)
+    k.insert(78, "K")
+    k.insert(92, "G")
+    k.insert(43, "B")
+    
+    assert k.isMinMaxHeap() == True
+    assert k.findMaximum() == (92, "G")
+
+# find the maximum node of a small heap
+def test_findMaxSmallHeap():
+    h = makeHeap(10)
+    
+    h[0].insert(101, "G")
+    assert h[0].findMaximum() == (101, "G")
+
+# find the maximum node of a large heap
+def test_findMaxBigHeap():
+    h = makeHeap(10000)
+    
+    h[0].insert(101, "G")
+    assert h[0].findMaximum() == (101, "G")
+
+# remove the minimum node of an empty heap
+def test_removeMinEmptyHeap():
+    h = MinMaxHeap(30)
+    assert h.isMinMaxHeap() == True
+    assert h.removeMin() == None
+    assert h.isMinMaxHeap() == True
+
+# remove the minimum node of a heap with one node
+def test_removeMinOneNode():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")   
+    
+    assert h.isMinMaxHeap() == True
+    assert h.removeMin() == (43, "B")
+    assert h.isMinMaxHeap() == True
+    
+# remove the maximum node of an empty heap
+def test_removeMaxEmptyHeap():
+    h = MinMaxHeap(30)
+    assert h.isMinMaxHeap() == True
+    assert h.removeMax() == None
+    assert h.isMinMaxHeap() == True
+
+# remove the maximum of a heap with one node
+def test_removeMaxOneNode():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")   
+    
+    assert h.isMinMaxHeap() == True
+    assert h.removeMax() == (43, "B")
+    assert h.isMinMaxHeap() == True
+    
+# remove the maximum node of a heap with 2 nodes
+def test_removeMaxTwoNodes():
+    h = MinMaxHeap(30)
+    h.insert(43, "B")
+    h.insert(52, "O")
+    
+    assert h.isMinMaxHeap() == True
+    assert h.removeMax() == (52, "O")
+    assert h.isMinMaxHeap() == True
+    
+    j = MinMaxHeap(30)
+    j.insert(92, "G")
+    j.insert(78, "K")
+    
+    assert j.isMinMaxHeap() == True
+    assert j.removeMax() == (92, "G")
+    assert j.isMinMaxHeap() == True
+
+# remove the maximum node of a heap with 3 nodes
+def test_removeMaxThreeNodes():
+    k = MinMaxHeap(30)
+    k.insert(78, "K")
+    k.insert(92, "G")
+    k.insert(43, "B")
+    
+    assert k.isMinMaxHeap() == True
+    assert k.removeMax() == (92, "G")
+    assert k.isMinMaxHeap() == True
+    
+# make removals of min and max from a small heap
+def test_removeSmallHeap():
+    h = makeHeap(10)
+    
+    h[0].removeMax()
+    assert h[0].isMinMaxHeap() == True
+    h[0].removeMin()
+    assert h[0].isMinMaxHeap() == True
+    h[0].removeMax()
+    assert h[0].isMinMaxHeap() == True
+
+# make removals of min and max from a large heap
+def test_removeBigHeap():
+    h = makeHeap(10000)
+    
+    h[0].removeMax()
+    assert h[0].isMinMaxHeap() == True
+    h[0].removeMin()
+    assert h[0].isMinMaxHeap() == True
+    h[0].removeMax()
+    assert h[0].isMinMaxHeap() == True
+    
+# test inserts on a bunch of heaps
+def test_tortureInsert():
+    size = random.randint(1, 1000)
+    for i in range(100):
+        h = makeHeap(size)
+        assert h[0].isMinMaxHeap() == True
+
+# test a bunch of min and max removals on a bunch of heaps
+def test_tortureRemove():
+    size = random.randint(1, 1000)
+    
+    # loop for 100 times
+    for i in range(100):
+        # make randomly sized heap and assert its a min-max heap
+        h = makeHeap(size)
+        heap = h[0]
+        arr = h[1]
+        assert heap.isMinMaxHeap() == True
+        
+        # For half of the heap, do min removals, making sure the removed
+        # node's key matches the key in each position of the sorted keys array.
+        # Since the array is sorted, it is in ascending order of keys, so each
+        # time a node is removed, its key should be in the next position of the list.
+        for i in range(size//2):
+            removed = heap.removeMin()
+            assert removed[0] == arr[i]
+        assert heap.isMinMaxHeap() == True
+        
+        # for the other half of the heap, do max removals, also making sure
+        # the removed node's key matches the key in the next position of the 
+        # sorted keys array
+        for i in range((size//2) - 1):
+            removed = heap.removeMax()
+            assert removed[0] == arr[-i-1]
+        assert heap.isMinMaxHeap() == True
+    
+# build a heap from (key, data) pairs in linear time
+def test_fromIterablePairs():
+    keys = [random.randint(1, 100) for i in range(1000)]
+    h = MinMaxHeap.fromIterable((k, str(k)) for k in keys)
+    assert len(h) == 1000
+    assert h.isMinMaxHeap() == True
+
+    # removing every node gives the keys back in sorted order
+    keys.sort()
+    for i in range(500):
+        assert h.removeMin() == (keys[i], str(keys[i]))
+        assert h.removeMax() == (keys[-i-1], str(keys[-i-1]))
+    assert len(h) == 0
+
+# build a heap from parallel sequences of keys and data
+def test_fromIterableParallel():
+    h = MinMaxHeap.fromIterable([5, 3, 9, 1], ["E", "C", "I", "A"], size=10)
+    assert h.isMinMaxHeap() == True
+    assert h.findMinimum() == (1, "A")
+    assert h.findMaximum() == (9, "I")
+    assert h.insert(7, "G") == True
+
+    with pytest.raises(ValueError): MinMaxHeap.fromIterable([1, 2], ["A"])
+    with pytest.raises(ValueError):
+        MinMaxHeap.fromIterable([(1, "A"), (2, "B")], size=1)
+
+# insert small and large batches into a heap
+def test_insertMany():
+    h = makeHeap(100)
+    heap, arr = h[0], h[1]
+
+    # a small batch is inserted one node at a time
+    assert heap.insertMany([(0, "Z")]) == 1
+    arr.insert(0, 0)
+    assert heap.isMinMaxHeap() == True
+
+    # a large batch is heapified, and only what fits is inserted
+    batch = [random.randint(1, 100) for i in range(300)]
+    assert heap.insertMany(batch, batch) == 100 - len(arr)
+    arr = sorted(arr + batch[:100 - len(arr)])
+    assert len(heap) == 100
+    assert heap.isMinMaxHeap() == True
+    for i in range(50):
+        assert heap.removeMin()[0] == arr[i]
+        assert heap.removeMax()[0] == arr[-i-1]
+    
+
+# a heap that can grow never fails to insert
+def test_growableHeap():
+    h = MinMaxHeap(1, grow=True)
+    keys = [random.randint(1, 100) for i in range(1000)]
+    for k in keys: assert h.insert(k, "G") == True
+    assert len(h) == 1000
+    assert h.capacity() == 1024   # capacity doubles each time it fills
+    assert h.isMinMaxHeap() == True
+
+    assert h.insertMany([(0, "A")] * 2000) == 2000
+    assert len(h) == 3000
+    assert h.findMinimum() == (0, "A")
+
+    # a fixed-capacity heap still fails once it is full
+    j = MinMaxHeap(2)
+    assert j.insert(1, "A") == True
+    assert j.insert(2, "B") == True
+    assert j.insert(3, "C") == False
+    assert j.capacity() == 2
+
+# a heap that shrinks gives back capacity as it is drained
+def test_shrinkingHeap():
+    h = MinMaxHeap.fromIterable([(i, i) for i in range(1000)], size=8,
+                                grow=True, shrink=True)
+    assert h.capacity() == 1000
+    for i in range(500): assert h.removeMin() == (i, i)
+    assert h.capacity() == 1000   # half full is not drained enough to shrink
+    for i in range(260): assert h.removeMax() == (999 - i, 999 - i)
+    assert h.capacity() == 500    # less than a quarter full halves capacity
+    assert h.isMinMaxHeap() == True
+    while len(h) > 0: h.removeMin()
+    assert h.capacity() == 8      # never shrinks below the size it was made
+
+# reserve and release capacity by hand
+def test_reserveAndShrinkToFit():
+    h = MinMaxHeap(2)
+    h.reserve(100)
+    assert h.capacity() == 100
+    h.reserve(10)                 # reserving less than the capacity is a no-op
+    assert h.capacity() == 100
+    for i in range(30): h.insert(i, i)
+
+    h.shrinkToFit()
+    assert h.capacity() == 30
+    assert h.insert(30, 30) == False
+    assert h.isMinMaxHeap() == True
+    assert h.findMaximum() == (29, 29)
+    
+
+# int and float keys are packed into typed arrays
+def test_typedKeys():
+    keys = [random.randint(1, 100) for i in range(1000)]
+    h = MinMaxHeap.fromIterable(keys, [str(k) for k in keys])
+    assert h.typecode() == 'q'
+    assert h.isMinMaxHeap() == True
+    keys.sort()
+    assert h.removeMin() == (keys[0], str(keys[0]))
+    assert h.removeMax() == (keys[-1], str(keys[-1]))
+    assert type(h.findMinimum()[0]) is int
+
+    f = MinMaxHeap.fromIterable([(2.5, "B"), (1.5, "A")], grow=True)
+    assert f.typecode() == 'd'
+    f.insert(0.5, "Z")
+    assert f.findMinimum() == (0.5, "Z")
+    assert f.getItem(0).key == 0.5 and f.getItem(0).data == "Z"
+
+    # mixed keys are stored in a plain list
+    m = MinMaxHeap.fromIterable([(1, "A"), (2.5, "B")])
+    assert m.typecode() == None
+
+    with pytest.raises(ValueError): MinMaxHeap(10, typecode='b')
+
+# inserting a key that doesn't fit the typed array falls back to a list
+def test_typedKeysFallBack():
+    h = MinMaxHeap(10, typecode='q')
+    h.insert(5, "E")
+    h.insert(3, "C")
+    assert h.typecode() == 'q'
+    h.insert(4.5, "D")            # a float doesn't fit in an int array
+    assert h.typecode() == None
+    assert h.removeMin() == (3, "C")
+    assert h.removeMin() == (4.5, "D")
+
+    j = MinMaxHeap(10, typecode='d')
+    j.insert(1.5, "A")
+    j.insert(2, "B")              # an int would be turned into a float
+    assert j.typecode() == None
+    assert j.findMaximum() == (2, "B")
+
+    k = MinMaxHeap.fromIterable([(1, "A")], size=10)
+    k.insertMany([(2 ** 70, "B")] * 5)  # too big for 64 bits
+    assert k.typecode() == None
+    assert k.findMaximum() == (2 ** 70, "B")
+    assert k.findMinimum() == (1, "A")
+    
+
+# remove a few or most of the nodes from either end at once
+def test_popManyMinAndMax():
+    for k in [0, 1, 5, 100, 600, 1000, 2000]:
+        h = makeHeap(1001)
+        heap, arr = h[0], h[1]
+
+        popped = heap.popMinMany(k)
+        assert [p[0] for p in popped] == arr[:k]
+        assert len(heap) == max(len(arr) - k, 0)
+        assert heap.isMinMaxHeap() == True
+        arr = arr[k:]
+
+        popped = heap.popMaxMany(k)
+        assert [p[0] for p in popped] == arr[::-1][:k]
+        assert heap.isMinMaxHeap() == True
+        arr = arr[:max(len(arr) - k, 0)]
+
+        # whatever is left still comes out in order
+        for key in arr: assert heap.removeMin()[0] == key
+        assert heap.removeMin() == None
+
+# remove nodes from either end until a key crosses a threshold
+def test_drainWhile():
+    h = MinMaxHeap.fromIterable([(k, str(k)) for k in range(100)])
+    assert h.drainWhileMin(lambda k: k < 10) == [(k, str(k)) for k in range(10)]
+    assert h.drainWhileMax(lambda k: k >= 95) == \
+        [(k, str(k)) for k in range(99, 94, -1)]
+    assert h.drainWhileMin(lambda k: k < 0) == []
+    assert len(h) == 85
+    assert h.findMinimum() == (10, "10")
+    assert h.findMaximum() == (94, "94")
+    assert h.drainWhileMax(lambda k: True)[-1] == (10, "10")
+    assert len(h) == 0
+    
+
+# change the keys of nodes anywhere in the heap through their handles
+def test_updateKey():
+    h = MinMaxHeap(1000)
+    handles = [h.insert(k, str(k), True) for k in range(1000)]
+    assert h.isMinMaxHeap() == True
+
+    h.updateKey(handles[500], -1)     # from the middle to the minimum
+    assert h.findMinimum() == (-1, "500")
+    h.updateKey(handles[0], 5000)     # from the minimum to the maximum
+    assert h.findMaximum() == (5000, "0")
+    h.updateKey(handles[999], 250.5)  # from the maximum to the middle
+    assert h.isMinMaxHeap() == True
+
+    keys = sorted([-1, 5000, 250.5] + [k for k in range(1, 999) if k != 500])
+    for k in keys: assert h.removeMin()[0] == k
+
+# remove nodes from anywhere in the heap through their handles
+def test_removeByHandle():
+    keys = [random.randint(1, 100) for i in range(1000)]
+    h = MinMaxHeap(1000)
+    handles = [h.insert(k, i, True) for i, k in enumerate(keys)]
+
+    for i in range(0, 1000, 3):
+        assert h.remove(handles[i]) == (keys[i], i)
+        assert handles[i].index == -1
+    assert h.isMinMaxHeap() == True
+
+    # the other handles still find their nodes after all the moves
+    for i in range(1, 1000, 3):
+        assert h.getItem(handles[i].index).data == i
+    rest = sorted(keys[i] for i in range(1000) if i % 3 != 0)
+    for k in reversed(rest): assert h.removeMax()[0] == k
+    assert len(h) == 0
+
+# nodes marked deleted are skipped at both ends, don't count towards len(),
+# and are compacted away once there are too many of them
+def test_markDeleted():
+    keys = random.sample(range(10000), 1000)
+    h = MinMaxHeap(1000, compactRatio=0.25)
+    handles = [h.insert(k, -k, True) for k in keys]
+    h.enableStats()
+    for i in range(0, 1000, 5): h.markDeleted(handles[i])
+    assert len(h) == 800 and handles[0].index == -1
+    assert h.stats()['tombstones'] == 200 and h.tombstoneRatio() == 0.2
+    with pytest.raises(ValueError): h.markDeleted(handles[0])
+    with pytest.raises(ValueError): h.remove(handles[0])
+
+    live = sorted(keys[i] for i in range(1000) if i % 5)
+    assert h.findMinimum() == (live[0], -live[0])
+    assert h.removeMax() == (live[-1], -live[-1])
+    assert [k for k, d in h.nsmallest(3)] == live[:3]
+    assert h.isMinMaxHeap()
+
+    # another 60 take them past a quarter of the nodes, when all of them go
+    for i in range(1, 301, 5): h.markDeleted(handles[i])
+    assert h.stats()['tombstones'] < 60 and len(h) == 739
+    for i in range(1000):
+        if handles[i].index >= 0:
+            assert h.getItem(handles[i].index).data == -keys[i]
+    live = sorted(keys[i] for i in range(1000)
+                  if i % 5 and not (i % 5 == 1 and i < 301))[:-1]
+    assert h.popMinMany(len(h)) == [(k, -k) for k in live]
+
+    # a full heap makes room by compacting rather than growing or failing
+    full = MinMaxHeap(2)
+    a = full.insert(1, "A", True)
+    full.insert(2, "B")
+    full.markDeleted(a)
+    assert full.insert(3, "C") and full.capacity() == 2
+    assert full.removeMin() == (2, "B")
+
+    # a full heap that can grow doubles, leaving a few tombstones for later
+    grows = MinMaxHeap(8, grow=True)
+    handles = [grows.insert(k, k, True) for k in range(8)]
+    grows.markDeleted(handles[3])
+    assert grows.insert(8, 8) and grows.capacity() == 16
+    assert grows.tombstoneRatio() == 1 / 9
+    for k in range(9, 40): grows.insert(k, k)
+    assert grows.capacity() == 64 and grows.tombstoneRatio() == 1 / 40
+
+# handles to removed nodes or other heaps are rejected
+def test_staleHandles():
+    h = MinMaxHeap(10)
+    a = h.insert(1, "A", True)
+    b = h.insert(2, "B", True)
+    assert h.insert(3, "C") == True   # nodes without handles are fine too
+    assert h.removeMin() == (1, "A")
+    with pytest.raises(ValueError): h.updateKey(a, 5)
+    with pytest.raises(ValueError): h.remove(a)
+
+    j = MinMaxHeap(10)
+    j.insert(2, "B", True)
+    with pytest.raises(ValueError): j.remove(b)
+    assert h.remove(b) == (2, "B")
+    assert h.findMinimum() == (3, "C")
+
+    full = MinMaxHeap(1)
+    assert full.insert(1, "A", True) != None
+    assert full.insert(2, "B", True) == None
+    
+
+# a full heap that keeps the largest keys evicts its minimum
+def test_keepLargest():
+    h = MinMaxHeap(100, keep='largest')
+    keys = [random.randint(1, 1000) for i in range(1000)]
+    for k in keys:
+        result = h.insert(k, str(k))
+        assert result != False or k <= h.findMinimum()[0]
+    assert len(h) == 100
+    assert h.isMinMaxHeap() == True
+
+    # exactly the 100 largest keys are left
+    keys.sort()
+    assert [p[0] for p in h.popMaxMany(100)] == keys[::-1][:100]
+
+    # the evicted node is returned, and a losing node is rejected
+    j = MinMaxHeap(3, keep='largest')
+    j.insertMany([(5, "E"), (3, "C"), (7, "G")])
+    assert j.insert(4, "D") == (3, "C")
+    assert j.insert(4, "D") == False  # ties don't beat the minimum
+    assert j.insert(1, "A") == False
+    assert j.insert(9, "I") == (4, "D")
+    assert j.findMinimum() == (5, "E")
+    assert j.findMaximum() == (9, "I")
+
+# a full heap that keeps the smallest keys evicts its maximum
+def test_keepSmallest():
+    keys = [random.randint(1, 1000) for i in range(1000)]
+    h = MinMaxHeap.fromIterable(keys[:500], keys[:500], size=50,
+                                keep='smallest')
+    assert len(h) == 50
+    assert h.insertMany(keys[500:], keys[500:]) <= 500
+    assert len(h) == 50
+    assert h.capacity() == 50
+    assert h.isMinMaxHeap() == True
+    keys.sort()
+    assert [p[0] for p in h.popMinMany(50)] == keys[:50]
+
+    # a new key below the minimum still evicts the maximum correctly
+    j = MinMaxHeap(3, keep='smallest')
+    j.insertMany([(5, "E"), (3, "C"), (7, "G")])
+    assert j.insert(1, "A") == (7, "G")
+    assert j.findMinimum() == (1, "A")
+    assert j.findMaximum() == (5, "E")
+    assert j.insert(6, "F") == False
+
+    with pytest.raises(ValueError): MinMaxHeap(3, keep='middle')
+    with pytest.raises(ValueError): MinMaxHeap(3, grow=True, keep='largest')
+    
+
+# fused insert-then-remove from either end
+def test_pushPop():
+    h = makeHeap(1000)
+    heap, arr = h[0], h[1]
+
+    # a key no larger than the minimum comes straight back
+    assert heap.pushPopMin(0, "Z") == (0, "Z")
+    assert heap.pushPopMin(arr[0], "Z") == (arr[0], "Z")
+    assert heap.pushPopMax(101, "Z") == (101, "Z")
+    assert len(heap) == 999
+
+    # otherwise the extreme node is removed and the new one kept
+    for i in range(500):
+        k = random.randint(1, 100)
+        arr.append(k)
+        arr.sort()
+        if i % 2 == 0: assert heap.pushPopMin(k, "N")[0] == arr.pop(0)
+        else:          assert heap.pushPopMax(k, "N")[0] == arr.pop()
+    assert heap.isMinMaxHeap() == True
+    for k in arr: assert heap.removeMin()[0] == k
+
+    empty = MinMaxHeap(5)
+    assert empty.pushPopMin(3, "C") == (3, "C")
+    assert empty.pushPopMax(3, "C") == (3, "C")
+    assert len(empty) == 0
+
+# fused remove-then-insert from either end
+def test_replace():
+    h = MinMaxHeap(5)
+    assert h.replaceMin(5, "E") == None  # an empty heap just inserts
+    h.insertMany([(3, "C"), (8, "H"), (6, "F")])
+
+    assert h.replaceMin(7, "G") == (3, "C")  # the removed key can be smaller
+    assert h.findMinimum() == (5, "E")
+    assert h.replaceMax(1, "A") == (8, "H")  # or larger than the new one
+    assert h.findMinimum() == (1, "A")
+    assert h.findMaximum() == (7, "G")
+    assert h.isMinMaxHeap() == True
+    assert [h.removeMin()[0] for i in range(4)] == [1, 5, 6, 7]
+
+# merging copies or moves another heap's nodes, and its handles with them
+def test_merge():
+    a = MinMaxHeap(4, grow=True)
+    b = MinMaxHeap(10)
+    for k in [5, 1, 9]: a.insert(k, str(k))
+    handles = [b.insert(k, str(k), True) for k in range(10, 0, -2)]
+
+    assert a.merge(b) == 5
+    assert len(a) == 8 and len(b) == 5
+    assert a.findMinimum() == (1, "1") and a.findMaximum() == (10, "10")
+
+    # a consumed heap is left empty, and its handles now work on this heap
+    c = MinMaxHeap(8, grow=True)
+    c.insert(7, "7")
+    assert c.merge(b, consume=True) == 5
+    assert len(b) == 0 and b.findMinimum() is None
+    c.updateKey(handles[0], 0)
+    assert c.remove(handles[1]) == (8, "8")
+    assert [c.removeMin()[0] for i in range(len(c))] == [0, 2, 4, 6, 7]
+
+    # a fixed heap without room for both raises ValueError
+    with pytest.raises(ValueError): MinMaxHeap(2).merge(a)
+    with pytest.raises(ValueError): a.merge(a)
+
+    # consuming a larger heap leaves both fixed heaps their capacities
+    small, large = MinMaxHeap(10, typecode='q'), MinMaxHeap(1000, typecode='q')
+    small.insert(3, "3")
+    for k in range(5): large.insert(k, str(k))
+    assert small.merge(large, consume=True) == 5
+    assert small.capacity() == 10 and large.capacity() == 1000
+    assert [small.removeMin()[0] for i in range(6)] == [0, 1, 2, 3, 3, 4]
+    assert large.insert(7, "7") and large.findMinimum() == (7, "7")
+
+# melding builds one new heap from any number of heaps
+def test_meldAll():
+    heaps = [MinMaxHeap.fromIterable(range(i, 30, 3), range(i, 30, 3))
+             for i in range(3)]
+    h = MinMaxHeap.meldAll(heaps)
+    assert len(h) == 30 and all(len(p) == 10 for p in heaps)
+    assert h.popMinMany(30) == [(k, k) for k in range(30)]
+
+    h = MinMaxHeap.meldAll(heaps, consume=True, grow=True)
+    assert len(h) == 30 and all(len(p) == 0 for p in heaps)
+    assert h.insert(30, 30) and h.findMaximum() == (30, 30)
+    
+
+# sorted iteration from either end leaves the heap as it was
+def test_iterSorted():
+    keys = [random.randint(1, 100) for i in range(200)]
+    h = MinMaxHeap.fromIterable(keys, [str(k) for k in keys])
+    assert [k for k, d in h.iterAscending()] == sorted(keys)
+    assert [k for k, d in h.iterDescending()] == sorted(keys, reverse=True)
+    assert all(d == str(k) for k, d in h.iterAscending())
+    assert len(h) == 200
+
+    assert [k for k, d in h.nsmallest(5)] == sorted(keys)[:5]
+    assert [k for k, d in h.nlargest(5)] == sorted(keys)[-5:][::-1]
+    assert h.nsmallest(0) == [] and len(h.nlargest(500)) == 200
+
+    e = MinMaxHeap(4)
+    assert list(e.iterAscending()) == [] and e.nlargest(3) == []
+    e.insert(1, "A")
+    assert list(e.iterDescending()) == [(1, "A")]
+    
+
+# a saved heap loads back in the same order
+def test_saveAndLoad(tmp_path):
+    path = str(tmp_path / "heap.bin")
+    for typecode in ('q', 'd', None):
+        keys = [random.randint(1, 1000) for i in range(300)]
+        if typecode == 'd': keys = [float(k) for k in keys]
+        h = MinMaxHeap(500, grow=True, typecode=typecode)
+        for k in keys: h.insert(k, {"key": k})
+        h.save(path)
+
+        g = MinMaxHeap.load(path)
+        assert g.typecode() == typecode and g.capacity() == 500
+        assert [g.getItem(i).key for i in range(300)] == \
+               [h.getItem(i).key for i in range(300)]
+        assert g.insert(0, {"key": 0}) and g.capacity() == 500
+        assert g.removeMin() == (0, {"key": 0})
+        assert [d["key"] for k, d in g.popMaxMany(300)] == \
+               sorted(keys, reverse=True)
+
+    # a file cut short is not a snapshot
+    with open(path, 'rb') as f: saved = f.read()
+    with open(path, 'wb') as f: f.write(saved[:100])
+    with pytest.raises(ValueError): MinMaxHeap.load(path)
+
+    MinMaxHeap(4).save(path)
+    assert len(MinMaxHeap.load(path)) == 0
+    with open(path, 'wb') as f: f.write(b"not a heap")
+    with pytest.raises(ValueError): MinMaxHeap.load(path)
+
+# pickling sends the flat columns and options, but not handles
+def test_pickle():
+    h = MinMaxHeap(8, shrink=True, typecode='q', keep='largest')
+    handle = h.insert(5, "E", True)
+    for k in [3, 9, 1]: h.insert(k, str(k))
+    h.updateKey(handle, 7)
+
+    g = pickle.loads(pickle.dumps(h))
+    assert g.typecode() == 'q' and g.capacity() == 8 and len(g) == 4
+    assert [g.getItem(i).key for i in range(4)] == \
+           [h.getItem(i).key for i in range(4)]
+    with pytest.raises(ValueError): g.remove(handle)
+    assert g.popMinMany(4) == [(1, "1"), (3, "3"), (7, "E"), (9, "9")]
+    
+
+# NumPy arrays of keys and data build a heap with a vectorized heapify
+@pytest.mark.skipif(numpy is None, reason="needs NumPy")
+def test_fromArray():
+    keys = numpy.random.randint(0, 1000, 500)
+    h = MinMaxHeap.fromArray(keys, keys * 10)
+    assert h.typecode() == 'q' and len(h) == 500 and h.isMinMaxHeap()
+    assert h.findMinimum() == (keys.min(), keys.min() * 10)
+    assert h.findMaximum() == (keys.max(), keys.max() * 10)
+
+    f = MinMaxHeap.fromArray(numpy.random.rand(300).astype(numpy.float32))
+    assert f.typecode() == 'd' and f.isMinMaxHeap()
+    assert f.findMinimum()[1] is None
+
+    # keys of other dtypes go through fromIterable()
+    s = MinMaxHeap.fromArray(numpy.array(["b", "c", "a"]), [2, 3, 1])
+    assert s.typecode() is None and s.findMinimum() == ("a", 1)
+
+    t = MinMaxHeap.fromArray(numpy.arange(10), size=4, keep='largest')
+    assert [k for k, d in t.popMinMany(4)] == [6, 7, 8, 9]
+    with pytest.raises(ValueError): MinMaxHeap.fromArray(numpy.arange(10),
+                                                         size=4)
+
+# popping many nodes can return NumPy arrays of their keys and data
+@pytest.mark.skipif(numpy is None, reason="needs NumPy")
+def test_popManyArrays():
+    keys = numpy.random.rand(1000)
+    h = MinMaxHeap.fromArray(keys, numpy.arange(1000))
+    order = numpy.argsort(keys)
+
+    # a large k is picked by NumPy, a small one by popMinMany()
+    for k in (400, 10):
+        popped, data = h.popMinMany(k, arrays=True)
+        assert (popped == keys[order[:k]]).all()
+        assert (data == order[:k]).all() and data.dtype.kind == 'i'
+        keys[order[:k]] = numpy.inf
+        order = order[k:]
+    assert len(h) == 590 and h.isMinMaxHeap()
+
+    popped, data = h.popMaxMany(590, arrays=True)
+    assert (popped == keys[order[::-1]]).all()
+    assert len(h) == 0 and h.popMaxMany(5, arrays=True)[0].size == 0
+
+    g = MinMaxHeap(4)
+    g.insert("x", ("a", 1))
+    popped, data = g.popMinMany(1, arrays=True)
+    assert popped.tolist() == ["x"] and data[0] == ("a", 1)
+    
+
+# the validator finds the first node out of order with its parent or its
+# grandparent, on any level
+def test_findViolation():
+    def heapOf(keys, typecode=None):
+        h = MinMaxHeap.__new__(MinMaxHeap)
+        h.__setstate__({'keys': keys, 'data': [None] * len(keys),
+                        'typecode': typecode, 'capacity': len(keys),
+                        'minSize': len(keys), 'grow': False,
+                        'shrink': False, 'keep': None})
+        return h
+
+    good = [5, 20, 30, 6, 7, 8, 9, 15, 16]
+    for typecode in (None, 'q'):
+        make = lambda keys: heapOf(array.array(typecode, keys) if typecode
+                                   else keys, typecode)
+        assert make(good).findViolation() is None
+        assert make(good).isMinMaxHeap()
+        # below its grandparent, though not above its parent
+        assert make([5, 20, 30, 1, 7, 8, 9]).findViolation() == 3
+        # out of order on the fourth level only
+        assert make(good[:7] + [25, 16]).findViolation() == 7
+        assert make(good[:8] + [2]).findViolation() == 8
+        assert not make(good[:8] + [2]).isMinMaxHeap()
+    assert MinMaxHeap(3).findViolation() is None
+
+# incremental checks look only at the paths changed since the last check
+def test_incrementalChecks():
+    h = MinMaxHeap(8, grow=True)
+    assert h.isMinMaxHeap(incremental=True)
+    handles = [h.insert(random.randint(1, 100), "D", True) for i in range(200)]
+    for i in range(50):
+        h.removeMin()
+        h.removeMax()
+        if handles[i].index >= 0: h.updateKey(handles[i], i)
+        h.insertMany([(random.randint(1, 100), "M") for j in range(5)])
+        assert h.findViolation(incremental=True) is None
+    assert h.isMinMaxHeap()
+
+    # a broken root is found once an insert passes through it
+    h._MinMaxHeap__keys[0] = 1000
+    h.insert(50, "X")
+    assert h.findViolation(incremental=True) == 1
+    assert h.findViolation() == 1
+    
+
+# stats count the comparisons, moves and levels of each operation's trickles
+def test_stats():
+    h = MinMaxHeap(10)
+    assert h.stats() is None
+    events = []
+    h.enableStats(lambda *event: events.append(event))
+    h.insert(5, "E")          # the root: nothing to compare
+    h.insert(3, "C")          # below the root on a max level: moves it down
+    h.insert(9, "I")          # stays where it is
+    assert h.removeMin() == (3, "C")
+    assert [e[:1] + e[2:] for e in events] == [
+        ("insert", 0, 0, 0), ("insert", 1, 1, 1), ("insert", 1, 0, 0),
+        ("removeMin", 1, 1, 1)]
+    assert all(e[1] >= 0 for e in events)
+
+    stats = h.stats()
+    assert (stats['comparisons'], stats['swaps'], stats['depth']) == (3, 2, 2)
+    inserts = stats['operations']['insert']
+    assert inserts['count'] == 3 and inserts['maxDepth'] == 1
+    assert sum(inserts['latency'].values()) == 3
+    assert stats['operations']['removeMax']['count'] == 0
+
+    # other operations' trickles count towards the totals only
+    for k in range(10, 17): h.insert(k, "K")
+    before = h.stats()
+    h.drainWhileMax(lambda k: k > 12)
+    after = h.stats()
+    assert after['comparisons'] > before['comparisons']
+    assert after['operations'] == before['operations']
+
+    # timed operations take keyword arguments as they do without stats
+    handle = h.insert(2, "B", handle=True)
+    assert handle.index >= 0 and events[-1][0] == "insert"
+
+    h.disableStats()
+    assert h.stats() is None
+    h.insert(1, "A")
+    assert len(events) == 12 and h.findMinimum() == (1, "A")
+    
+
+
+# A key function is called once per pushed item, and fifo heaps pop equal
+# keys in the order they were pushed, without comparing the items
+def test_keyFunction(tmp_path):
+    calls = []
+    def key(item):
+        calls.append(item)
+        return item["priority"]
+    h = MinMaxHeap(4, grow=True, key=key, fifo=True)
+    items = [{"priority": p, "name": n} for p, n in
+             [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (2, "e"), (3, "f")]]
+    for item in items: h.push(item)   # dicts can't be compared
+    assert len(calls) == 6 and h.isMinMaxHeap()
+    assert h.peekMin()["name"] == "b" and h.peekMax()["name"] == "f"
+    assert [h.popMin()["name"] for i in range(3)] == ["b", "d", "a"]
+    assert [h.popMax()["name"] for i in range(3)] == ["f", "e", "c"]
+    assert h.popMin() is None and len(calls) == 6
+
+    # reversed, popMin() takes the largest key, still oldest first
+    r = MinMaxHeap(8, key=operator.itemgetter(0), reverse=True, fifo=True)
+    assert r.pushMany([(1, "a"), (3, "b"), (3, "c"), (2, "d")]) == 4
+    assert [r.popMin() for i in range(3)] == [(3, "b"), (3, "c"), (2, "d")]
+
+    # without a key function, items are their own keys
+    p = MinMaxHeap(4, typecode='q')
+    p.pushMany([5, 2, 8])
+    assert p.typecode() == 'q' and (p.popMin(), p.popMax()) == (2, 8)
+    with pytest.raises(ValueError): MinMaxHeap(4, typecode='q', fifo=True)
+
+    # pickles and snapshots carry on the sequence numbers
+    r.push((1, "e"))
+    r.push((1, "f"))
+    g = pickle.loads(pickle.dumps(r))
+    g.push((1, "g"))
+    assert [g.popMin() for i in range(4)] == \
+           [(1, "a"), (1, "e"), (1, "f"), (1, "g")]
+    r.save(tmp_path / "r.heap")
+    g = MinMaxHeap.load(tmp_path / "r.heap", key=operator.itemgetter(0))
+    g.push((1, "g"))
+    assert g.popMax() == (1, "g") and g.popMin() == (1, "a")
@@ -0,0 +1,52 @@
+# Tests of QuantileTracker
+
+import math
+import random
+import statistics
+import pytest
+
+from MinMaxHeap import QuantileTracker
+
+
+# Returns the nearest-rank quantile q of a sorted list of keys
+def nearestRank(keys, q):
+    return keys[math.ceil(round(q * len(keys), 9)) - 1]
+
+# the median and other quantiles match sorting the keys after every insert,
+# with and without a window
+def test_quantileTracker():
+    for window in (None, 25):
+        t = QuantileTracker((0.5, 0.9, 0.99), window=window)
+        assert t.median() is None and t.quantiles() == [None] * 3
+        keys = []
+        for i in range(400):
+            k = random.randint(1, 100)
+            t.insert(k)
+            keys.append(k)
+            tracked = sorted(keys[-window:] if window else keys)
+            assert len(t) == len(tracked)
+            assert t.median() == statistics.median(tracked)
+            assert t.quantiles() == [nearestRank(tracked, q)
+                                     for q in (0.5, 0.9, 0.99)]
+        assert t.isExact()
+
+    t = QuantileTracker((0.9,))
+    for k in range(1, 11): t.insert(k)
+    assert t.quantile() == 9 and t.quantile(0.9) == 9
+    with pytest.raises(ValueError): t.median()
+    with pytest.raises(ValueError): QuantileTracker((0.5, 1))
+    with pytest.raises(ValueError): QuantileTracker(window=5, retain=5)
+
+# retaining only the keys nearest the quantile keeps them exact on a steady
+# stream, and notices when a drifting one needs a dropped key back
+def test_quantileTrackerRetain():
+    t = QuantileTracker((0.5, 0.99), retain=500, typecode='d')
+    keys = [random.random() for i in range(20000)]
+    for k in keys: t.insert(k)
+    keys.sort()
+    assert t.isExact() and len(t) == 20000
+    assert t.quantiles() == [nearestRank(keys, 0.5), nearestRank(keys, 0.99)]
+
+    d = QuantileTracker(retain=10)
+    for k in range(1000): d.insert(-k)
+    assert not d.isExact()
@@ -0,0 +1,122 @@
+# Tests of MinMaxHeapQueue and AsyncMinMaxHeapQueue
+
+import asyncio
+import queue
+import random
+import threading
+import pytest
+
+from MinMaxHeap import MinMaxHeapQueue, AsyncMinMaxHeapQueue
+
+# producer threads and min and max consumer threads share a queue
+def test_queueProducersAndConsumers():
+    q = MinMaxHeapQueue(50)
+    keys = [random.randint(1, 1000) for i in range(4000)]
+    got = []
+
+    def produce(part):
+        for k in part: q.put(k, "P")
+
+    def consume(get, count):
+        for i in range(count): got.append(get()[0])
+
+    threads = [threading.Thread(target=produce, args=(keys[i::4],))
+               for i in range(4)]
+    threads += [threading.Thread(target=consume, args=(q.getMin, 2000)),
+                threading.Thread(target=consume, args=(q.getMax, 2000))]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert sorted(got) == sorted(keys)
+    assert len(q) == 0
+
+# gets wait for nodes and puts wait for room, for up to a timeout
+def test_queueBlocking():
+    q = MinMaxHeapQueue(2)
+    with pytest.raises(queue.Empty): q.getMin(block=False)
+    with pytest.raises(queue.Empty): q.getMax(timeout=0.01)
+
+    q.put(5, "E")
+    q.put(3, "C")
+    with pytest.raises(queue.Full): q.put(4, "D", timeout=0.01)
+
+    # a put waiting for room goes in once a get makes some
+    t = threading.Thread(target=q.put, args=(9, "I"))
+    t.start()
+    assert q.getMin() == (3, "C")
+    t.join()
+    assert q.getMax() == (9, "I")
+    assert q.getMin() == (5, "E")
+
+# batches of puts and gets take the lock once
+def test_queueBatches():
+    q = MinMaxHeapQueue(10)
+    assert q.putMany([(k, str(k)) for k in range(15)], block=False) == 10
+    assert q.getMinMany(3) == [(0, "0"), (1, "1"), (2, "2")]
+    assert q.getMaxMany(2) == [(9, "9"), (8, "8")]
+
+    # a blocked batch finishes once consumers make room
+    t = threading.Thread(target=q.putMany, args=(range(100, 120), range(20)))
+    t.start()
+    got = []
+    while len(got) < 25: got += q.getMinMany(5, timeout=5)
+    t.join()
+    assert sorted(k for k, d in got) == list(range(3, 8)) + list(range(100, 120))
+    assert q.getMaxMany(5, block=False) == []
+
+    g = MinMaxHeapQueue(1, grow=True)
+    assert g.putMany(range(100), range(100), block=False) == 100
+    
+
+# asyncio tasks wait for nodes from either end
+def test_asyncQueueGets():
+    async def main():
+        q = AsyncMinMaxHeapQueue(10)
+        mins = [asyncio.ensure_future(q.getMin()) for i in range(3)]
+        maxes = [asyncio.ensure_future(q.getMax()) for i in range(3)]
+        await asyncio.sleep(0)
+        assert len(q) == 0
+
+        # each node put wakes one waiter, in the order they started waiting
+        for k in [5, 3, 8, 1, 9, 2]: q.putNowait(k, str(k))
+        got = await asyncio.gather(*(mins + maxes))
+        assert sorted(got) == [(k, str(k)) for k in [1, 2, 3, 5, 8, 9]]
+        assert len(q) == 0
+
+        with pytest.raises(asyncio.QueueEmpty): q.getMinNowait()
+        with pytest.raises(asyncio.QueueEmpty): q.getMaxNowait()
+
+    asyncio.run(main())
+
+# a full queue makes put() wait, and a cancelled waiter gives up its turn
+def test_asyncQueueBackpressureAndCancel():
+    async def main():
+        q = AsyncMinMaxHeapQueue(2)
+        await q.put(5, "E")
+        await q.put(3, "C")
+        with pytest.raises(asyncio.QueueFull): q.putNowait(4, "D")
+
+        putter = asyncio.ensure_future(q.put(9, "I"))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        assert await q.getMin() == (3, "C")
+        await putter
+        assert q.getMaxNowait() == (9, "I")
+        assert q.getMinNowait() == (5, "E")
+
+        # a getter cancelled after it was woken passes the node on
+        first = asyncio.ensure_future(q.getMin())
+        second = asyncio.ensure_future(q.getMax())
+        await asyncio.sleep(0)
+        q.putNowait(7, "G")
+        first.cancel()
+        assert await second == (7, "G")
+        assert first.cancelled()
+
+        # a getter that times out leaves no trace
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.getMin(), 0.01)
+        q.putNowait(1, "A")
+        assert await q.getMax() == (1, "A")
+
+    asyncio.run(main())
@@ -0,0 +1,31 @@
+# Tests of ShardedMinMaxHeap
+
+import random
+import pytest
+
+from MinMaxHeap import ShardedMinMaxHeap
+
+# a sharded heap spread over worker processes removes from either end in order
+def test_shardedHeap():
+    keys = [random.randint(1, 1000) for i in range(500)]
+    with ShardedMinMaxHeap(3, size=4, batch=16) as h:
+        assert h.findMinimum() is None and h.removeMax() is None
+        for k in keys[:100]: h.insert(k, str(k))
+        assert h.insertMany(keys[100:], [str(k) for k in keys[100:]]) == 400
+        assert len(h) == 500
+        assert h.findMinimum()[0] == min(keys)
+        assert h.findMaximum()[0] == max(keys)
+
+        # alternate ends, with a few inserts in between
+        keys.sort()
+        for i in range(100):
+            assert h.removeMin()[0] == keys.pop(0)
+            assert h.removeMax()[0] == keys.pop()
+        h.insertMany([(0, "0"), (2000, "2000")])
+        assert h.findMinimum() == (0, "0") and h.findMaximum() == (2000, "2000")
+        got = [h.removeMin() for i in range(len(h))]
+        assert [k for k, d in got] == [0] + keys + [2000]
+        assert all(d == str(k) for k, d in got)
+        assert h.removeMin() is None and len(h) == 0
+
+    with pytest.raises(ValueError): ShardedMinMaxHeap(0)
@@ -0,0 +1,84 @@
+# Tests of SharedMinMaxHeap
+
+import multiprocessing
+import random
+import pytest
+
+from MinMaxHeap import SharedMinMaxHeap
+
+
+# Inserts keys start, start + step, ... below stop into the heap, each with
+# its own negation as its id
+def insertKeys(h, start, stop, step):
+    for k in range(start, stop, step): h.insert(k, -k)
+    h.close()
+
+# Reads the minimum and maximum over and over while other processes change
+# the heap, and counts any node whose id doesn't match its key
+def readNodes(h, reads, torn):
+    for i in range(reads):
+        for node in (h.findMinimum(), h.findMaximum()):
+            if node is not None and node[1] != -node[0]: torn.value += 1
+    h.close()
+
+# inserts and removals from both ends in one process match a sorted list
+def test_sharedMinMaxHeap():
+    with SharedMinMaxHeap(300, typecode='q') as h:
+        assert h.findMinimum() is None and h.removeMax() is None
+        keys = []
+        for i in range(1000):
+            if keys and random.random() < 0.4:
+                if random.random() < 0.5: assert h.removeMin()[0] == keys.pop(0)
+                else:                     assert h.removeMax()[0] == keys.pop()
+            elif len(keys) < h.capacity():
+                k = random.randint(-100, 100)
+                assert h.insert(k, -k)
+                keys.append(k)
+                keys.sort()
+            assert len(h) == len(keys)
+            if keys:
+                assert h.findMinimum() == (keys[0], -keys[0])
+                assert h.findMaximum() == (keys[-1], -keys[-1])
+        assert h.isMinMaxHeap()
+
+    full = SharedMinMaxHeap(1)
+    assert full.insert(1.5, 7) and not full.insert(2, 8)
+    assert full.findMaximum() == (1.5, 7) and full.typecode() == 'd'
+    full.close()
+    with pytest.raises(ValueError): SharedMinMaxHeap(10, typecode='f')
+
+# a node that can't be stored is turned away before the heap changes, so
+# readers don't wait on it for good
+def test_sharedBadNodes():
+    with SharedMinMaxHeap(4, typecode='q') as h:
+        h.insert(5, 1)
+        with pytest.raises(TypeError): h.insert(2.5, 2)    # not truncated
+        with pytest.raises(TypeError): h.insert(3, "id")
+        with pytest.raises(TypeError): h.insert(3, 1.0)
+        with pytest.raises(OverflowError): h.insert(2**70, 3)
+        with pytest.raises(OverflowError): h.insert(3, -2**64)
+        assert len(h) == 1 and h.findMinimum() == (5, 1)
+        assert h.insert(2**63 - 1, 4) and h.findMaximum() == (2**63 - 1, 4)
+
+    with SharedMinMaxHeap(4) as h:
+        with pytest.raises(TypeError): h.insert("1.5", 1)
+        with pytest.raises(OverflowError): h.insert(10**400, 1)
+        assert h.insert(3, 1) and h.findMinimum() == (3.0, 1)
+
+# processes given the heap all change the same one, and readers never see a
+# key with another node's id
+def test_sharedAcrossProcesses():
+    with SharedMinMaxHeap(4000, typecode='q') as h:
+        torn = multiprocessing.Value('i', 0)
+        writers = [multiprocessing.Process(target=insertKeys,
+                                           args=(h, i, 4000, 4))
+                   for i in range(4)]
+        readers = [multiprocessing.Process(target=readNodes,
+                                           args=(h, 2000, torn))
+                   for i in range(2)]
+        for p in writers + readers: p.start()
+        for p in writers + readers: p.join()
+        assert all(p.exitcode == 0 for p in writers + readers)
+        assert torn.value == 0
+        assert len(h) == 4000 and h.isMinMaxHeap()
+        assert [h.removeMin()[0] for i in range(4000)] == list(range(4000))